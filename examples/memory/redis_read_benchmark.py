@@ -0,0 +1,100 @@
+"""
+Benchmark RedisMemory history reads against a local Redis stand-in.
+
+Each request to the in-process fakeredis server is delayed by a simulated
+network round trip, so the results show how read latency scales with
+history length. Batched reads cost two round trips at any length; the
+per-key HGET baseline pays one round trip per message.
+
+It also compares the bytes stored per message by the legacy JSON format
+(value plus ISO timestamp) with the tagged binary payloads.
+
+Requires the dev extras: pip install "fakeredis[lua]"
+"""
+
+import asyncio
+import contextlib
+import json
+import time
+from datetime import datetime, timezone
+
+import fakeredis
+
+from grami.memory import RedisMemory
+
+SIMULATED_RTT = 0.001  # seconds per request
+HISTORY_LENGTHS = [10, 100, 1000]
+CONTENT_SIZES = [40, 400, 4000]
+
+
+@contextlib.contextmanager
+def simulated_network(redis_client, rtt: float):
+    """Delay every request sent to the stand-in by one round trip."""
+    connection_class = redis_client.connection_pool.connection_class
+    original = connection_class.send_packed_command
+
+    async def send_packed_command(self, *args, **kwargs):
+        await asyncio.sleep(rtt)
+        return await original(self, *args, **kwargs)
+
+    connection_class.send_packed_command = send_packed_command
+    try:
+        yield
+    finally:
+        connection_class.send_packed_command = original
+
+
+async def per_key_reads(memory: RedisMemory):
+    """Baseline: fetch every entry with its own HGET."""
+    redis = await memory._get_redis_client()
+    keys = await redis.zrange(memory.index_key, 0, -1)
+    return [
+        memory.serializer.loads(await redis.hget(memory.hash_key, key))
+        for key in keys
+    ]
+
+
+def legacy_payload(value) -> bytes:
+    """Entry as written before payloads were tagged."""
+    data = {'value': value, 'timestamp': datetime.now(timezone.utc).isoformat()}
+    return json.dumps(data).encode('utf-8')
+
+
+async def timed(coro_factory, repeat: int = 3) -> float:
+    """Best-of-n wall time in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await coro_factory()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+async def main():
+    redis_client = fakeredis.FakeAsyncRedis()
+
+    print(f"{'messages':>10} {'get_messages (ms)':>18} {'per-key HGET (ms)':>18}")
+    for length in HISTORY_LENGTHS:
+        memory = RedisMemory(capacity=length, provider_id=f"bench_{length}")
+        memory._redis_client = redis_client
+        for i in range(length):
+            await memory.store(f"message_{i}", {"role": "user", "content": f"message {i}"})
+
+        with simulated_network(redis_client, SIMULATED_RTT):
+            batched = await timed(memory.get_messages)
+            baseline = await timed(lambda: per_key_reads(memory))
+
+        print(f"{length:>10} {batched:>18.1f} {baseline:>18.1f}")
+
+    print()
+    print(f"{'content chars':>14} {'legacy JSON (B)':>16} {'payload (B)':>12}")
+    memory = RedisMemory()
+    for size in CONTENT_SIZES:
+        message = {"role": "assistant", "content": ("lorem ipsum dolor sit amet " * size)[:size]}
+        legacy = len(legacy_payload(message))
+        payload = len(memory.serializer.dumps(message))
+        print(f"{size:>14} {legacy:>16} {payload:>12}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,6 +1,7 @@
 from typing import List, Dict, Any, Optional, AsyncGenerator, Union, Callable
 from .core.base import BaseLLMProvider, BaseMemoryProvider, BaseCommunicationProvider, BaseTool
 from .providers.gemini_provider import GeminiProvider
+from .memory.write_behind import WriteBehindMemory
 import logging
 import asyncio
 from datetime import datetime
@@ -37,15 +38,16 @@ class Agent:
         :param communication_provider: Optional communication interface provider
         :param tools: Optional list of tools/functions the agent can use
         :param initial_context: Initial conversation context with role-based messages
-        :param config: Additional configuration parameters
+        :param config: Additional configuration parameters; set ``memory_write_mode``
+            to 'fire_and_forget', 'batched' or 'ack' to persist memory writes in the background
         """
         self.name = name
         self.role = role
         self.llm_provider = llm_provider
-        self.memory_provider = memory_provider
         self.communication_provider = communication_provider
         self.tools = tools or []
         self.config = config or {}
+        self.memory_provider = WriteBehindMemory.from_config(memory_provider, self.config)
         
         # Set up logging
         self.logger = logging.getLogger(f"Agent_{name}")
@@ -188,6 +190,20 @@ class Agent:
                     }
                 )
     
+    async def flush_memory(self) -> None:
+        """
+        Wait until background memory writes have been applied.
+        """
+        if isinstance(self.memory_provider, WriteBehindMemory):
+            await self.memory_provider.flush()
+    
+    async def close(self) -> None:
+        """
+        Flush background memory writes and stop the writer.
+        """
+        if isinstance(self.memory_provider, WriteBehindMemory):
+            await self.memory_provider.aclose()
+    
     async def broadcast(self, topic: str, message: Any) -> None:
         """
         Asynchronously broadcast a message via the communication provider.
@@ -7,5 +7,6 @@ The AsyncAgent is the recommended class for most use cases.
 
 from .base import BaseAgent
 from .async_agent import AsyncAgent
+from .semantic_cache import HashingEmbedder, SemanticCache
 
-__all__ = ['BaseAgent', 'AsyncAgent']
+__all__ = ['BaseAgent', 'AsyncAgent', 'HashingEmbedder', 'SemanticCache']
@@ -7,12 +7,15 @@ recommended way to use GRAMI in modern applications.
 
 from typing import Dict, Any, Optional, AsyncGenerator, Union, List, Callable
 import asyncio
+import hashlib
 import json
 from datetime import datetime
 import uuid
 
 from .base import BaseAgent
 from ..core.base import BaseLLMProvider
+from ..memory.base import store_message
+from ..providers.request_key import canonical_json, provider_fingerprint
 
 
 class AsyncAgent(BaseAgent):
@@ -42,7 +45,15 @@ class AsyncAgent(BaseAgent):
             system_instructions: Optional system instructions
             tools: Optional list of tools
             communication_interface: Optional communication interface
-            config: Optional configuration dictionary
+            config: Optional configuration dictionary. ``memory_owner``
+                selects who persists conversation turns: 'llm' (default)
+                hands the memory to providers that accept one, 'agent'
+                keeps persistence in the agent. ``semantic_cache`` takes a
+                ``SemanticCache`` that answers prompts similar to earlier ones
+                without calling the LLM; entries are kept per
+                ``semantic_cache_namespace`` (default: the agent name) and
+                context. Only LLMs that keep no conversation history use
+                the cache, since a cached turn never reaches the LLM
         """
         super().__init__(
             name=name,
@@ -54,9 +65,41 @@ class AsyncAgent(BaseAgent):
             config=config
         )
         
-        # Initialize provider with memory if available
-        if memory and hasattr(self.llm, 'set_memory_provider'):
-            self.llm.set_memory_provider(memory)
+        # Exactly one side persists each turn: the provider when it takes
+        # the memory, otherwise the agent
+        self._llm_owns_memory = False
+        if (
+            self.memory
+            and self.config.get('memory_owner', 'llm') == 'llm'
+            and hasattr(self.llm, 'set_memory_provider')
+        ):
+            self.llm.set_memory_provider(self.memory)
+            self._llm_owns_memory = True
+        
+        self.semantic_cache = self.config.get('semantic_cache')
+        self.semantic_cache_namespace = self.config.get('semantic_cache_namespace', name)
+    
+    @property
+    def _persists_memory(self) -> bool:
+        """Whether this agent, rather than its provider, writes turns to memory."""
+        return bool(self.memory) and not self._llm_owns_memory
+    
+    def _cache_namespace(self, context: Optional[Dict]) -> Optional[str]:
+        """Semantic cache namespace for a request, or None if it must bypass the cache.
+        
+        A cached answer never reaches the LLM, so an LLM that keeps
+        conversation history (even an empty one, as in a fresh session)
+        would miss that turn in later requests; such LLMs never use the
+        cache. Requests with different contexts never share answers.
+        """
+        if self.semantic_cache is None:
+            return None
+        if provider_fingerprint(self.llm, (context or {}).get('session_id'))['history'] is not None:
+            return None
+        if not context:
+            return self.semantic_cache_namespace
+        digest = hashlib.blake2b(canonical_json(context).encode('utf-8'), digest_size=16).hexdigest()
+        return f"{self.semantic_cache_namespace}:{digest}"
     
     async def send_message(
         self,
@@ -79,20 +122,35 @@ class AsyncAgent(BaseAgent):
         try:
             # Normalize message format
             message_payload = self._normalize_message(message)
+            turn_id = uuid.uuid4().hex
             
-            # Add message to memory if available
-            if self.memory:
-                await self.memory.add_message(role="user", content=message_payload["content"])
+            # Add message to memory if this agent owns it
+            if self._persists_memory:
+                await store_message(self.memory, "user", message_payload["content"], f"{turn_id}:user")
             
-            # Send message with context
-            response = await self.llm.send_message(
-                message_payload,
-                **(context or {})
-            )
+            # Answer from the semantic cache when a similar prompt was seen
+            response = None
+            namespace = self._cache_namespace(context)
+            if namespace is not None:
+                response = self.semantic_cache.lookup(message_payload["content"], namespace)
+            cached = response is not None
+            
+            # On a hit the LLM never sees the turn, so record the user message here
+            if cached and self.memory and not self._persists_memory:
+                await store_message(self.memory, "user", message_payload["content"], f"{turn_id}:user")
+            
+            if not cached:
+                # Send message with context
+                response = await self.llm.send_message(
+                    message_payload,
+                    **(context or {})
+                )
+                if namespace is not None:
+                    self.semantic_cache.store(message_payload["content"], response, namespace)
             
-            # Store response in memory if available
-            if self.memory:
-                await self.memory.add_message(role="assistant", content=response)
+            # Store response in memory if this agent owns it or the LLM was skipped
+            if self._persists_memory or (cached and self.memory):
+                await store_message(self.memory, "assistant", response, f"{turn_id}:assistant")
             
             return response
             
@@ -123,10 +181,11 @@ class AsyncAgent(BaseAgent):
         try:
             # Normalize message format
             message_payload = self._normalize_message(message)
+            turn_id = uuid.uuid4().hex
             
-            # Add message to memory if available
-            if self.memory:
-                await self.memory.add_message(role="user", content=message_payload["content"])
+            # Add message to memory if this agent owns it
+            if self._persists_memory:
+                await store_message(self.memory, "user", message_payload["content"], f"{turn_id}:user")
             
             # Stream response
             response_chunks = []
@@ -138,10 +197,10 @@ class AsyncAgent(BaseAgent):
                 response_chunks.append(chunk)
                 yield chunk
             
-            # Store complete response in memory if available
-            if self.memory:
+            # Store complete response in memory if this agent owns it
+            if self._persists_memory:
                 complete_response = "".join(response_chunks)
-                await self.memory.add_message(role="assistant", content=complete_response)
+                await store_message(self.memory, "assistant", complete_response, f"{turn_id}:assistant")
                 
         except Exception as e:
             self.logger.error(f"Error in stream_message: {str(e)}")
@@ -6,6 +6,7 @@ This module provides the foundation for all agent implementations in GRAMI.
 
 from typing import List, Dict, Any, Optional, Union, Callable
 from ..core.base import BaseLLMProvider, BaseMemoryProvider, BaseCommunicationProvider, BaseTool
+from ..memory.write_behind import WriteBehindMemory
 import logging
 from abc import ABC, abstractmethod
 
@@ -39,14 +40,17 @@ class BaseAgent(ABC):
             system_instructions: Optional system-level instructions
             tools: Optional list of tool functions
             communication_interface: Optional communication interface
-            config: Additional configuration parameters
+            config: Additional configuration parameters. Set
+                ``memory_write_mode`` to 'fire_and_forget', 'batched' or 'ack'
+                to persist memory writes in the background (see
+                ``WriteBehindMemory``)
         """
         self.name = name
         self.llm = llm
-        self.memory = memory
         self.system_instructions = system_instructions
         self.communication_interface = communication_interface
         self.config = config or {}
+        self.memory = WriteBehindMemory.from_config(memory, self.config)
         
         # Set up logging with proper naming
         self.logger = logging.getLogger(f"{self.__class__.__name__}_{name}")
@@ -89,6 +93,22 @@ class BaseAgent(ABC):
         """
         pass
     
+    async def flush_memory(self) -> None:
+        """
+        Wait until background memory writes have been applied.
+        """
+        if isinstance(self.memory, WriteBehindMemory):
+            await self.memory.flush()
+    
+    async def close(self) -> None:
+        """
+        Flush background memory writes and stop the writer.
+        
+        Call before shutdown when ``memory_write_mode`` is configured.
+        """
+        if isinstance(self.memory, WriteBehindMemory):
+            await self.memory.aclose()
+    
     def _normalize_message(self, message: Union[str, Dict[str, str]]) -> Dict[str, str]:
         """
         Normalize message format to standard dictionary format.
@@ -0,0 +1,265 @@
+"""
+Semantic response cache for GRAMI agents.
+
+Prompts are embedded locally with the hashing trick and compared by cosine
+similarity, so prompts that differ only trivially (case, punctuation,
+spacing) share a cached answer. Hashed features do not understand meaning:
+"with" and "without", or two different IDs, differ by a single feature, so
+thresholds much below the default let prompts with opposite meanings match.
+"""
+
+import hashlib
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+_WORD = re.compile(r"\w+")
+
+
+class HashingEmbedder:
+    """
+    Local text embedder based on feature hashing.
+
+    Words and character trigrams are hashed into a fixed number of signed
+    buckets and the resulting vector is L2-normalized. No model download
+    or network call is involved, and embeddings are stable across processes.
+    """
+
+    def __init__(self, dimensions: int = 1024, char_ngram: int = 3):
+        """Initialize the embedder.
+
+        Args:
+            dimensions: Size of the embedding vectors (default: 1024)
+            char_ngram: Length of the character n-grams used as features (default: 3)
+        """
+        if np is None:
+            raise ImportError("HashingEmbedder requires the numpy package: pip install numpy")
+        self.dimensions = dimensions
+        self.char_ngram = char_ngram
+
+    def _features(self, text: str) -> List[str]:
+        words = _WORD.findall(text.lower())
+        features = [f"w:{word}" for word in words]
+        padded = f" {' '.join(words)} "
+        n = self.char_ngram
+        features.extend(f"c:{padded[i:i + n]}" for i in range(len(padded) - n + 1))
+        return features
+
+    def __call__(self, text: str) -> "np.ndarray":
+        """Embed a text.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Unit-length float32 vector (all zeros for empty text)
+        """
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        for feature in self._features(text):
+            digest = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+            sign = 1.0 if digest & 1 else -1.0
+            vector[(digest >> 1) % self.dimensions] += sign
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector
+
+
+class _Namespace:
+    """Matrix of prompt embeddings with their responses, grown on demand up to a capacity."""
+
+    INITIAL_ROWS = 16
+
+    def __init__(self, capacity: int, dimensions: int):
+        self.capacity = capacity
+        rows = min(capacity, self.INITIAL_ROWS)
+        self.vectors = np.zeros((rows, dimensions), dtype=np.float32)
+        self.used = np.zeros(rows, dtype=bool)
+        self.last_used = np.zeros(rows, dtype=np.float64)
+        self.expires_at = np.full(rows, np.inf, dtype=np.float64)
+        self.responses: List[Optional[Any]] = [None] * rows
+
+    def _grow(self) -> None:
+        rows = len(self.responses)
+        extra = min(self.capacity, rows * 2) - rows
+        self.vectors = np.concatenate([self.vectors, np.zeros((extra, self.vectors.shape[1]), dtype=np.float32)])
+        self.used = np.concatenate([self.used, np.zeros(extra, dtype=bool)])
+        self.last_used = np.concatenate([self.last_used, np.zeros(extra, dtype=np.float64)])
+        self.expires_at = np.concatenate([self.expires_at, np.full(extra, np.inf, dtype=np.float64)])
+        self.responses.extend([None] * extra)
+
+    def expire(self, now: float) -> None:
+        expired = self.used & (self.expires_at <= now)
+        if expired.any():
+            self.used &= ~expired
+            for slot in np.flatnonzero(expired):
+                self.responses[slot] = None
+
+    def free_slot(self) -> int:
+        free = np.flatnonzero(~self.used)
+        if free.size:
+            return int(free[0])
+        if len(self.responses) < self.capacity:
+            slot = len(self.responses)
+            self._grow()
+            return slot
+        # Evict the least recently used entry
+        return int(np.argmin(self.last_used))
+
+    def __len__(self) -> int:
+        return int(self.used.sum())
+
+
+class SemanticCache:
+    """
+    Similarity-based response cache shared by agents.
+
+    Each namespace (by default one per agent) keeps up to ``capacity``
+    embeddings in a NumPy matrix that grows as entries are added; a lookup
+    is one matrix-vector product. A cached response is returned when the
+    most similar prompt reaches ``threshold`` cosine similarity. Entries
+    expire after ``ttl`` seconds, the least recently used entry is evicted
+    when a namespace is full, and the least recently used namespace is
+    dropped when there are more than ``max_namespaces``.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.97,
+        capacity: int = 1000,
+        ttl: Optional[float] = None,
+        embedder: Optional[Any] = None,
+        max_namespaces: int = 256
+    ):
+        """Initialize the cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a hit (default: 0.97)
+            capacity: Maximum number of entries per namespace (default: 1000)
+            ttl: Optional seconds after which entries expire
+            embedder: Callable returning unit-length vectors for texts
+                (default: HashingEmbedder)
+            max_namespaces: Maximum number of namespaces kept (default: 256)
+        """
+        if np is None:
+            raise ImportError("SemanticCache requires the numpy package: pip install numpy")
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if max_namespaces <= 0:
+            raise ValueError("max_namespaces must be positive")
+        self.threshold = threshold
+        self.capacity = capacity
+        self.ttl = ttl
+        self.embedder = embedder or HashingEmbedder()
+        self.max_namespaces = max_namespaces
+        self._namespaces: "OrderedDict[str, _Namespace]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lookup_time = 0.0
+
+    def _namespace(self, name: str, dimensions: int) -> _Namespace:
+        namespace = self._namespaces.get(name)
+        if namespace is None:
+            namespace = self._namespaces[name] = _Namespace(self.capacity, dimensions)
+            if len(self._namespaces) > self.max_namespaces:
+                self._namespaces.popitem(last=False)
+        else:
+            self._namespaces.move_to_end(name)
+        return namespace
+
+    def _best_match(self, namespace: _Namespace, vector: "np.ndarray") -> Tuple[int, float]:
+        scores = namespace.vectors @ vector
+        scores[~namespace.used] = -np.inf
+        slot = int(np.argmax(scores))
+        return slot, float(scores[slot])
+
+    def lookup(self, prompt: str, namespace: str = "default") -> Optional[Any]:
+        """Find a cached response for a similar prompt.
+
+        Args:
+            prompt: Prompt text
+            namespace: Cache namespace (e.g. the agent name)
+
+        Returns:
+            Cached response, or None on a miss
+        """
+        started = time.perf_counter()
+        try:
+            entries = self._namespaces.get(namespace)
+            if entries is not None:
+                self._namespaces.move_to_end(namespace)
+                now = time.monotonic()
+                entries.expire(now)
+                if len(entries):
+                    slot, score = self._best_match(entries, self.embedder(prompt))
+                    if score >= self.threshold:
+                        entries.last_used[slot] = now
+                        self.hits += 1
+                        return entries.responses[slot]
+            self.misses += 1
+            return None
+        finally:
+            self.lookup_time += time.perf_counter() - started
+
+    def store(self, prompt: str, response: Any, namespace: str = "default") -> None:
+        """Cache a response for a prompt.
+
+        A near-duplicate of an existing prompt replaces that entry instead of
+        taking another slot.
+
+        Args:
+            prompt: Prompt text
+            response: Response to cache
+            namespace: Cache namespace (e.g. the agent name)
+        """
+        vector = self.embedder(prompt)
+        entries = self._namespace(namespace, vector.shape[0])
+        now = time.monotonic()
+        entries.expire(now)
+
+        slot = None
+        if len(entries):
+            match, score = self._best_match(entries, vector)
+            if score >= self.threshold:
+                slot = match
+        if slot is None:
+            slot = entries.free_slot()
+
+        entries.vectors[slot] = vector
+        entries.used[slot] = True
+        entries.last_used[slot] = now
+        entries.expires_at[slot] = now + self.ttl if self.ttl is not None else np.inf
+        entries.responses[slot] = response
+
+    def invalidate(self, namespace: Optional[str] = None) -> None:
+        """Drop cached entries.
+
+        Args:
+            namespace: Namespace to clear (default: all namespaces)
+        """
+        if namespace is None:
+            self._namespaces.clear()
+        else:
+            self._namespaces.pop(namespace, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache metrics.
+
+        Returns:
+            Dictionary with hits, misses, hit rate, average lookup latency
+            and entry counts per namespace
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'avg_lookup_time': self.lookup_time / lookups if lookups else 0.0,
+            'entries': {name: len(entries) for name, entries in self._namespaces.items()}
+        }
@@ -1,73 +1,555 @@
 import asyncio
+import inspect
 import logging
-from typing import Any, Callable, Dict, List, Optional
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from .topics import TopicTrie
+from .transports import BaseTransport
+
+OVERFLOW_POLICIES = ('block', 'drop_oldest', 'reject')
+
+
+class EventQueueFull(Exception):
+    """Raised when an event is published to a full queue with the 'reject' policy."""
+
+
+class _TopicQueue:
+    """
+    Bounded queue of pending events for one event type, with its workers and metrics.
+    """
+    
+    def __init__(self, maxsize: int, workers: int, overflow: str):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self.worker_count = workers
+        self.overflow = overflow
+        self.workers: List[asyncio.Task] = []
+        self.pending = 0
+        self.enqueued = 0
+        self.processed = 0
+        self.dropped = 0
+        self.rejected = 0
+        self.total_lag = 0.0
+        self.max_lag = 0.0
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'depth': self.queue.qsize(),
+            'maxsize': self.queue.maxsize,
+            'workers': self.worker_count,
+            'overflow': self.overflow,
+            'enqueued': self.enqueued,
+            'processed': self.processed,
+            'dropped': self.dropped,
+            'rejected': self.rejected,
+            'avg_lag': self.total_lag / self.processed if self.processed else 0.0,
+            'max_lag': self.max_lag
+        }
+
+
+ROUTING_FIELDS = ('correlation_id', 'reply_to', 'broadcast')
+
+
+def is_envelope(data: Any) -> bool:
+    """
+    Check whether event data is a message envelope.
+    
+    Args:
+        data (Any): Event payload
+    
+    Returns:
+        bool: True for dicts with ``content`` and a ``correlation_id`` or ``reply_to``
+    """
+    return isinstance(data, dict) and 'content' in data and ('correlation_id' in data or 'reply_to' in data)
+
+
+def reply_envelope(request: Dict[str, Any], content: Any = None, error: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Build the response envelope for a request envelope.
+    
+    Args:
+        request (Dict[str, Any]): Request envelope
+        content (Any): Response content
+        error (Optional[str]): Error message if the request failed
+    
+    Returns:
+        Dict[str, Any]: Envelope carrying the request's routing fields
+    """
+    reply = {field: request[field] for field in ROUTING_FIELDS if field in request}
+    reply['content'] = content
+    reply['status'] = 'error' if error is not None else 'success'
+    if error is not None:
+        reply['error'] = error
+    return reply
+
 
 class EventBus:
     """
     An asynchronous event bus for managing publish-subscribe communication.
     
     Allows decoupled event handling and message routing between components.
+    Each handler runs in its own task with its own timeout, concurrency limit
+    and error isolation, so a slow or failing subscriber does not hold up the
+    others or the publisher.
+    
+    With ``queue_size`` set, the bus runs in queue mode: every event type gets
+    a bounded queue drained by ``workers`` worker tasks, and ``overflow``
+    decides what happens when a queue is full ('block' waits for space,
+    'drop_oldest' discards the oldest pending event, 'reject' raises
+    ``EventQueueFull``). Memory stays bounded under bursts.
+    
+    Event types may be hierarchical (``agent.planner.response``) and handlers
+    may subscribe with wildcards: ``*`` matches one segment and ``#`` any
+    number of segments (``agent.*.response``, ``agent.#``). A handler runs at
+    most once per event, even when several of its patterns match.
+    
+    With a ``transport``, events are also shared with the buses of other
+    processes (e.g. several uvicorn workers). Events received from another
+    process reach local handlers but are not processed by the local agent.
     """
     
-    def __init__(self, agent: Optional[Any] = None):
+    def __init__(
+        self,
+        agent: Optional[Any] = None,
+        handler_timeout: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        workers: int = 1,
+        overflow: str = 'block',
+        transport: Optional[BaseTransport] = None
+    ):
         """
         Initialize the event bus.
         
         Args:
             agent (Optional[Any]): Agent to process messages, if provided
+            handler_timeout (Optional[float]): Default seconds a handler may run
+                before it is cancelled (None: no limit)
+            max_concurrency (Optional[int]): Default number of concurrent runs
+                allowed per handler (None: no limit)
+            queue_size (Optional[int]): Capacity of each per-event-type queue;
+                enables queue mode (None: dispatch inline)
+            workers (int): Worker tasks per event type in queue mode. Defaults to 1.
+            overflow (str): Policy for full queues: 'block', 'drop_oldest' or
+                'reject'. Defaults to 'block'.
+            transport (Optional[BaseTransport]): Transport sharing events with
+                other processes (None: this process only)
         """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}")
         self.subscribers: Dict[str, List[Callable]] = {}
+        self._topics: TopicTrie[Callable] = TopicTrie()
         self.agent = agent
+        self.handler_timeout = handler_timeout
+        self.max_concurrency = max_concurrency
+        self._handler_options: Dict[Callable, Tuple[Optional[float], Optional[int]]] = {}
+        self._semaphores: Dict[Callable, asyncio.Semaphore] = {}
+        self._background: Set[asyncio.Task] = set()
+        self.queue_size = queue_size
+        self.workers = workers
+        self.overflow = overflow
+        self._queue_settings: Dict[str, Tuple[int, int, str]] = {}
+        self._queues: Dict[str, _TopicQueue] = {}
+        self._stopped: Optional[asyncio.Event] = None
+        self._stopping = False
+        self.transport = transport
+        self.handler_errors = 0
+        self.handler_timeouts = 0
         self.logger = logging.getLogger(__name__)
         logging.basicConfig(level=logging.INFO)
     
-    def subscribe(self, event_type: str, handler: Callable):
+    def subscribe(
+        self,
+        event_type: str,
+        handler: Callable,
+        timeout: Optional[float] = None,
+        max_concurrency: Optional[int] = None
+    ):
         """
         Subscribe a handler to a specific event type.
         
         Args:
-            event_type (str): Type of event to subscribe to
+            event_type (str): Type of event or wildcard pattern to subscribe to
             handler (Callable): Function to handle the event
+            timeout (Optional[float]): Seconds this handler may run (default: handler_timeout)
+            max_concurrency (Optional[int]): Concurrent runs allowed for this
+                handler (default: max_concurrency)
         """
         if event_type not in self.subscribers:
             self.subscribers[event_type] = []
         self.subscribers[event_type].append(handler)
+        self._topics.add(event_type, handler)
+        if timeout is not None or max_concurrency is not None:
+            self._handler_options[handler] = (timeout, max_concurrency)
     
-    async def publish(self, event_type: str, data: Any):
+    def unsubscribe(self, event_type: str, handler: Callable):
         """
-        Publish an event to all subscribers.
+        Remove a handler from an event type.
         
         Args:
-            event_type (str): Type of event being published
+            event_type (str): Type of event the handler is subscribed to
+            handler (Callable): Handler to remove
+        """
+        handlers = self.subscribers.get(event_type, [])
+        if handler in handlers:
+            handlers.remove(handler)
+            self._topics.remove(event_type, handler)
+            if not handlers:
+                del self.subscribers[event_type]
+    
+    def _options(self, handler: Callable) -> Tuple[Optional[float], Optional[int]]:
+        timeout, max_concurrency = self._handler_options.get(handler, (None, None))
+        return (
+            timeout if timeout is not None else self.handler_timeout,
+            max_concurrency if max_concurrency is not None else self.max_concurrency
+        )
+    
+    def _semaphore(self, handler: Callable, limit: int) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(handler)
+        if semaphore is None:
+            semaphore = self._semaphores[handler] = asyncio.Semaphore(limit)
+        return semaphore
+    
+    async def _run_handler(self, event_type: str, handler: Callable, data: Any):
+        """
+        Run one handler with its timeout and concurrency limit, isolating errors.
+        
+        Args:
+            event_type (str): Type of event being handled
+            handler (Callable): Handler to run
             data (Any): Event payload
         """
-        if event_type not in self.subscribers:
-            self.logger.warning(f"No subscribers for event type: {event_type}")
+        timeout, max_concurrency = self._options(handler)
+        semaphore = self._semaphore(handler, max_concurrency) if max_concurrency else None
+        try:
+            if semaphore is not None:
+                await semaphore.acquire()
+            try:
+                result = handler(data)
+                if inspect.isawaitable(result):
+                    await asyncio.wait_for(result, timeout)
+            finally:
+                if semaphore is not None:
+                    semaphore.release()
+        except asyncio.TimeoutError:
+            self.handler_timeouts += 1
+            self.logger.error(f"Event handler for {event_type} timed out after {timeout}s")
+        except Exception as e:
+            self.handler_errors += 1
+            self.logger.error(f"Error in event handler for {event_type}: {e}")
+    
+    async def _process_agent_message(self, data: Any):
+        """
+        Send a user message to the agent and publish its response.
+        
+        A message may be an envelope: a dict with ``content`` plus routing
+        fields (``correlation_id``, ``reply_to``, ``broadcast``). The response
+        is then published as an envelope with the same routing fields, errors
+        included, and also on ``agent_broadcast`` when ``broadcast`` is set.
+        
+        Args:
+            data (Any): User message or message envelope
+        """
+        envelope = data if is_envelope(data) else None
+        content = envelope['content'] if envelope else data
+        try:
+            response = await self.agent.send_message(content)
+        except Exception as e:
+            self.logger.error(f"Error processing agent message: {e}")
+            if envelope:
+                await self.publish('agent_response', reply_envelope(envelope, error=str(e)))
             return
         
-        # Process agent message if agent is provided
-        if event_type == 'user_message' and self.agent:
+        if envelope is None:
+            await self.publish('agent_response', response)
+            return
+        reply = reply_envelope(envelope, content=response)
+        await self.publish('agent_response', reply)
+        if envelope.get('broadcast'):
+            await self.publish('agent_broadcast', reply)
+    
+    def _spawn(self, coroutine: Awaitable) -> asyncio.Task:
+        task = asyncio.ensure_future(coroutine)
+        # Keep a reference so fire-and-forget tasks are not garbage collected
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+        return task
+    
+    def configure_queue(
+        self,
+        event_type: str,
+        maxsize: Optional[int] = None,
+        workers: Optional[int] = None,
+        overflow: Optional[str] = None
+    ):
+        """
+        Override queue settings for one event type.
+        
+        Enables queue mode for this event type even when the bus has no
+        ``queue_size``. Takes effect when the queue is first used.
+        
+        Args:
+            event_type (str): Event type to configure
+            maxsize (Optional[int]): Queue capacity (default: queue_size, or 1000)
+            workers (Optional[int]): Worker tasks (default: workers)
+            overflow (Optional[str]): Overflow policy (default: overflow)
+        """
+        overflow = overflow or self.overflow
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}")
+        self._queue_settings[event_type] = (
+            maxsize or self.queue_size or 1000,
+            workers or self.workers,
+            overflow
+        )
+    
+    def _topic_queue(self, event_type: str) -> Optional[_TopicQueue]:
+        """
+        Get the queue for an event type, creating it and its workers on first use.
+        
+        Args:
+            event_type (str): Event type
+        
+        Returns:
+            The topic queue, or None when the event type is dispatched inline
+        """
+        topic_queue = self._queues.get(event_type)
+        if topic_queue is not None:
+            return topic_queue
+        settings = self._queue_settings.get(event_type)
+        if settings is None:
+            if self.queue_size is None:
+                return None
+            settings = (self.queue_size, self.workers, self.overflow)
+        topic_queue = self._queues[event_type] = _TopicQueue(*settings)
+        for _ in range(topic_queue.worker_count):
+            topic_queue.workers.append(asyncio.ensure_future(self._worker(event_type, topic_queue)))
+        return topic_queue
+    
+    async def _worker(self, event_type: str, topic_queue: _TopicQueue):
+        """
+        Dispatch queued events of one type until cancelled.
+        
+        Args:
+            event_type (str): Event type served by this worker
+            topic_queue (_TopicQueue): Queue to drain
+        """
+        while True:
+            enqueued_at, data, done, process_agent = await topic_queue.queue.get()
+            lag = time.monotonic() - enqueued_at
+            topic_queue.total_lag += lag
+            topic_queue.max_lag = max(topic_queue.max_lag, lag)
             try:
-                response = await self.agent.send_message(data)
-                await self.publish('agent_response', response)
-            except Exception as e:
-                self.logger.error(f"Error processing agent message: {e}")
+                await self._dispatch(event_type, data, process_agent)
+            finally:
+                topic_queue.pending -= 1
+                topic_queue.processed += 1
+                topic_queue.queue.task_done()
+                if done is not None and not done.done():
+                    done.set_result(None)
+    
+    async def _enqueue(self, topic_queue: _TopicQueue, data: Any, wait: bool, process_agent: bool = True):
+        """
+        Put an event on a topic queue, applying the overflow policy.
+        
+        Args:
+            topic_queue (_TopicQueue): Queue to add the event to
+            data (Any): Event payload
+            wait (bool): Whether to wait until the event has been dispatched
+            process_agent (bool): Whether the agent may process the event
+        
+        Raises:
+            EventQueueFull: If the queue is full and the policy is 'reject'
+        """
+        done = asyncio.get_running_loop().create_future() if wait else None
+        item = (time.monotonic(), data, done, process_agent)
+        queue = topic_queue.queue
+        if queue.full() and topic_queue.overflow == 'reject':
+            topic_queue.rejected += 1
+            raise EventQueueFull(f"Event queue is full ({queue.maxsize} pending events)")
+        if queue.full() and topic_queue.overflow == 'drop_oldest':
+            _, _, dropped_done, _ = queue.get_nowait()
+            queue.task_done()
+            topic_queue.pending -= 1
+            topic_queue.dropped += 1
+            if dropped_done is not None and not dropped_done.done():
+                dropped_done.set_result(None)
+        await queue.put(item)
+        topic_queue.pending += 1
+        topic_queue.enqueued += 1
+        if done is not None:
+            await done
+    
+    async def _dispatch(self, event_type: str, data: Any, process_agent: bool = True):
+        """
+        Run the agent (for user messages) and every handler for one event.
+        
+        Args:
+            event_type (str): Type of event being dispatched
+            data (Any): Event payload
+            process_agent (bool): Whether the agent may process the event
+        """
+        tasks = []
+        
+        # Process agent message if agent is provided
+        if event_type == 'user_message' and self.agent and process_agent:
+            tasks.append(self._spawn(self._process_agent_message(data)))
+        
+        handlers = self._topics.match(event_type)
+        if not handlers and not tasks:
+            self.logger.warning(f"No subscribers for event type: {event_type}")
+            return
         
         # Call all event handlers
-        for handler in self.subscribers[event_type]:
-            try:
-                await handler(data)
-            except Exception as e:
-                self.logger.error(f"Error in event handler for {event_type}: {e}")
+        tasks.extend(self._spawn(self._run_handler(event_type, handler, data)) for handler in handlers)
+        await asyncio.gather(*tasks)
+    
+    async def publish(self, event_type: str, data: Any, wait: bool = True):
+        """
+        Publish an event to all subscribers.
+        
+        Handlers run concurrently, so fan-out takes as long as the slowest
+        handler rather than the sum of all of them.
+        
+        Args:
+            event_type (str): Type of event being published
+            data (Any): Event payload
+            wait (bool): Whether to wait until every handler (and the agent,
+                for user messages) has finished. With False the event is
+                dispatched in the background; use ``drain`` to wait for it.
+        
+        Raises:
+            EventQueueFull: In queue mode, if the event type's queue is full
+                and its overflow policy is 'reject'
+        """
+        await self._publish_local(event_type, data, wait)
+        if self.transport is not None:
+            await self._forward(event_type, data)
+    
+    async def _forward(self, event_type: str, data: Any):
+        """
+        Hand an already delivered event to the transport for other processes.
+        
+        Failures (an unreachable broker, a payload the codec cannot encode)
+        are logged; they never undo or block local delivery. Once ``stop``
+        has closed the transport, events stay local until ``connect`` or
+        ``start`` is called again.
+        
+        Args:
+            event_type (str): Type of event being published
+            data (Any): Event payload
+        """
+        if self._stopping and not self.transport.started:
+            return
+        try:
+            if not self.transport.started:
+                await self.connect()
+            await self.transport.publish(event_type, data)
+        except Exception as e:
+            self.logger.error(f"Failed to forward {event_type} event: {e}")
+    
+    async def _publish_local(self, event_type: str, data: Any, wait: bool, process_agent: bool = True):
+        """
+        Deliver an event to this process's subscribers.
+        
+        Args:
+            event_type (str): Type of event being published
+            data (Any): Event payload
+            wait (bool): Whether to wait until the event has been handled
+            process_agent (bool): Whether the agent may process the event
+        """
+        topic_queue = self._topic_queue(event_type)
+        if topic_queue is not None:
+            # With the 'block' policy, waiting for space is the backpressure even when wait is False
+            await self._enqueue(topic_queue, data, wait, process_agent)
+            return
+        
+        dispatch = self._dispatch(event_type, data, process_agent)
+        if wait:
+            await dispatch
+        else:
+            self._spawn(dispatch)
+    
+    async def _deliver_remote(self, event_type: str, data: Any):
+        """
+        Deliver an event published by another process.
+        
+        Args:
+            event_type (str): Type of event
+            data (Any): Event payload
+        """
+        await self._publish_local(event_type, data, wait=False, process_agent=False)
+    
+    async def connect(self):
+        """
+        Start receiving events from other processes through the transport.
+        
+        Called automatically on the first publish; call it at startup in
+        processes that only subscribe.
+        """
+        self._stopping = False
+        if self.transport is not None and not self.transport.started:
+            await self.transport.start(self._deliver_remote)
+    
+    def queue_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get queue metrics per event type.
+        
+        Returns:
+            Dict[str, Dict[str, Any]]: Depth, capacity, counters and lag
+            (seconds between publish and dispatch) for every queue
+        """
+        return {event_type: topic_queue.stats() for event_type, topic_queue in self._queues.items()}
+    
+    async def drain(self):
+        """
+        Wait until every queued or background event has been handled.
+        """
+        while self._background or any(q.pending for q in self._queues.values()):
+            for topic_queue in list(self._queues.values()):
+                await topic_queue.queue.join()
+            if self._background:
+                await asyncio.gather(*list(self._background))
     
     async def start(self):
         """
         Start event bus processing.
         Useful for long-running event processing tasks.
+        
+        Starts the workers of already configured queues and runs until
+        ``stop`` is called.
         """
-        while True:
-            # Keep the event bus running
-            await asyncio.sleep(1)
+        self._stopped = asyncio.Event()
+        await self.connect()
+        for event_type in list(self._queue_settings):
+            self._topic_queue(event_type)
+        await self._stopped.wait()
+    
+    async def stop(self, drain: bool = True):
+        """
+        Stop queue workers and the transport.
+        
+        Pending events are drained before the transport closes, so responses
+        they produce still reach other processes.
+        
+        Args:
+            drain (bool): Whether to handle pending events first. Defaults to True.
+        """
+        self._stopping = True
+        if drain:
+            await self.drain()
+        if self.transport is not None:
+            await self.transport.close()
+        if drain:
+            # Events received while the transport was closing
+            await self.drain()
+        workers = [worker for topic_queue in self._queues.values() for worker in topic_queue.workers]
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._queues.clear()
+        if self._stopped is not None:
+            self._stopped.set()
 
 # Example usage
 async def example_event_handler(message):
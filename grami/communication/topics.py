@@ -0,0 +1,159 @@
+"""
+Hierarchical topic matching for the GRAMI event bus.
+
+Topics are dot-separated paths such as ``agent.planner.response``. Patterns
+may use ``*`` to match exactly one segment and ``#`` to match zero or more
+segments, e.g. ``agent.*.response`` or ``agent.#``.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Generic, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+SINGLE_WILDCARD = '*'
+MULTI_WILDCARD = '#'
+
+
+class _Node(Generic[T]):
+    """A trie node holding the values subscribed at this path."""
+
+    __slots__ = ('children', 'values')
+
+    def __init__(self):
+        self.children: Dict[str, '_Node[T]'] = {}
+        self.values: List[T] = []
+
+
+class TopicTrie(Generic[T]):
+    """
+    Trie of topic patterns for wildcard routing.
+
+    Adding and removing a pattern walks one path, so both are O(depth).
+    Matching follows only the branches that can match the topic (the literal
+    segment, ``*`` and ``#``), so its cost grows with topic depth and the
+    number of wildcard patterns, not with the total number of subscriptions.
+    Results for recently matched topics are cached until the trie changes.
+    """
+
+    def __init__(self, separator: str = '.', cache_size: int = 1024):
+        """
+        Initialize an empty trie.
+
+        Args:
+            separator (str): Segment separator. Defaults to '.'.
+            cache_size (int): Number of recently matched topics whose results
+                are cached. Defaults to 1024.
+        """
+        self.separator = separator
+        self.cache_size = cache_size
+        self._root: _Node[T] = _Node()
+        self._size = 0
+        self._cache: 'OrderedDict[str, List[T]]' = OrderedDict()
+
+    def _split(self, topic: str) -> List[str]:
+        return topic.split(self.separator) if topic else []
+
+    def add(self, pattern: str, value: T) -> None:
+        """
+        Subscribe a value to a topic pattern.
+
+        Args:
+            pattern (str): Topic or pattern with ``*`` / ``#`` wildcards
+            value (T): Value to return for matching topics
+        """
+        node = self._root
+        for segment in self._split(pattern):
+            node = node.children.setdefault(segment, _Node())
+        node.values.append(value)
+        self._size += 1
+        self._cache.clear()
+
+    def remove(self, pattern: str, value: T) -> bool:
+        """
+        Remove a value from a topic pattern, pruning empty branches.
+
+        Args:
+            pattern (str): Pattern the value was added with
+            value (T): Value to remove
+
+        Returns:
+            bool: True if the value was subscribed to the pattern
+        """
+        path: List[Tuple[_Node[T], str]] = []
+        node = self._root
+        for segment in self._split(pattern):
+            child = node.children.get(segment)
+            if child is None:
+                return False
+            path.append((node, segment))
+            node = child
+        if value not in node.values:
+            return False
+        node.values.remove(value)
+        self._size -= 1
+        self._cache.clear()
+
+        # Drop nodes that no longer lead to any value
+        while path and not node.values and not node.children:
+            parent, segment = path.pop()
+            del parent.children[segment]
+            node = parent
+        return True
+
+    def match(self, topic: str) -> List[T]:
+        """
+        Find the values subscribed to patterns matching a topic.
+
+        Args:
+            topic (str): Concrete topic without wildcards
+
+        Returns:
+            List[T]: Matching (hashable) values, each at most once, in a stable order
+        """
+        cached = self._cache.get(topic)
+        if cached is not None:
+            self._cache.move_to_end(topic)
+            return list(cached)
+
+        matches: List[T] = []
+        seen = set()
+        for node in self._match_nodes(self._root, self._split(topic), 0):
+            for value in node.values:
+                if value not in seen:
+                    seen.add(value)
+                    matches.append(value)
+
+        self._cache[topic] = matches
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return list(matches)
+
+    def _match_nodes(self, node: _Node[T], segments: List[str], index: int) -> Iterator[_Node[T]]:
+        if index == len(segments):
+            yield node
+        else:
+            literal = node.children.get(segments[index])
+            if literal is not None:
+                yield from self._match_nodes(literal, segments, index + 1)
+            single = node.children.get(SINGLE_WILDCARD)
+            if single is not None:
+                yield from self._match_nodes(single, segments, index + 1)
+
+        multi = node.children.get(MULTI_WILDCARD)
+        if multi is not None:
+            # '#' absorbs any number of remaining segments, including none
+            for end in range(index, len(segments) + 1):
+                yield from self._match_nodes(multi, segments, end)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, pattern: str) -> bool:
+        node: Optional[_Node[T]] = self._root
+        for segment in self._split(pattern):
+            node = node.children.get(segment)
+            if node is None:
+                return False
+        return bool(node.values)
+
@@ -0,0 +1,369 @@
+"""
+Transports that carry EventBus events between processes.
+
+The bus always delivers an event to its own subscribers first; a transport
+then forwards it to every other process sharing the same namespace. Each
+process holds a single network subscription, however many handlers it has,
+and events published by a process are never delivered to it a second time.
+"""
+
+import asyncio
+import logging
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+
+from ..memory.codecs import BaseCodec, JSONCodec
+from ..memory.redis_pool import RedisPoolRegistry, default_pool_registry
+
+Deliver = Callable[[str, Any], Awaitable[None]]
+
+
+class BaseTransport(ABC):
+    """
+    Base class for EventBus transports.
+
+    Published events are buffered and sent in batches of up to
+    ``batch_size`` events, or after ``batch_interval`` seconds, whichever
+    comes first. Events are wrapped in an envelope carrying this process's
+    ``origin_id`` so that they can be skipped when they come back.
+
+    Listeners never block indefinitely: they wake up at least every few
+    seconds, log and retry after connection errors, and ``close`` waits at
+    most ``close_timeout`` seconds for them to stop.
+    """
+
+    def __init__(
+        self,
+        codec: Optional[BaseCodec] = None,
+        batch_size: int = 100,
+        batch_interval: float = 0.005,
+        retry_interval: float = 1.0,
+        close_timeout: float = 5.0
+    ):
+        """
+        Initialize the transport.
+
+        Args:
+            codec (Optional[BaseCodec]): Codec for event envelopes (default: JSON)
+            batch_size (int): Maximum events sent in one batch. Defaults to 100.
+            batch_interval (float): Seconds an event may wait for a batch. Defaults to 0.005.
+            retry_interval (float): Seconds the listener waits before reconnecting
+                after an error. Defaults to 1.0.
+            close_timeout (float): Seconds ``close`` waits for the listener and
+                the subscription to shut down. Defaults to 5.0.
+        """
+        self.origin_id = uuid.uuid4().hex
+        self.codec = codec or JSONCodec()
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        self.retry_interval = retry_interval
+        self.close_timeout = close_timeout
+        self._deliver: Optional[Deliver] = None
+        self._buffer: List[Tuple[str, bytes]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._listener: Optional[asyncio.Task] = None
+        self._closing = False
+        self.sent = 0
+        self.batches = 0
+        self.received = 0
+        self.skipped = 0
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def started(self) -> bool:
+        return self._deliver is not None
+
+    async def start(self, deliver: Deliver):
+        """
+        Start receiving events from other processes.
+
+        Args:
+            deliver (Deliver): Coroutine function called with topic and data
+                for every event published by another process
+        """
+        if self.started:
+            return
+        self._closing = False
+        self._deliver = deliver
+        await self._subscribe()
+
+    async def publish(self, topic: str, data: Any):
+        """
+        Queue an event for delivery to other processes.
+
+        Args:
+            topic (str): Event topic
+            data (Any): Event payload (must be encodable by the codec)
+        """
+        envelope = self.codec.encode({'origin': self.origin_id, 'topic': topic, 'data': data})
+        self._buffer.append((topic, envelope))
+        if len(self._buffer) >= self.batch_size:
+            await self.flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.ensure_future(self._flush_later())
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.batch_interval)
+        self._flush_task = None
+        await self.flush()
+
+    async def flush(self):
+        """
+        Send every buffered event now.
+        """
+        while self._buffer:
+            batch, self._buffer = self._buffer[:self.batch_size], self._buffer[self.batch_size:]
+            try:
+                await self._send(batch)
+                self.sent += len(batch)
+                self.batches += 1
+            except Exception as e:
+                self.logger.error(f"Failed to send {len(batch)} events: {e}")
+
+    async def _receive(self, envelope: bytes):
+        """
+        Decode an envelope from the network and deliver it unless this process sent it.
+
+        Args:
+            envelope (bytes): Encoded envelope
+        """
+        try:
+            event = self.codec.decode(envelope)
+        except Exception as e:
+            self.logger.error(f"Dropping undecodable event: {e}")
+            return
+        if event.get('origin') == self.origin_id:
+            # Already delivered locally when it was published
+            self.skipped += 1
+            return
+        self.received += 1
+        try:
+            await self._deliver(event['topic'], event['data'])
+        except Exception as e:
+            self.logger.error(f"Error delivering event {event.get('topic')}: {e}")
+
+    async def close(self):
+        """
+        Send buffered events and stop receiving.
+
+        Waits at most ``close_timeout`` seconds each for the listener and the
+        subscription; a listener stuck in a network call is abandoned.
+        """
+        self._closing = True
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self.flush()
+        if self._listener is not None:
+            self._listener.cancel()
+            _, pending = await asyncio.wait({self._listener}, timeout=self.close_timeout)
+            if pending:
+                self.logger.warning(f"Event listener did not stop within {self.close_timeout}s")
+            self._listener = None
+        try:
+            await asyncio.wait_for(self._unsubscribe(), self.close_timeout)
+        except Exception as e:
+            self.logger.error(f"Error closing event subscription: {e}")
+        self._deliver = None
+
+    @abstractmethod
+    async def _send(self, batch: List[Tuple[str, bytes]]):
+        """
+        Send a batch of (topic, envelope) pairs over the network.
+        """
+        pass
+
+    @abstractmethod
+    async def _subscribe(self):
+        """
+        Open this process's subscription and start the listener.
+        """
+        pass
+
+    async def _unsubscribe(self):
+        """
+        Release the subscription's resources.
+        """
+        pass
+
+
+class LocalTransport(BaseTransport):
+    """
+    Transport for a single process: events never leave it.
+    """
+
+    async def publish(self, topic: str, data: Any):
+        pass
+
+    async def _send(self, batch: List[Tuple[str, bytes]]):
+        pass
+
+    async def _subscribe(self):
+        pass
+
+
+class RedisPubSubTransport(BaseTransport):
+    """
+    Transport over Redis Pub/Sub.
+
+    Every topic is published on channel ``{prefix}{topic}`` and each process
+    holds one pattern subscription to ``{prefix}*``. Delivery is
+    fire-and-forget: processes that are down, or reconnecting after a
+    connection error, miss events.
+    """
+
+    def __init__(
+        self,
+        host: str = 'localhost',
+        port: int = 6379,
+        db: int = 0,
+        prefix: str = 'grami:events:',
+        poll_interval: float = 1.0,
+        pool_registry: Optional[RedisPoolRegistry] = None,
+        **kwargs: Any
+    ):
+        """
+        Initialize the transport.
+
+        Args:
+            host (str): Redis host. Defaults to 'localhost'.
+            port (int): Redis port. Defaults to 6379.
+            db (int): Redis database number. Defaults to 0.
+            prefix (str): Channel prefix shared by all processes of one bus
+            poll_interval (float): Seconds each read waits for a message. Defaults to 1.0.
+            pool_registry (Optional[RedisPoolRegistry]): Registry providing shared connection pools
+            **kwargs: Batching, retry and codec options for ``BaseTransport``
+        """
+        super().__init__(**kwargs)
+        self._host = host
+        self._port = port
+        self._db = db
+        self.prefix = prefix
+        self.poll_interval = poll_interval
+        self._pool_registry = pool_registry or default_pool_registry
+        self._redis_client = None
+        self._pubsub = None
+
+    def _get_redis_client(self):
+        if self._redis_client is None:
+            self._redis_client = self._pool_registry.get_client(self._host, self._port, self._db)
+        return self._redis_client
+
+    async def _send(self, batch: List[Tuple[str, bytes]]):
+        pipeline = self._get_redis_client().pipeline(transaction=False)
+        for topic, envelope in batch:
+            pipeline.publish(self.prefix + topic, envelope)
+        await pipeline.execute()
+
+    async def _subscribe(self):
+        await self._open_pubsub()
+        self._listener = asyncio.ensure_future(self._listen())
+
+    async def _open_pubsub(self):
+        self._pubsub = self._get_redis_client().pubsub(ignore_subscribe_messages=True)
+        await self._pubsub.psubscribe(f"{self.prefix}*")
+
+    async def _listen(self):
+        while not self._closing:
+            try:
+                if self._pubsub is None:
+                    await self._open_pubsub()
+                message = await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=self.poll_interval)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"Error reading event channel: {e}")
+                await self._unsubscribe()
+                await asyncio.sleep(self.retry_interval)
+                continue
+            if message and message.get('type') == 'pmessage':
+                await self._receive(message['data'])
+
+    async def _unsubscribe(self):
+        pubsub, self._pubsub = self._pubsub, None
+        if pubsub is not None:
+            try:
+                await pubsub.aclose()
+            except Exception as e:
+                self.logger.error(f"Error closing event channel: {e}")
+
+
+class RedisStreamsTransport(BaseTransport):
+    """
+    Transport over a Redis Stream.
+
+    All topics share the stream ``{prefix}stream``, capped at about
+    ``maxlen`` entries, and each process runs one blocking XREAD loop over it.
+    A process that reconnects within the retained window resumes where it
+    left off instead of missing events.
+    """
+
+    def __init__(
+        self,
+        host: str = 'localhost',
+        port: int = 6379,
+        db: int = 0,
+        prefix: str = 'grami:events:',
+        maxlen: int = 10000,
+        block: int = 1000,
+        pool_registry: Optional[RedisPoolRegistry] = None,
+        **kwargs: Any
+    ):
+        """
+        Initialize the transport.
+
+        Args:
+            host (str): Redis host. Defaults to 'localhost'.
+            port (int): Redis port. Defaults to 6379.
+            db (int): Redis database number. Defaults to 0.
+            prefix (str): Key prefix shared by all processes of one bus
+            maxlen (int): Approximate number of events retained. Defaults to 10000.
+            block (int): Milliseconds each XREAD waits for new events. Defaults to 1000.
+            pool_registry (Optional[RedisPoolRegistry]): Registry providing shared connection pools
+            **kwargs: Batching, retry and codec options for ``BaseTransport``
+        """
+        super().__init__(**kwargs)
+        self._host = host
+        self._port = port
+        self._db = db
+        self.stream_key = f"{prefix}stream"
+        self.maxlen = maxlen
+        self.block = block
+        self._pool_registry = pool_registry or default_pool_registry
+        self._redis_client = None
+        self.last_id = None
+
+    def _get_redis_client(self):
+        if self._redis_client is None:
+            self._redis_client = self._pool_registry.get_client(self._host, self._port, self._db)
+        return self._redis_client
+
+    async def _send(self, batch: List[Tuple[str, bytes]]):
+        pipeline = self._get_redis_client().pipeline(transaction=False)
+        for _, envelope in batch:
+            pipeline.xadd(self.stream_key, {'event': envelope}, maxlen=self.maxlen, approximate=True)
+        await pipeline.execute()
+
+    async def _subscribe(self):
+        if self.last_id is None:
+            # Start after the newest existing entry
+            newest = await self._get_redis_client().xrevrange(self.stream_key, count=1)
+            self.last_id = newest[0][0] if newest else b'0-0'
+        self._listener = asyncio.ensure_future(self._listen())
+
+    async def _listen(self):
+        redis = self._get_redis_client()
+        while not self._closing:
+            try:
+                response = await redis.xread({self.stream_key: self.last_id}, count=self.batch_size, block=self.block)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"Error reading event stream: {e}")
+                await asyncio.sleep(self.retry_interval)
+                continue
+            for _, entries in response or []:
+                for entry_id, fields in entries:
+                    self.last_id = entry_id
+                    await self._receive(fields[b'event'])
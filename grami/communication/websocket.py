@@ -1,13 +1,15 @@
 import asyncio
 import json
 import logging
+import uuid
 from typing import Any, Dict, Optional, Set, Union
 
 import uvicorn
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from starlette.websockets import WebSocketState
 
-from .event_bus import EventBus
+from .event_bus import EventBus, is_envelope
+from .transports import BaseTransport
 
 class WebSocketAgentCommunication:
     """
@@ -15,13 +17,20 @@ class WebSocketAgentCommunication:
     
     Supports bidirectional communication for AI agents, allowing 
     real-time message exchange, event streaming, and agent coordination.
+    
+    Each request gets a correlation ID (the client's ``id`` field, or a
+    generated one) and its response is sent only to the connection that asked,
+    so a response costs one send however many clients are connected. Clients
+    that set ``"broadcast": true`` on a request have its response sent to
+    every other client as well.
     """
     
     def __init__(
         self, 
         host: str = 'localhost', 
         port: int = 8765,
-        agent: Optional[Any] = None
+        agent: Optional[Any] = None,
+        transport: Optional[BaseTransport] = None
     ):
         """
         Initialize WebSocket server for agent communication.
@@ -30,27 +39,32 @@ class WebSocketAgentCommunication:
             host (str): Hostname to bind the WebSocket server. Defaults to 'localhost'.
             port (int): Port number for WebSocket server. Defaults to 8765.
             agent (Optional[Any]): Agent instance to process messages
+            transport (Optional[BaseTransport]): Event bus transport shared by
+                several server processes, so responses reach connections
+                held by other workers
         """
         self.app = FastAPI(title="GRAMI-AI WebSocket Server")
         self.host = host
         self.port = port
         
         # Create event bus with the agent
-        self.event_bus = EventBus(agent)
+        self.event_bus = EventBus(agent, transport=transport)
         
         # Configure logging
         self.logger = logging.getLogger(__name__)
         
-        # Track active WebSocket connections
+        # Track active WebSocket connections, by connection ID for reply routing
         self.active_connections: Set[WebSocket] = set()
+        self.connections: Dict[str, WebSocket] = {}
         
         # Setup WebSocket endpoint
         @self.app.websocket("/ws")
         async def websocket_endpoint(websocket: WebSocket):
             await self.handle_client(websocket)
         
-        # Subscribe to agent response events
-        self.event_bus.subscribe('agent_response', self.broadcast_agent_response)
+        # Route responses to the requesting connection; broadcast only on request
+        self.event_bus.subscribe('agent_response', self.route_agent_response)
+        self.event_bus.subscribe('agent_broadcast', self.broadcast_agent_response)
     
     async def handle_client(self, websocket: WebSocket):
         """
@@ -59,10 +73,13 @@ class WebSocketAgentCommunication:
         Args:
             websocket (WebSocket): Connected WebSocket client
         """
+        connection_id = uuid.uuid4().hex
         try:
             # Accept the WebSocket connection
             await websocket.accept()
+            await self.event_bus.connect()
             self.active_connections.add(websocket)
+            self.connections[connection_id] = websocket
             
             while True:
                 try:
@@ -73,8 +90,13 @@ class WebSocketAgentCommunication:
                         # Parse incoming message
                         parsed_message = json.loads(data)
                         
-                        # Publish message to event bus
-                        await self.event_bus.publish('user_message', parsed_message.get('content', ''))
+                        # Publish without waiting, so a client can have several requests in flight
+                        await self.event_bus.publish('user_message', {
+                            'content': parsed_message.get('content', ''),
+                            'correlation_id': parsed_message.get('id') or uuid.uuid4().hex,
+                            'reply_to': connection_id,
+                            'broadcast': bool(parsed_message.get('broadcast', False))
+                        }, wait=False)
                     
                     except json.JSONDecodeError:
                         self.logger.error(f"Invalid JSON: {data}")
@@ -97,31 +119,104 @@ class WebSocketAgentCommunication:
         
         finally:
             # Remove the connection
-            if websocket in self.active_connections:
-                self.active_connections.remove(websocket)
+            self._remove_connection(connection_id, websocket)
+    
+    def _remove_connection(self, connection_id: Optional[str], websocket: WebSocket):
+        """
+        Forget a connection.
+        
+        Args:
+            connection_id (Optional[str]): Connection ID, if known
+            websocket (WebSocket): Connection to forget
+        """
+        self.active_connections.discard(websocket)
+        if connection_id is not None and self.connections.get(connection_id) is websocket:
+            del self.connections[connection_id]
+    
+    @staticmethod
+    def _response_payload(response: Any) -> str:
+        """
+        Serialize a response or response envelope for clients.
+        
+        Args:
+            response (Any): Agent response or envelope
+        
+        Returns:
+            str: JSON message
+        """
+        if not is_envelope(response):
+            return json.dumps({"type": "agent_response", "content": response})
+        payload = {
+            "type": "agent_response",
+            "id": response.get('correlation_id'),
+            "status": response.get('status', 'success'),
+            "content": response.get('content')
+        }
+        if 'error' in response:
+            payload["message"] = response['error']
+        return json.dumps(payload)
+    
+    async def _send(self, connection_id: Optional[str], websocket: WebSocket, message: str) -> bool:
+        """
+        Send a message to one connection, dropping it if it is gone.
+        
+        Args:
+            connection_id (Optional[str]): Connection ID, if known
+            websocket (WebSocket): Connection to send to
+            message (str): Serialized message
+        
+        Returns:
+            bool: True if the message was sent
+        """
+        try:
+            if websocket.client_state == WebSocketState.CONNECTED:
+                await websocket.send_text(message)
+                return True
+        except Exception as e:
+            self.logger.error(f"Error sending to client: {e}")
+        # Remove disconnected websockets
+        self._remove_connection(connection_id, websocket)
+        return False
     
-    async def broadcast_agent_response(self, response: str):
+    async def route_agent_response(self, response: Any):
+        """
+        Send an agent response to the connection that made the request.
+        
+        Responses for connections held by another server process are ignored
+        here; that process delivers them.
+        
+        Args:
+            response (Any): Response envelope with a ``reply_to`` connection ID
+        """
+        if not is_envelope(response) or not response.get('reply_to'):
+            self.logger.warning("Agent response without reply_to; use 'agent_broadcast' to reach all clients")
+            return
+        
+        connection_id = response['reply_to']
+        websocket = self.connections.get(connection_id)
+        if websocket is None:
+            return
+        await self._send(connection_id, websocket, self._response_payload(response))
+    
+    async def broadcast_agent_response(self, response: Any):
         """
         Broadcast agent response to all connected WebSocket clients.
         
+        The requesting connection, which already received the response
+        directly, is skipped.
+        
         Args:
-            response (str): Agent's response to broadcast
+            response (Any): Agent's response or response envelope to broadcast
         """
-        if not self.active_connections:
+        if not self.connections:
             self.logger.warning("No clients connected for broadcast")
             return
         
-        for websocket in self.active_connections.copy():
-            try:
-                if websocket.client_state == WebSocketState.CONNECTED:
-                    await websocket.send_text(json.dumps({
-                        "type": "agent_response",
-                        "content": response
-                    }))
-            except Exception as e:
-                self.logger.error(f"Error broadcasting: {e}")
-                # Remove disconnected websockets
-                self.active_connections.discard(websocket)
+        origin = response.get('reply_to') if is_envelope(response) else None
+        message = self._response_payload(response)
+        for connection_id, websocket in list(self.connections.items()):
+            if connection_id != origin:
+                await self._send(connection_id, websocket, message)
     
     def run(self):
         """
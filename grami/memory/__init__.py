@@ -1,5 +1,12 @@
 from .base import BaseMemoryProvider
+from .codecs import JSONCodec, MsgpackCodec, PayloadSerializer
 from .lru import LRUMemory
 from .redis_memory import RedisMemory
+from .redis_pool import RedisPoolRegistry, default_pool_registry
+from .redis_stream_memory import RedisStreamMemory
+from .write_behind import WriteBehindMemory
 
-__all__ = ['BaseMemoryProvider', 'LRUMemory', 'RedisMemory']
+__all__ = [
+    'BaseMemoryProvider', 'LRUMemory', 'RedisMemory', 'RedisStreamMemory', 'RedisPoolRegistry',
+    'default_pool_registry', 'JSONCodec', 'MsgpackCodec', 'PayloadSerializer', 'WriteBehindMemory'
+]
@@ -1,3 +1,4 @@
+import inspect
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Any
 
@@ -54,3 +55,36 @@ class BaseMemoryProvider(ABC):
             List of recent items with their metadata
         """
         pass
+
+
+def accepts_message_ids(memory: Any) -> bool:
+    """Check whether a memory's ``add_message`` takes a ``message_id``.
+    
+    Args:
+        memory: Memory provider
+        
+    Returns:
+        True if ``message_id`` can be passed to ``add_message``
+    """
+    supported = getattr(memory, 'supports_message_ids', None)
+    if supported is not None:
+        return bool(supported)
+    try:
+        return 'message_id' in inspect.signature(memory.add_message).parameters
+    except (AttributeError, TypeError, ValueError):
+        return False
+
+
+async def store_message(memory: Any, role: str, content: Any, message_id: Optional[str] = None) -> None:
+    """Add a message to a memory provider, idempotently when it supports message IDs.
+    
+    Args:
+        memory: Memory provider
+        role: Role of the message sender
+        content: Content of the message
+        message_id: Optional stable ID; adding the same ID twice stores the message once
+    """
+    if message_id is not None and accepts_message_ids(memory):
+        await memory.add_message(role=role, content=content, message_id=message_id)
+    else:
+        await memory.add_message(role=role, content=content)
@@ -0,0 +1,189 @@
+import json
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+try:
+    import msgpack
+except ImportError:  # optional dependency
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # optional dependency
+    lz4_frame = None
+
+
+class BaseCodec(ABC):
+    """Base class for value codecs used by memory payloads."""
+
+    codec_id: int
+
+    @abstractmethod
+    def encode(self, value: Any) -> bytes:
+        """Encode a value to bytes.
+
+        Args:
+            value: Value to encode
+
+        Returns:
+            Encoded bytes
+        """
+        pass
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Any:
+        """Decode bytes produced by :meth:`encode`.
+
+        Args:
+            data: Encoded bytes
+
+        Returns:
+            Decoded value
+        """
+        pass
+
+
+class JSONCodec(BaseCodec):
+    """Compact JSON codec (no whitespace, UTF-8)."""
+
+    codec_id = 1
+
+    def encode(self, value: Any) -> bytes:
+        return json.dumps(value, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class MsgpackCodec(BaseCodec):
+    """MessagePack codec. Requires the ``msgpack`` package."""
+
+    codec_id = 2
+
+    def __init__(self):
+        if msgpack is None:
+            raise ImportError("MsgpackCodec requires the msgpack package: pip install msgpack")
+
+    def encode(self, value: Any) -> bytes:
+        return msgpack.packb(value, use_bin_type=True)
+
+    def decode(self, data: bytes) -> Any:
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+# Compression id -> (compress, decompress, available)
+_COMPRESSORS: Dict[int, Any] = {
+    1: (lambda data: zlib.compress(data, 6), zlib.decompress, True),
+    2: (
+        lambda data: zstandard.ZstdCompressor().compress(data),
+        lambda data: zstandard.ZstdDecompressor().decompress(data),
+        zstandard is not None
+    ),
+    3: (
+        lambda data: lz4_frame.compress(data),
+        lambda data: lz4_frame.decompress(data),
+        lz4_frame is not None
+    ),
+}
+_COMPRESSION_IDS = {'zlib': 1, 'zstd': 2, 'lz4': 3}
+_CODECS = {JSONCodec.codec_id: JSONCodec, MsgpackCodec.codec_id: MsgpackCodec}
+
+
+class PayloadSerializer:
+    """
+    Frames memory values as tagged binary payloads.
+
+    Every payload starts with a 6-byte header: a ``\\x00GM`` magic, the format
+    version, the codec id and the compression id (0 for none). Payloads
+    without the magic are read as the legacy JSON ``{'value', 'timestamp'}``
+    wrapper, so data written by earlier versions stays readable.
+    """
+
+    MAGIC = b'\x00GM'
+    FORMAT_VERSION = 1
+
+    def __init__(
+        self,
+        codec: Optional[BaseCodec] = None,
+        compression: Optional[str] = 'zlib',
+        compress_threshold: int = 1024
+    ):
+        """Initialize the serializer.
+
+        Args:
+            codec: Value codec (default: JSONCodec, which every process can
+                read; pass MsgpackCodec() to opt into smaller payloads)
+            compression: 'zlib', 'zstd', 'lz4' or None (default: 'zlib')
+            compress_threshold: Minimum encoded size in bytes before compressing (default: 1024)
+        """
+        self.codec = codec or JSONCodec()
+
+        if compression is None:
+            self._compression_id = 0
+        else:
+            if compression not in _COMPRESSION_IDS:
+                raise ValueError(f"Unsupported compression: {compression}")
+            self._compression_id = _COMPRESSION_IDS[compression]
+            if not _COMPRESSORS[self._compression_id][2]:
+                raise ImportError(f"{compression} compression requires its optional package")
+        self.compress_threshold = compress_threshold
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode a value as a tagged payload.
+
+        Args:
+            value: Value to encode
+
+        Returns:
+            Payload bytes
+        """
+        body = self.codec.encode(value)
+        compression_id = 0
+        if self._compression_id and len(body) >= self.compress_threshold:
+            compressed = _COMPRESSORS[self._compression_id][0](body)
+            if len(compressed) < len(body):
+                body = compressed
+                compression_id = self._compression_id
+        header = self.MAGIC + bytes((self.FORMAT_VERSION, self.codec.codec_id, compression_id))
+        return header + body
+
+    def loads(self, data: bytes) -> Any:
+        """Decode a tagged or legacy JSON payload.
+
+        Args:
+            data: Payload bytes
+
+        Returns:
+            Decoded value
+
+        Raises:
+            ValueError: If the payload uses an unknown format, codec or compression
+        """
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        if not data.startswith(self.MAGIC):
+            legacy = json.loads(data)
+            if isinstance(legacy, dict) and 'value' in legacy and 'timestamp' in legacy:
+                return legacy['value']
+            return legacy
+
+        version, codec_id, compression_id = data[3], data[4], data[5]
+        if version != self.FORMAT_VERSION:
+            raise ValueError(f"Unsupported payload format version: {version}")
+        body = data[6:]
+        if compression_id:
+            if compression_id not in _COMPRESSORS or not _COMPRESSORS[compression_id][2]:
+                raise ValueError(f"Unsupported payload compression: {compression_id}")
+            body = _COMPRESSORS[compression_id][1](body)
+
+        if codec_id == self.codec.codec_id:
+            return self.codec.decode(body)
+        if codec_id not in _CODECS:
+            raise ValueError(f"Unsupported payload codec: {codec_id}")
+        return _CODECS[codec_id]().decode(body)
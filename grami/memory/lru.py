@@ -1,8 +1,80 @@
+import heapq
+import itertools
+import json
+import sys
+import time
 from collections import OrderedDict
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from datetime import datetime, timezone
 from ..core.base import BaseMemoryProvider
 
+
+class _MessageRing:
+    """
+    Fixed-size ring buffer of messages addressed by monotonic sequence numbers.
+    
+    Appending and evicting the oldest message are O(1) and the buffer never
+    holds more than ``capacity`` slots.
+    """
+    
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self._slots: List[Optional[Tuple[int, Dict[str, Any]]]] = [None] * capacity
+        self._next_seq = 0
+        self._size = 0
+    
+    @property
+    def capacity(self) -> int:
+        return len(self._slots)
+    
+    def append(self, message: Dict[str, Any]) -> Tuple[int, Optional[int]]:
+        """Append a message, overwriting the oldest slot when full.
+        
+        Returns:
+            Sequence number of the new message and of the evicted one, if any
+        """
+        seq = self._next_seq
+        self._next_seq += 1
+        index = seq % self.capacity
+        
+        evicted = self._slots[index]
+        if evicted is None:
+            self._size += 1
+        self._slots[index] = (seq, message)
+        return seq, evicted[0] if evicted else None
+    
+    def discard(self, seq: int) -> bool:
+        """Remove the message with the given sequence number if still buffered."""
+        index = seq % self.capacity
+        slot = self._slots[index]
+        if slot is None or slot[0] != seq:
+            return False
+        self._slots[index] = None
+        self._size -= 1
+        return True
+    
+    def sequences(self) -> List[int]:
+        """Sequence numbers of buffered messages, oldest first."""
+        return [slot[0] for slot in self._ordered_slots()]
+    
+    def clear(self) -> None:
+        self._slots = [None] * self.capacity
+        self._size = 0
+    
+    def _ordered_slots(self) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        start = max(0, self._next_seq - self.capacity)
+        for seq in range(start, self._next_seq):
+            slot = self._slots[seq % self.capacity]
+            if slot is not None:
+                yield slot
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return (message for _, message in self._ordered_slots())
+    
+    def __len__(self) -> int:
+        return self._size
+
 class LRUMemory(BaseMemoryProvider):
     """
     LRU (Least Recently Used) Memory implementation.
@@ -10,35 +82,150 @@ class LRUMemory(BaseMemoryProvider):
     
     The memory store is provider-agnostic and stores raw data without making
     assumptions about the format needed by specific LLM providers.
+    
+    Items are evicted least recently used first once ``capacity`` items or
+    ``max_bytes`` bytes are exceeded. Items stored with an expiry are tracked
+    on a min-heap of deadlines and purged lazily, without scanning the cache.
     """
     
-    def __init__(self, capacity: int = 100, provider_id: Optional[str] = None):
+    def __init__(
+        self,
+        capacity: int = 100,
+        provider_id: Optional[str] = None,
+        default_ttl: Optional[float] = None,
+        max_bytes: Optional[int] = None
+    ):
         """Initialize LRU memory with a fixed capacity.
         
         Args:
             capacity: Maximum number of items to store (default: 100)
             provider_id: Optional provider identifier
+            default_ttl: Optional expiry in seconds for items stored without one
+            max_bytes: Optional budget for the estimated size of stored values
         """
         super().__init__(provider_id)
         self.capacity = capacity
+        self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
         self.cache = OrderedDict()
-        self.messages = []
+        self._messages = _MessageRing(capacity)
+        self._message_ids: Dict[str, int] = {}
+        self._message_id_by_seq: Dict[int, str] = {}
+        self._expiry_heap: List[Tuple[float, int, str]] = []
+        self._versions = itertools.count()
+        self._bytes = 0
     
-    async def store(self, key: str, value: Any) -> None:
+    @property
+    def messages(self) -> List[Dict[str, str]]:
+        """Conversation messages currently held, oldest first."""
+        return list(self._messages)
+    
+    @staticmethod
+    def _message_key(seq: int) -> str:
+        return f"message_{seq}"
+    
+    @staticmethod
+    def _message_seq(key: str) -> Optional[int]:
+        if not key.startswith("message_"):
+            return None
+        try:
+            return int(key[len("message_"):])
+        except ValueError:
+            return None
+    
+    @staticmethod
+    def _sizeof(value: Any) -> int:
+        """Estimate the size of a value in bytes."""
+        try:
+            return len(json.dumps(value, default=str).encode("utf-8"))
+        except (TypeError, ValueError):
+            return sys.getsizeof(value)
+    
+    def _remove_entry(self, key: str) -> bool:
+        """Remove a cache entry and any message it backs."""
+        entry = self.cache.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry['size']
+        seq = self._message_seq(key)
+        if seq is not None:
+            self._messages.discard(seq)
+            self._forget_message_id(seq)
+        return True
+    
+    def _forget_message_id(self, seq: int) -> None:
+        message_id = self._message_id_by_seq.pop(seq, None)
+        if message_id is not None:
+            self._message_ids.pop(message_id, None)
+    
+    def _purge_expired(self) -> None:
+        """Remove every entry whose deadline has passed."""
+        now = time.monotonic()
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            _, version, key = heapq.heappop(heap)
+            entry = self.cache.get(key)
+            # Heap items for overwritten or deleted entries are skipped lazily
+            if entry is not None and entry['version'] == version:
+                self._remove_entry(key)
+    
+    def _compact_expiry_heap(self) -> None:
+        """Drop stale heap items once they outnumber live entries."""
+        if len(self._expiry_heap) <= 2 * len(self.cache) + 64:
+            return
+        self._expiry_heap = [
+            (entry['expires_at'], entry['version'], key)
+            for key, entry in self.cache.items()
+            if entry['expires_at'] is not None
+        ]
+        heapq.heapify(self._expiry_heap)
+    
+    def _enforce_limits(self) -> None:
+        """Evict least recently used entries until within capacity and byte budget."""
+        while len(self.cache) > self.capacity or (
+            self.max_bytes is not None and self._bytes > self.max_bytes
+        ):
+            self._remove_entry(next(iter(self.cache)))
+    
+    async def store(self, key: str, value: Any, expiry: Optional[float] = None) -> None:
         """Store a value in memory.
         
         Args:
             key: Storage key
             value: Value to store
+            expiry: Optional expiry in seconds (default: default_ttl)
+            
+        Raises:
+            ValueError: If the value alone exceeds max_bytes
         """
+        size = self._sizeof(value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            raise ValueError(f"Value of {size} bytes exceeds max_bytes={self.max_bytes}")
+        
+        self._purge_expired()
+        
         # Update cache
-        if key in self.cache:
-            self.cache.pop(key)
+        ttl = expiry if expiry is not None else self.default_ttl
+        version = next(self._versions)
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        
+        previous = self.cache.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous['size']
         self.cache[key] = {
             'value': value,
-            'timestamp': datetime.now(timezone.utc).isoformat()
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'expires_at': expires_at,
+            'version': version,
+            'size': size
         }
-        self.cache.move_to_end(key)
+        self._bytes += size
+        
+        if expires_at is not None:
+            heapq.heappush(self._expiry_heap, (expires_at, version, key))
+            self._compact_expiry_heap()
+        
+        self._enforce_limits()
     
     async def retrieve(self, key: str) -> Optional[Any]:
         """Retrieve a value from memory.
@@ -47,8 +234,9 @@ class LRUMemory(BaseMemoryProvider):
             key: Storage key
         
         Returns:
-            Stored value or None if not found
+            Stored value or None if not found or expired
         """
+        self._purge_expired()
         if key not in self.cache:
             return None
             
@@ -61,8 +249,7 @@ class LRUMemory(BaseMemoryProvider):
         Args:
             key: Storage key to delete
         """
-        if key in self.cache:
-            del self.cache[key]
+        self._remove_entry(key)
     
     async def list_keys(self, pattern: Optional[str] = None) -> List[str]:
         """List all keys in memory.
@@ -73,6 +260,7 @@ class LRUMemory(BaseMemoryProvider):
         Returns:
             List of all keys
         """
+        self._purge_expired()
         return list(self.cache.keys())
     
     async def list_contents(self) -> Dict[str, Any]:
@@ -81,12 +269,17 @@ class LRUMemory(BaseMemoryProvider):
         Returns:
             Dictionary of keys and their values
         """
+        self._purge_expired()
         return {key: entry['value'] for key, entry in self.cache.items()}
     
     async def clear(self) -> None:
         """Clear all stored values."""
         self.cache.clear()
-        self.messages.clear()
+        self._messages.clear()
+        self._message_ids.clear()
+        self._message_id_by_seq.clear()
+        self._expiry_heap.clear()
+        self._bytes = 0
     
     async def get_size(self) -> int:
         """Get current number of items in memory.
@@ -94,6 +287,7 @@ class LRUMemory(BaseMemoryProvider):
         Returns:
             Number of stored items
         """
+        self._purge_expired()
         return len(self.cache)
     
     async def get_keys(self) -> List[str]:
@@ -102,32 +296,41 @@ class LRUMemory(BaseMemoryProvider):
         Returns:
             List of stored keys
         """
+        self._purge_expired()
         return list(self.cache.keys())
     
-    async def add_message(self, role: str, content: str) -> None:
+    async def add_message(self, role: str, content: str, message_id: Optional[str] = None) -> None:
         """Add a message to the conversation history.
         
         Args:
             role: Role of the message sender (e.g., "user", "assistant")
             content: Content of the message
+            message_id: Optional stable ID; a message whose ID is still held
+                is not added again
         """
+        if message_id is not None and message_id in self._message_ids:
+            return
+        
         # Create message object
         message = {
             "role": role,
             "content": content
         }
         
-        # Generate a unique key for the message
-        key = f"message_{len(self.messages)}"
+        # Append to the ring buffer, evicting the oldest message when full
+        seq, evicted_seq = self._messages.append(message)
+        if evicted_seq is not None:
+            self._remove_entry(self._message_key(evicted_seq))
         
-        # If we're at capacity, remove the least recently used item
-        if len(self.messages) >= self.capacity:
-            await self.delete(f"message_{len(self.messages) - self.capacity}")
-            self.messages.pop(0)
+        try:
+            await self.store(self._message_key(seq), message)
+        except ValueError:
+            self._messages.discard(seq)
+            raise
         
-        # Add new message
-        await self.store(key, message)
-        self.messages.append(message)
+        if message_id is not None:
+            self._message_ids[message_id] = seq
+            self._message_id_by_seq[seq] = message_id
     
     async def get_messages(self) -> List[Dict[str, str]]:
         """Get all stored messages.
@@ -135,11 +338,16 @@ class LRUMemory(BaseMemoryProvider):
         Returns:
             List of message dictionaries
         """
-        return self.messages
+        self._purge_expired()
+        return list(self._messages)
     
     async def clear_messages(self) -> None:
         """Clear all stored messages."""
-        self.messages.clear()
+        for seq in self._messages.sequences():
+            self._remove_entry(self._message_key(seq))
+        self._messages.clear()
+        self._message_ids.clear()
+        self._message_id_by_seq.clear()
     
     async def validate_configuration(self, config: Dict[str, Any]) -> bool:
         """Validate the configuration for the provider.
@@ -1,8 +1,95 @@
-import json
-import redis.asyncio as aioredis
-from typing import Dict, Any, List, Optional
+import time
+import uuid
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple, Union
 from datetime import datetime, timezone
 from ..memory.base import BaseMemoryProvider
+from .codecs import PayloadSerializer
+from .redis_pool import RedisPoolRegistry, default_pool_registry
+
+# Placeholder for keys that disappeared between reading the index and the hash
+_MISSING = object()
+
+
+def memory_key_prefix(
+    provider_id: Optional[str] = None,
+    session_id: Optional[str] = None,
+    hash_tag: bool = False
+) -> str:
+    """Build the key prefix of a memory namespace.
+    
+    Session namespaces are always wrapped in a ``{...}`` hash tag, so every
+    key of a session maps to the same Redis Cluster slot while different
+    sessions spread across shards.
+    
+    Args:
+        provider_id: Optional provider identifier
+        session_id: Optional session identifier
+        hash_tag: Wrap provider-wide namespaces in a hash tag as well
+        
+    Returns:
+        Prefix such as ``grami_memory:{provider:session}:``
+    """
+    namespace = provider_id or 'default'
+    if session_id is not None:
+        namespace = f"{namespace}:{session_id}"
+        hash_tag = True
+    if hash_tag:
+        namespace = f"{{{namespace}}}"
+    return f"grami_memory:{namespace}:"
+
+# Removes the oldest entries beyond capacity from the index and hash.
+# KEYS[1] = memory hash, KEYS[2] = memory index, ARGV[1] = capacity
+_TRIM_SNIPPET = """
+local excess = redis.call('ZCARD', KEYS[2]) - tonumber(ARGV[1])
+if excess > 0 then
+    local stale = redis.call('ZRANGE', KEYS[2], 0, excess - 1)
+    for i = 1, #stale, 1000 do
+        local last = math.min(i + 999, #stale)
+        redis.call('HDEL', KEYS[1], unpack(stale, i, last))
+        redis.call('ZREM', KEYS[2], unpack(stale, i, last))
+    end
+end
+"""
+
+# Trims to capacity, bumping the version key (KEYS[3]) if anything was removed.
+_TRIM_LUA = _TRIM_SNIPPET + """
+if excess > 0 then
+    redis.call('INCR', KEYS[3])
+end
+return math.max(excess, 0)
+"""
+
+# Writes an entry and trims to capacity atomically in one round trip.
+# KEYS[1] = memory hash, KEYS[2] = memory index, KEYS[3] = version
+# ARGV[1] = capacity, ARGV[2] = key, ARGV[3] = score, ARGV[4] = data,
+# ARGV[5] = '1' to leave an existing key untouched
+# Returns the new version, or 0 if nothing was written.
+_STORE_LUA = """
+if ARGV[5] == '1' and redis.call('HEXISTS', KEYS[1], ARGV[2]) == 1 then
+    return 0
+end
+redis.call('ZADD', KEYS[2], ARGV[3], ARGV[2])
+redis.call('HSET', KEYS[1], ARGV[2], ARGV[4])
+""" + _TRIM_SNIPPET + """
+return redis.call('INCR', KEYS[3])
+"""
+
+# Removes one entry and bumps the version atomically.
+# KEYS as above, ARGV[1] = key. Returns 1 if the entry existed.
+_REMOVE_LUA = """
+local removed = redis.call('HDEL', KEYS[1], ARGV[1])
+redis.call('ZREM', KEYS[2], ARGV[1])
+redis.call('INCR', KEYS[3])
+return removed
+"""
+
+# Deletes every entry; the version is bumped rather than deleted so stale
+# near caches never match. KEYS as above.
+_CLEAR_LUA = """
+redis.call('DEL', KEYS[1], KEYS[2])
+return redis.call('INCR', KEYS[3])
+"""
 
 class RedisMemory(BaseMemoryProvider):
     """
@@ -11,6 +98,21 @@ class RedisMemory(BaseMemoryProvider):
     
     The memory store is provider-agnostic and stores raw data without making
     assumptions about the format needed by specific LLM providers.
+    
+    With ``near_cache`` enabled, ``get_messages`` is served from process
+    memory while the namespace's version key is unchanged. Every write bumps
+    the version atomically, and writes made by this instance are applied to
+    the near cache directly.
+    
+    Values are stored as tagged binary payloads (see ``PayloadSerializer``).
+    Timestamps are not stored per entry; they come from the index scores.
+    Entries written as JSON by earlier versions are still read.
+    
+    Each ``session_id`` gets its own hash-tagged keyspace, so a busy provider
+    is spread over many small keys instead of one hot hash. With
+    ``cluster=True`` the memory talks to Redis Cluster; the keys a script
+    touches always share a slot. Atomic updates use Lua scripts rather than
+    MULTI/EXEC, which redis-py cluster pipelines do not support.
     """
     
     def __init__(
@@ -19,7 +121,14 @@ class RedisMemory(BaseMemoryProvider):
         port: int = 6379, 
         db: int = 0, 
         capacity: int = 100, 
-        provider_id: Optional[str] = None
+        provider_id: Optional[str] = None,
+        read_batch_size: int = 500,
+        pool_registry: Optional[RedisPoolRegistry] = None,
+        near_cache: bool = False,
+        near_cache_ttl: Optional[float] = None,
+        serializer: Optional[PayloadSerializer] = None,
+        session_id: Optional[str] = None,
+        cluster: bool = False
     ):
         """Initialize Redis memory with connection parameters.
         
@@ -29,24 +138,153 @@ class RedisMemory(BaseMemoryProvider):
             db: Redis database number (default: 0)
             capacity: Maximum number of items to store (default: 100)
             provider_id: Optional provider identifier
+            read_batch_size: Maximum fields per HMGET when reading many entries
+            pool_registry: Registry to borrow connections from (default: the
+                process-wide registry shared by all RedisMemory instances)
+            near_cache: Cache history reads in process memory (default: False)
+            near_cache_ttl: Optional seconds during which cached history is
+                served without checking the version key. Suits sticky
+                sessions where this process is the only writer.
+            serializer: Payload serializer (default: compact JSON, with zlib
+                for payloads over 1 KiB; pass ``PayloadSerializer(codec=MsgpackCodec())``
+                to opt into msgpack)
+            session_id: Optional session identifier scoping the keyspace
+            cluster: Connect to Redis Cluster through ``host`` and ``port``
+                as a startup node (default: False)
         """
         self.capacity = capacity
-        self.memory_key_prefix = f"grami_memory:{provider_id or 'default'}:"
+        self.read_batch_size = read_batch_size
+        self.provider_id = provider_id
+        self.session_id = session_id
+        self.cluster = cluster
+        self.memory_key_prefix = memory_key_prefix(provider_id, session_id, hash_tag=cluster)
+        self.hash_key = f"{self.memory_key_prefix}memory"
+        self.index_key = f"{self.memory_key_prefix}memory_index"
+        self.version_key = f"{self.memory_key_prefix}memory_version"
         self._host = host
         self._port = port
         self._db = db
+        self._pool_registry = pool_registry or default_pool_registry
+        self.serializer = serializer or PayloadSerializer()
         self._redis_client = None
+        self._store_script = None
+        self._trim_script = None
+        self._remove_script = None
+        self._clear_script = None
+        self.near_cache = near_cache
+        self.near_cache_ttl = near_cache_ttl
+        self.near_cache_hits = 0
+        self.near_cache_misses = 0
+        self._invalidate_near_cache()
+    
+    def for_session(self, session_id: str) -> "RedisMemory":
+        """Create a memory for another session with the same settings.
+        
+        Args:
+            session_id: Session identifier
+            
+        Returns:
+            RedisMemory scoped to the session's keyspace
+        """
+        memory = RedisMemory(
+            host=self._host,
+            port=self._port,
+            db=self._db,
+            capacity=self.capacity,
+            provider_id=self.provider_id,
+            read_batch_size=self.read_batch_size,
+            pool_registry=self._pool_registry,
+            near_cache=self.near_cache,
+            near_cache_ttl=self.near_cache_ttl,
+            serializer=self.serializer,
+            session_id=session_id,
+            cluster=self.cluster
+        )
+        memory._redis_client = self._redis_client
+        return memory
+    
+    def _script_keys(self) -> List[str]:
+        """Keys every script touches: memory hash, memory index and version."""
+        return [self.hash_key, self.index_key, self.version_key]
+    
+    def _invalidate_near_cache(self) -> None:
+        """Forget cached history so the next read goes to Redis."""
+        self._near_cache_entries: Optional["OrderedDict[str, Any]"] = None
+        self._near_cache_version: Optional[int] = None
+        self._near_cache_checked = 0.0
+    
+    def _apply_near_cache_write(self, key: str, value: Any, version: int) -> None:
+        """Apply this instance's write to the near cache if no one else wrote since."""
+        entries = self._near_cache_entries
+        if entries is None or self._near_cache_version != version - 1:
+            self._invalidate_near_cache()
+            return
+        entries.pop(key, None)
+        entries[key] = value
+        while len(entries) > self.capacity:
+            entries.popitem(last=False)
+        self._near_cache_version = version
+        self._near_cache_checked = time.monotonic()
+    
+    @staticmethod
+    def _decode_key(key: Union[bytes, str]) -> str:
+        return key.decode('utf-8') if isinstance(key, bytes) else key
+    
+    @staticmethod
+    def _timestamp(score: float) -> str:
+        """Convert an index score back to an ISO timestamp."""
+        return datetime.fromtimestamp(score, timezone.utc).isoformat()
+    
+    @staticmethod
+    def _is_message(value: Any) -> bool:
+        return isinstance(value, dict) and 'role' in value and 'content' in value
     
     async def _get_redis_client(self):
-        """Lazily initialize and return Redis client."""
+        """Lazily initialize and return a Redis client backed by the shared pool."""
         if self._redis_client is None:
-            self._redis_client = await aioredis.from_url(
-                f"redis://{self._host}:{self._port}/{self._db}",
-                encoding="utf-8",
-                decode_responses=True
-            )
+            if self.cluster:
+                self._redis_client = self._pool_registry.get_cluster_client(self._host, self._port)
+            else:
+                self._redis_client = self._pool_registry.get_client(self._host, self._port, self._db)
+        if self._store_script is None:
+            # Scripts run via EVALSHA and are reloaded transparently on NOSCRIPT
+            self._store_script = self._redis_client.register_script(_STORE_LUA)
+            self._trim_script = self._redis_client.register_script(_TRIM_LUA)
+            self._remove_script = self._redis_client.register_script(_REMOVE_LUA)
+            self._clear_script = self._redis_client.register_script(_CLEAR_LUA)
         return self._redis_client
     
+    async def _fetch_entries(self, keys: List[str]) -> List[Any]:
+        """Fetch and decode many entries in a single round trip.
+        
+        Keys are split into HMGET batches of ``read_batch_size`` that are sent
+        together in one pipeline, so latency does not grow with the number
+        of keys.
+        
+        Args:
+            keys: Storage keys to fetch
+            
+        Returns:
+            Decoded values in key order, ``_MISSING`` for keys that no longer exist
+        """
+        if not keys:
+            return []
+        redis = await self._get_redis_client()
+        
+        pipeline = redis.pipeline(transaction=False)
+        for start in range(0, len(keys), self.read_batch_size):
+            pipeline.hmget(
+                self.hash_key,
+                keys[start:start + self.read_batch_size]
+            )
+        batches = await pipeline.execute()
+        
+        return [
+            self.serializer.loads(payload) if payload is not None else _MISSING
+            for batch in batches
+            for payload in batch
+        ]
+    
     async def add(self, key: str, value: Any) -> None:
         """Store a value in Redis memory.
         
@@ -78,47 +316,39 @@ class RedisMemory(BaseMemoryProvider):
         """
         redis = await self._get_redis_client()
         
-        # Remove from memory hash
-        removed_count = await redis.hdel(
-            f"{self.memory_key_prefix}memory", 
-            key
-        )
-        
-        # Remove from sorted set
-        await redis.zrem(
-            f"{self.memory_key_prefix}memory_index", 
-            key
-        )
+        # Remove from memory hash and sorted set, invalidating near caches
+        removed_count = await self._remove_script(keys=self._script_keys(), args=[key], client=redis)
+        self._invalidate_near_cache()
         
         return bool(removed_count)
     
     async def clear(self) -> None:
         """Clear all items from Redis memory."""
         redis = await self._get_redis_client()
-        await redis.delete(
-            f"{self.memory_key_prefix}memory", 
-            f"{self.memory_key_prefix}memory_index"
-        )
+        await self._clear_script(keys=self._script_keys(), client=redis)
+        self._invalidate_near_cache()
     
-    async def get_recent_items(self, limit: int = 10) -> List[Dict[str, Any]]:
-        """Get most recently used items.
-        
-        Args:
-            limit: Maximum number of items to return
-            
-        Returns:
-            List of recent items with their values
-        """
-        return await self.get_recent_items(limit)
-    
-    async def add_message(self, message: Dict[str, Any]) -> None:
+    async def add_message(
+        self,
+        message: Optional[Dict[str, Any]] = None,
+        role: Optional[str] = None,
+        content: Optional[Any] = None,
+        message_id: Optional[str] = None
+    ) -> None:
         """Add a message to memory.
         
         Args:
             message: Message dictionary containing role and content
+            role: Role of the message sender, when ``message`` is not given
+            content: Content of the message, when ``message`` is not given
+            message_id: Optional stable ID; adding the same ID again is a no-op
         """
-        key = f"message_{datetime.now(timezone.utc).timestamp()}"
-        await self.add(key, message)
+        if message is None:
+            message = {"role": role, "content": content}
+        if message_id is None:
+            await self.store(f"message_{uuid.uuid4().hex}", message)
+        else:
+            await self._store(f"message_{message_id}", message, only_new=True)
     
     async def list_contents(self) -> List[Dict[str, Any]]:
         """List all contents in memory.
@@ -128,56 +358,35 @@ class RedisMemory(BaseMemoryProvider):
         """
         redis = await self._get_redis_client()
         
-        # Get all keys from memory hash
-        keys = await redis.hkeys(f"{self.memory_key_prefix}memory")
-        
-        # Retrieve details for each key
-        contents = []
-        for key in keys:
-            serialized_value = await redis.hget(
-                f"{self.memory_key_prefix}memory", 
-                key
-            )
-            
-            if serialized_value:
-                memory_item = json.loads(serialized_value)
-                contents.append({
-                    'key': key,
-                    **memory_item
-                })
-        
-        return contents
+        hash_key, index_key, _ = self._script_keys()
+        
+        # Fetch every value and its index score in a single round trip; an
+        # entry written in between just comes back without a timestamp
+        pipeline = redis.pipeline(transaction=not self.cluster)
+        pipeline.hgetall(hash_key)
+        pipeline.zrange(index_key, 0, -1, withscores=True)
+        entries, scored_keys = await pipeline.execute()
+        scores = dict(scored_keys)
+        
+        return [
+            {
+                'key': self._decode_key(key),
+                'value': self.serializer.loads(payload),
+                'timestamp': self._timestamp(scores[key]) if key in scores else None
+            }
+            for key, payload in entries.items()
+        ]
     
     async def _trim_to_capacity(self) -> None:
         """Trim memory to the specified capacity."""
         redis = await self._get_redis_client()
-        
-        # Get total number of items
-        total_items = await redis.zcard(
-            f"{self.memory_key_prefix}memory_index"
+        removed = await self._trim_script(
+            keys=self._script_keys(),
+            args=[self.capacity],
+            client=redis
         )
-        
-        # If over capacity, remove oldest items
-        if total_items > self.capacity:
-            # Get keys to remove
-            keys_to_remove = await redis.zrange(
-                f"{self.memory_key_prefix}memory_index", 
-                0, 
-                total_items - self.capacity - 1
-            )
-            
-            # Remove from memory hash
-            if keys_to_remove:
-                await redis.hdel(
-                    f"{self.memory_key_prefix}memory", 
-                    *keys_to_remove
-                )
-                
-                # Remove from sorted set
-                await redis.zrem(
-                    f"{self.memory_key_prefix}memory_index", 
-                    *keys_to_remove
-                )
+        if removed:
+            self._invalidate_near_cache()
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -187,8 +396,15 @@ class RedisMemory(BaseMemoryProvider):
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
         if self._redis_client:
-            await self._redis_client.close()
+            # Only releases this client; the shared pool stays open. Cluster
+            # clients are shared as a whole and stay open too.
+            if not self.cluster:
+                await self._redis_client.aclose()
             self._redis_client = None
+            self._store_script = None
+            self._trim_script = None
+            self._remove_script = None
+            self._clear_script = None
     
     async def store(self, key: str, value: Any) -> None:
         """Store a value in Redis memory.
@@ -197,29 +413,81 @@ class RedisMemory(BaseMemoryProvider):
             key: Storage key
             value: Value to store
         """
+        await self._store(key, value)
+    
+    async def _store(self, key: str, value: Any, only_new: bool = False) -> None:
+        """Store a value, optionally leaving an existing key untouched."""
         redis = await self._get_redis_client()
         
-        # Store with timestamp
-        data = {
-            'value': value,
-            'timestamp': datetime.now(timezone.utc).isoformat()
-        }
+        # The index score doubles as the entry's timestamp
+        payload = self.serializer.dumps(value)
         
-        # Store in sorted set for ordering
-        await redis.zadd(
-            f"{self.memory_key_prefix}memory_index", 
-            {key: datetime.now(timezone.utc).timestamp()}
+        # Index, store and trim to capacity in a single atomic round trip
+        version = await self._store_script(
+            keys=self._script_keys(),
+            args=[self.capacity, key, time.time(), payload, '1' if only_new else '0'],
+            client=redis
         )
+        if self.near_cache and version:
+            self._apply_near_cache_write(key, value, int(version))
+    
+    async def store_many(self, items: List[Tuple[str, Any]]) -> None:
+        """Store several values in order with a single round trip.
         
-        # Store actual data
-        await redis.hset(
-            f"{self.memory_key_prefix}memory", 
-            key, 
-            json.dumps(data)
-        )
+        Each value is written and trimmed by its own script call, so the
+        result matches calling ``store`` for every item.
+        
+        Args:
+            items: (key, value) pairs to store, oldest first
+        """
+        await self._store_many([(key, value, False) for key, value in items])
+    
+    async def add_messages(self, messages: List[Dict[str, Any]]) -> None:
+        """Add several messages in order with a single round trip.
+        
+        The result matches calling ``add_message`` for every item.
+        
+        Args:
+            messages: Keyword arguments of ``add_message`` for each message
+                (``message`` or ``role``/``content``, optional ``message_id``), oldest first
+        """
+        items = []
+        for arguments in messages:
+            message = arguments.get('message')
+            if message is None:
+                message = {"role": arguments.get('role'), "content": arguments.get('content')}
+            message_id = arguments.get('message_id')
+            if message_id is None:
+                items.append((f"message_{uuid.uuid4().hex}", message, False))
+            else:
+                items.append((f"message_{message_id}", message, True))
+        await self._store_many(items)
+    
+    async def _store_many(self, items: List[Tuple[str, Any, bool]]) -> None:
+        """Store (key, value, only_new) items in order with a single round trip."""
+        if not items:
+            return
+        if self.cluster:
+            for key, value, only_new in items:
+                await self._store(key, value, only_new=only_new)
+            return
+        
+        redis = await self._get_redis_client()
+        pipeline = redis.pipeline(transaction=False)
+        now = time.time()
+        for offset, (key, value, only_new) in enumerate(items):
+            # Distinct scores keep the batch in order within the index
+            await self._store_script(
+                keys=self._script_keys(),
+                args=[self.capacity, key, now + offset * 1e-6, self.serializer.dumps(value), '1' if only_new else '0'],
+                client=pipeline
+            )
+        versions = await pipeline.execute()
         
-        # Trim to capacity
-        await self._trim_to_capacity()
+        if self.near_cache:
+            for (key, value, _), version in zip(items, versions):
+                if version:
+                    self._apply_near_cache_write(key, value, int(version))
     
     async def retrieve(self, key: str) -> Optional[Any]:
         """Retrieve a value from Redis memory.
@@ -233,12 +501,12 @@ class RedisMemory(BaseMemoryProvider):
         redis = await self._get_redis_client()
         
         data = await redis.hget(
-            f"{self.memory_key_prefix}memory", 
+            self.hash_key, 
             key
         )
         
-        if data:
-            return json.loads(data)['value']
+        if data is not None:
+            return self.serializer.loads(data)
         return None
     
     async def get_recent_items(self, limit: int = 10) -> List[Dict[str, Any]]:
@@ -248,28 +516,26 @@ class RedisMemory(BaseMemoryProvider):
             limit: Maximum number of items to return
             
         Returns:
-            List of recent items with their values
+            List of recent items with their values and timestamps
         """
         redis = await self._get_redis_client()
         
-        # Get recent keys
-        keys = await redis.zrevrange(
-            f"{self.memory_key_prefix}memory_index",
+        # Get recent keys with their timestamps
+        scored_keys = await redis.zrevrange(
+            self.index_key,
             0,
-            limit - 1
+            limit - 1,
+            withscores=True
         )
         
-        # Retrieve values
-        items = []
-        for key in keys:
-            value = await self.retrieve(key)
-            if value:
-                items.append({
-                    'key': key,
-                    'value': value
-                })
+        # Retrieve values in one batched round trip
+        values = await self._fetch_entries([key for key, _ in scored_keys])
         
-        return items
+        return [
+            {'key': self._decode_key(key), 'value': value, 'timestamp': self._timestamp(score)}
+            for (key, score), value in zip(scored_keys, values)
+            if value is not _MISSING
+        ]
     
     async def list_keys(self, pattern: Optional[str] = None) -> List[str]:
         """List all keys in memory.
@@ -281,7 +547,8 @@ class RedisMemory(BaseMemoryProvider):
             List of all keys
         """
         redis = await self._get_redis_client()
-        return await redis.hkeys(f"{self.memory_key_prefix}memory")
+        keys = await redis.hkeys(self.hash_key)
+        return [self._decode_key(key) for key in keys]
     
     async def get_size(self) -> int:
         """Get current number of items in memory.
@@ -290,7 +557,7 @@ class RedisMemory(BaseMemoryProvider):
             Number of stored items
         """
         redis = await self._get_redis_client()
-        return await redis.hlen(f"{self.memory_key_prefix}memory")
+        return await redis.hlen(self.hash_key)
     
     async def validate_configuration(self, config: Dict[str, Any]) -> bool:
         """Validate the configuration for the provider.
@@ -315,24 +582,63 @@ class RedisMemory(BaseMemoryProvider):
         Returns:
             List of messages with role and content
         """
+        if self.near_cache:
+            return await self._get_near_cached_messages()
+        
         redis = await self._get_redis_client()
         
         # Get recent keys in chronological order
         keys = await redis.zrange(
-            f"{self.memory_key_prefix}memory_index",
+            self.index_key,
             0,
             -1
         )
         
-        # Retrieve messages
-        messages = []
-        for key in keys:
-            value = await self.get(key)
-            if value and isinstance(value, dict) and 'role' in value and 'content' in value:
-                messages.append(value)
+        # Retrieve messages in one batched round trip
+        values = await self._fetch_entries(keys)
         
-        return messages
-
+        return [value for value in values if self._is_message(value)]
+    
+    async def _get_near_cached_messages(self) -> List[Dict[str, Any]]:
+        """Serve messages from the near cache, revalidating against the version key."""
+        redis = await self._get_redis_client()
+        hash_key, index_key, version_key = self._script_keys()
+        
+        if self._near_cache_entries is not None:
+            fresh = (
+                self.near_cache_ttl is not None
+                and time.monotonic() - self._near_cache_checked < self.near_cache_ttl
+            )
+            if not fresh:
+                version = int(await redis.get(version_key) or 0)
+                fresh = version == self._near_cache_version
+                if fresh:
+                    self._near_cache_checked = time.monotonic()
+            if fresh:
+                self.near_cache_hits += 1
+                return [value for value in self._near_cache_entries.values() if self._is_message(value)]
+        
+        self.near_cache_misses += 1
+        
+        # Read the version before the index; any later write bumps it past the
+        # cached one, so the cache is at worst refreshed once too often. Cluster
+        # pipelines cannot be transactional, and need not be for this order.
+        pipeline = redis.pipeline(transaction=not self.cluster)
+        pipeline.get(version_key)
+        pipeline.zrange(index_key, 0, -1)
+        version, keys = await pipeline.execute()
+        values = await self._fetch_entries(keys)
+        
+        self._near_cache_entries = OrderedDict(
+            (self._decode_key(key), value)
+            for key, value in zip(keys, values)
+            if value is not _MISSING
+        )
+        self._near_cache_version = int(version or 0)
+        self._near_cache_checked = time.monotonic()
+        
+        return [value for value in self._near_cache_entries.values() if self._is_message(value)]
+    
     async def delete(self, key: str) -> None:
         """Delete a key from Redis memory.
         
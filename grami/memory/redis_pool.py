@@ -0,0 +1,219 @@
+import asyncio
+import time
+import weakref
+from typing import Any, Dict, Optional, Tuple
+
+import redis.asyncio as aioredis
+from redis.asyncio.cluster import RedisCluster
+
+PoolKey = Tuple[str, int, int]
+
+
+class InstrumentedConnectionPool(aioredis.BlockingConnectionPool):
+    """
+    Blocking connection pool that records saturation metrics.
+
+    When every connection is checked out, callers wait for one to be released
+    (up to ``timeout`` seconds) instead of opening more sockets.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.acquisitions = 0
+        self.waits = 0
+        self.wait_time = 0.0
+
+    async def get_connection(self, *args, **kwargs):
+        self.acquisitions += 1
+        saturated = self.in_use >= self.max_connections
+        started = time.perf_counter()
+        connection = await super().get_connection(*args, **kwargs)
+        if saturated:
+            self.waits += 1
+            self.wait_time += time.perf_counter() - started
+        self.in_use += 1
+        self.peak_in_use = max(self.peak_in_use, self.in_use)
+        return connection
+
+    async def release(self, connection):
+        self.in_use -= 1
+        await super().release(connection)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get pool usage metrics.
+
+        Returns:
+            Dictionary with connection counts, waits and saturation ratio
+        """
+        return {
+            'max_connections': self.max_connections,
+            'in_use': self.in_use,
+            'peak_in_use': self.peak_in_use,
+            'acquisitions': self.acquisitions,
+            'waits': self.waits,
+            'wait_time': self.wait_time,
+            'saturation': self.in_use / self.max_connections
+        }
+
+
+class RedisPoolRegistry:
+    """
+    Process-wide registry of Redis connection pools keyed by host, port and db.
+
+    Memory instances borrow clients backed by a shared pool, so creating one
+    memory object per session does not open new sockets. Pools are kept per
+    event loop, because asyncio connections cannot move between loops.
+
+    Responses are returned as raw bytes, since memory payloads are binary.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 50,
+        timeout: Optional[float] = 20,
+        health_check_interval: int = 30,
+        **connection_kwargs: Any
+    ):
+        """Initialize the registry.
+
+        Args:
+            max_connections: Maximum connections per pool (default: 50)
+            timeout: Seconds to wait for a free connection (default: 20, None waits forever)
+            health_check_interval: Seconds of idleness after which a connection
+                is pinged before reuse (default: 30)
+            **connection_kwargs: Extra keyword arguments for every pool
+        """
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+        self.connection_kwargs = connection_kwargs
+        self._pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[PoolKey, InstrumentedConnectionPool]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._clusters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, int], RedisCluster]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def configure(self, **settings: Any) -> None:
+        """Update settings used for pools created from now on.
+
+        Args:
+            **settings: max_connections, timeout, health_check_interval or
+                extra connection keyword arguments
+        """
+        for name in ('max_connections', 'timeout', 'health_check_interval'):
+            if name in settings:
+                setattr(self, name, settings.pop(name))
+        self.connection_kwargs.update(settings)
+
+    def _loop_pools(self) -> Dict[PoolKey, InstrumentedConnectionPool]:
+        return self._pools.setdefault(asyncio.get_running_loop(), {})
+
+    def get_pool(self, host: str = 'localhost', port: int = 6379, db: int = 0) -> InstrumentedConnectionPool:
+        """Get the shared pool for a server, creating it on first use.
+
+        Args:
+            host: Redis server host
+            port: Redis server port
+            db: Redis database number
+
+        Returns:
+            Connection pool for the running event loop
+        """
+        pools = self._loop_pools()
+        key = (host, port, db)
+        pool = pools.get(key)
+        if pool is None:
+            pool = InstrumentedConnectionPool(
+                host=host,
+                port=port,
+                db=db,
+                max_connections=self.max_connections,
+                timeout=self.timeout,
+                health_check_interval=self.health_check_interval,
+                **self.connection_kwargs
+            )
+            pools[key] = pool
+        return pool
+
+    def get_client(self, host: str = 'localhost', port: int = 6379, db: int = 0) -> aioredis.Redis:
+        """Get a client that borrows connections from the shared pool.
+
+        Closing the client does not close the pool.
+
+        Args:
+            host: Redis server host
+            port: Redis server port
+            db: Redis database number
+
+        Returns:
+            Redis client
+        """
+        return aioredis.Redis(connection_pool=self.get_pool(host, port, db))
+
+    def get_cluster_client(self, host: str = 'localhost', port: int = 6379) -> RedisCluster:
+        """Get the shared Redis Cluster client for a startup node.
+
+        The cluster client keeps one pool per node, of up to
+        ``max_connections`` connections each.
+
+        Args:
+            host: Host of any cluster node
+            port: Port of that node
+
+        Returns:
+            Redis Cluster client for the running event loop
+        """
+        clusters = self._clusters.setdefault(asyncio.get_running_loop(), {})
+        client = clusters.get((host, port))
+        if client is None:
+            client = RedisCluster(
+                host=host,
+                port=port,
+                max_connections=self.max_connections,
+                health_check_interval=self.health_check_interval
+            )
+            clusters[(host, port)] = client
+        return client
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get usage metrics for every pool of the running event loop.
+
+        Returns:
+            Dictionary mapping ``host:port/db`` to pool metrics
+        """
+        return {
+            f"{host}:{port}/{db}": pool.stats()
+            for (host, port, db), pool in self._loop_pools().items()
+        }
+
+    async def health_check(self) -> Dict[str, bool]:
+        """Ping every pool of the running event loop.
+
+        Returns:
+            Dictionary mapping ``host:port/db`` to whether the server answered
+        """
+        results = {}
+        for (host, port, db), pool in list(self._loop_pools().items()):
+            client = aioredis.Redis(connection_pool=pool)
+            try:
+                results[f"{host}:{port}/{db}"] = bool(await client.ping())
+            except Exception:
+                results[f"{host}:{port}/{db}"] = False
+        return results
+
+    async def close(self) -> None:
+        """Disconnect and forget every pool and cluster client of the running event loop."""
+        loop = asyncio.get_running_loop()
+        pools = self._pools.pop(loop, {})
+        for pool in pools.values():
+            await pool.disconnect()
+        clusters = self._clusters.pop(loop, {})
+        for client in clusters.values():
+            await client.aclose()
+
+
+# Registry shared by every RedisMemory that is not given its own
+default_pool_registry = RedisPoolRegistry()
@@ -0,0 +1,383 @@
+import time
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional, Union
+
+from redis.exceptions import ResponseError
+
+from ..memory.base import BaseMemoryProvider
+from .codecs import PayloadSerializer
+from .redis_memory import memory_key_prefix
+from .redis_pool import RedisPoolRegistry, default_pool_registry
+
+# Appends a message unless its ID was seen among the last ``capacity`` IDs.
+# KEYS[1] = stream, KEYS[2] = message ID index
+# ARGV[1] = capacity, ARGV[2] = message ID, ARGV[3] = score, ARGV[4] = key, ARGV[5] = data
+# Returns the stream ID, or nil for a duplicate.
+_APPEND_ONCE_LUA = """
+if redis.call('ZADD', KEYS[2], 'NX', ARGV[3], ARGV[2]) == 0 then
+    return false
+end
+redis.call('ZREMRANGEBYRANK', KEYS[2], 0, -tonumber(ARGV[1]) - 1)
+return redis.call('XADD', KEYS[1], 'MAXLEN', '~', ARGV[1], '*', 'key', ARGV[4], 'value', ARGV[5])
+"""
+
+
+class RedisStreamMemory(BaseMemoryProvider):
+    """
+    Redis Streams-backed conversation log.
+
+    Every item is appended to a single stream with ``XADD ... MAXLEN ~``, so
+    appends are O(1) amortized and capping needs no extra commands. Stream
+    IDs are assigned by Redis and never collide, even for writes in the same
+    millisecond. Recent items are read newest first with ``XREVRANGE``.
+
+    Other workers can tail a conversation through consumer groups
+    (``create_consumer_group``, ``read_group`` and ``ack``).
+
+    Key lookups (``get``, ``remove``) scan the log, so this layout suits
+    append-only histories; use ``RedisMemory`` for key-value access.
+    """
+
+    def __init__(
+        self,
+        host: str = 'localhost',
+        port: int = 6379,
+        db: int = 0,
+        capacity: int = 100,
+        provider_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        pool_registry: Optional[RedisPoolRegistry] = None,
+        serializer: Optional[PayloadSerializer] = None,
+        cluster: bool = False
+    ):
+        """Initialize stream memory with connection parameters.
+
+        Args:
+            host: Redis server host (default: localhost)
+            port: Redis server port (default: 6379)
+            db: Redis database number (default: 0)
+            capacity: Number of entries to keep; older ones are trimmed
+                approximately, reads never return more (default: 100)
+            provider_id: Optional provider identifier
+            session_id: Optional session identifier scoping the stream
+            pool_registry: Registry to borrow connections from (default: the
+                process-wide registry)
+            serializer: Payload serializer (default: PayloadSerializer())
+            cluster: Connect to Redis Cluster through ``host`` and ``port``
+        """
+        self.capacity = capacity
+        self.provider_id = provider_id
+        self.session_id = session_id
+        self.cluster = cluster
+        prefix = memory_key_prefix(provider_id, session_id, hash_tag=cluster)
+        self.stream_key = f"{prefix}stream"
+        self.message_ids_key = f"{prefix}stream_message_ids"
+        self.serializer = serializer or PayloadSerializer()
+        self._host = host
+        self._port = port
+        self._db = db
+        self._pool_registry = pool_registry or default_pool_registry
+        self._redis_client = None
+        self._append_once_script = None
+
+    async def _get_redis_client(self):
+        """Lazily initialize and return a Redis client backed by the shared pool."""
+        if self._redis_client is None:
+            if self.cluster:
+                self._redis_client = self._pool_registry.get_cluster_client(self._host, self._port)
+            else:
+                self._redis_client = self._pool_registry.get_client(self._host, self._port, self._db)
+        if self._append_once_script is None:
+            self._append_once_script = self._redis_client.register_script(_APPEND_ONCE_LUA)
+        return self._redis_client
+
+    @staticmethod
+    def _decode(value: Union[bytes, str]) -> str:
+        return value.decode('utf-8') if isinstance(value, bytes) else value
+
+    def _decode_entry(self, entry_id: Union[bytes, str], fields: Dict[Any, Any]) -> Dict[str, Any]:
+        """Turn a raw stream entry into a memory item."""
+        entry_id = self._decode(entry_id)
+        milliseconds = int(entry_id.split('-')[0])
+        fields = {self._decode(name): value for name, value in fields.items()}
+        return {
+            'id': entry_id,
+            'key': self._decode(fields['key']),
+            'value': self.serializer.loads(fields['value']),
+            'timestamp': datetime.fromtimestamp(milliseconds / 1000, timezone.utc).isoformat()
+        }
+
+    async def _entries(self) -> List[Dict[str, Any]]:
+        """Entries within capacity, oldest first."""
+        redis = await self._get_redis_client()
+        # MAXLEN ~ may keep a few extra entries; reads cap them exactly
+        entries = await redis.xrevrange(self.stream_key, count=self.capacity)
+        return [self._decode_entry(entry_id, fields) for entry_id, fields in reversed(entries)]
+
+    async def append(self, key: str, value: Any) -> str:
+        """Append an item to the log.
+
+        Args:
+            key: Item key
+            value: Value to store
+
+        Returns:
+            Stream ID of the new entry
+        """
+        redis = await self._get_redis_client()
+        entry_id = await redis.xadd(
+            self.stream_key,
+            {'key': key, 'value': self.serializer.dumps(value)},
+            maxlen=self.capacity,
+            approximate=True
+        )
+        return self._decode(entry_id)
+
+    async def add(self, key: str, value: Any) -> None:
+        """Append an item to the log.
+
+        Args:
+            key: Item key
+            value: Value to store
+        """
+        await self.append(key, value)
+
+    async def store(self, key: str, value: Any) -> None:
+        """Append an item to the log.
+
+        Args:
+            key: Item key
+            value: Value to store
+        """
+        await self.append(key, value)
+
+    async def add_message(
+        self,
+        message: Optional[Dict[str, Any]] = None,
+        role: Optional[str] = None,
+        content: Optional[Any] = None,
+        message_id: Optional[str] = None
+    ) -> Optional[str]:
+        """Add a message to the conversation log.
+
+        Args:
+            message: Message dictionary containing role and content
+            role: Role of the message sender, when ``message`` is not given
+            content: Content of the message, when ``message`` is not given
+            message_id: Optional stable ID; an ID seen among the last
+                ``capacity`` messages is not appended again
+
+        Returns:
+            Stream ID of the message, or None for a duplicate
+        """
+        if message is None:
+            message = {'role': role, 'content': content}
+        if message_id is None:
+            return await self.append('message', message)
+
+        redis = await self._get_redis_client()
+        entry_id = await self._append_once_script(
+            keys=[self.stream_key, self.message_ids_key],
+            args=[self.capacity, message_id, time.time(), 'message', self.serializer.dumps(message)],
+            client=redis
+        )
+        return self._decode(entry_id) if entry_id is not None else None
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Retrieve the latest value appended under a key.
+
+        Args:
+            key: Item key
+
+        Returns:
+            The stored value or None if not found
+        """
+        for entry in reversed(await self._entries()):
+            if entry['key'] == key:
+                return entry['value']
+        return None
+
+    async def retrieve(self, key: str) -> Optional[Any]:
+        """Retrieve the latest value appended under a key.
+
+        Args:
+            key: Item key
+
+        Returns:
+            The stored value or None if not found
+        """
+        return await self.get(key)
+
+    async def remove(self, key: str) -> bool:
+        """Remove every entry appended under a key.
+
+        Args:
+            key: Key of the entries to remove
+
+        Returns:
+            True if any entry was removed, False if not found
+        """
+        entry_ids = [entry['id'] for entry in await self._entries() if entry['key'] == key]
+        if not entry_ids:
+            return False
+        redis = await self._get_redis_client()
+        return bool(await redis.xdel(self.stream_key, *entry_ids))
+
+    async def delete(self, key: str) -> None:
+        """Remove every entry appended under a key.
+
+        Args:
+            key: Key of the entries to remove
+        """
+        await self.remove(key)
+
+    async def clear(self) -> None:
+        """Delete the log, including its consumer groups."""
+        redis = await self._get_redis_client()
+        await redis.delete(self.stream_key, self.message_ids_key)
+
+    async def get_recent_items(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Get the most recent entries, newest first.
+
+        Args:
+            limit: Maximum number of items to return
+
+        Returns:
+            List of items with id, key, value and timestamp
+        """
+        redis = await self._get_redis_client()
+        entries = await redis.xrevrange(self.stream_key, count=min(limit, self.capacity))
+        return [self._decode_entry(entry_id, fields) for entry_id, fields in entries]
+
+    async def get_messages(self) -> List[Dict[str, Any]]:
+        """Get all messages in chronological order.
+
+        Returns:
+            List of messages with role and content
+        """
+        return [
+            entry['value'] for entry in await self._entries()
+            if isinstance(entry['value'], dict) and 'role' in entry['value'] and 'content' in entry['value']
+        ]
+
+    async def list_contents(self) -> List[Dict[str, Any]]:
+        """List all entries in memory, oldest first.
+
+        Returns:
+            List of items with id, key, value and timestamp
+        """
+        return await self._entries()
+
+    async def list_keys(self, pattern: Optional[str] = None) -> List[str]:
+        """List the distinct keys in memory.
+
+        Args:
+            pattern: Optional pattern to filter keys (not implemented)
+
+        Returns:
+            List of keys in order of first appearance
+        """
+        return list(dict.fromkeys(entry['key'] for entry in await self._entries()))
+
+    async def get_size(self) -> int:
+        """Get current number of entries in memory.
+
+        Returns:
+            Number of stored entries, at most capacity
+        """
+        redis = await self._get_redis_client()
+        return min(await redis.xlen(self.stream_key), self.capacity)
+
+    async def create_consumer_group(self, group: str, start_id: str = '$') -> bool:
+        """Create a consumer group on the log.
+
+        Args:
+            group: Group name
+            start_id: First entry the group delivers; '$' for new entries
+                only, '0' for the whole log (default: '$')
+
+        Returns:
+            True if the group was created, False if it already existed
+        """
+        redis = await self._get_redis_client()
+        try:
+            await redis.xgroup_create(self.stream_key, group, id=start_id, mkstream=True)
+        except ResponseError as e:
+            if 'BUSYGROUP' not in str(e):
+                raise
+            return False
+        return True
+
+    async def read_group(
+        self,
+        group: str,
+        consumer: str,
+        count: int = 10,
+        block: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Read entries not yet delivered to the group.
+
+        Args:
+            group: Group name
+            consumer: Name of the reading worker
+            count: Maximum number of entries to read (default: 10)
+            block: Milliseconds to wait for new entries (default: don't wait)
+
+        Returns:
+            List of items with id, key, value and timestamp
+        """
+        redis = await self._get_redis_client()
+        response = await redis.xreadgroup(
+            group, consumer, {self.stream_key: '>'}, count=count, block=block
+        )
+        return [
+            self._decode_entry(entry_id, fields)
+            for _, entries in response or []
+            for entry_id, fields in entries
+        ]
+
+    async def ack(self, group: str, *entry_ids: str) -> int:
+        """Acknowledge entries processed by a consumer of the group.
+
+        Args:
+            group: Group name
+            *entry_ids: Stream IDs returned by ``read_group``
+
+        Returns:
+            Number of entries acknowledged
+        """
+        if not entry_ids:
+            return 0
+        redis = await self._get_redis_client()
+        return await redis.xack(self.stream_key, group, *entry_ids)
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self._get_redis_client()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        if self._redis_client:
+            # The shared pool and cluster clients stay open
+            if not self.cluster:
+                await self._redis_client.aclose()
+            self._redis_client = None
+            self._append_once_script = None
+
+    async def validate_configuration(self, config: Dict[str, Any]) -> bool:
+        """Validate the configuration for the provider.
+
+        Args:
+            config: Configuration dictionary containing connection details
+
+        Returns:
+            True if configuration is valid, False otherwise
+        """
+        return (
+            isinstance(config.get('host', 'localhost'), str) and
+            isinstance(config.get('port', 6379), int) and
+            isinstance(config.get('db', 0), int) and
+            isinstance(config.get('capacity', 100), int) and
+            config.get('capacity', 100) > 0
+        )
@@ -0,0 +1,405 @@
+import asyncio
+import logging
+import weakref
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from ..memory.base import BaseMemoryProvider, accepts_message_ids
+
+logger = logging.getLogger(__name__)
+
+# Queue marker that ends the batch being collected so a flush is not delayed
+_FLUSH = object()
+
+
+class WriteBehindMemory(BaseMemoryProvider):
+    """
+    Applies writes to a memory provider in the background.
+
+    Writes (``add``, ``store``, ``add_message``) are queued and applied in
+    order by a single worker task, so callers do not wait for the backend.
+    Reads flush the queue first and therefore always see earlier writes.
+
+    Durability modes:
+
+    - ``fire_and_forget``: return once queued; queued writes are applied as
+      soon as the worker gets to them.
+    - ``batched``: return once queued; the worker waits up to
+      ``flush_interval`` to collect up to ``batch_size`` writes and applies
+      consecutive ``store`` calls with the backend's ``store_many`` and
+      consecutive ``add_message`` calls with its ``add_messages`` when it
+      has them (one round trip each for ``RedisMemory``).
+    - ``ack``: return once the backend has applied the write; errors are
+      raised to the caller.
+
+    The queue holds at most ``max_queue_size`` writes; further writes wait
+    for room. Failed background writes are logged and counted in
+    ``failed_writes``. Call ``flush`` or ``aclose`` before shutdown.
+
+    ``for_session`` returns the backend's session memory wrapped with the
+    same settings; closing this wrapper also closes those.
+    """
+
+    MODES = ('fire_and_forget', 'batched', 'ack')
+
+    # Backend methods that apply a run of writes of one kind in one go
+    BATCH_METHODS = {'store': 'store_many', 'add_message': 'add_messages'}
+
+    def __init__(
+        self,
+        memory: Any,
+        mode: str = 'batched',
+        max_queue_size: int = 1000,
+        batch_size: int = 50,
+        flush_interval: float = 0.05
+    ):
+        """Initialize the write-behind wrapper.
+
+        Args:
+            memory: Memory provider to write to
+            mode: 'fire_and_forget', 'batched' or 'ack' (default: 'batched')
+            max_queue_size: Maximum number of queued writes (default: 1000)
+            batch_size: Maximum writes applied per batch (default: 50)
+            flush_interval: Seconds to wait for a batch to fill in batched mode (default: 0.05)
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unsupported write mode: {mode}. Expected one of {self.MODES}")
+        self.memory = memory
+        self.mode = mode
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.written = 0
+        self.failed_writes = 0
+        self.last_error: Optional[BaseException] = None
+        self._unapplied = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._session_memories: "weakref.WeakSet[WriteBehindMemory]" = weakref.WeakSet()
+
+    @classmethod
+    def from_config(cls, memory: Any, config: Optional[Dict[str, Any]]) -> Any:
+        """Wrap a memory provider according to agent configuration.
+
+        Reads ``memory_write_mode``, ``memory_write_queue_size``,
+        ``memory_write_batch_size`` and ``memory_write_flush_interval``.
+
+        Args:
+            memory: Memory provider, or None
+            config: Agent configuration dictionary
+
+        Returns:
+            The wrapped memory, or ``memory`` unchanged if no write mode is
+            configured or it is already wrapped
+        """
+        mode = (config or {}).get('memory_write_mode')
+        if memory is None or not mode or mode == 'sync' or isinstance(memory, cls):
+            return memory
+        return cls(
+            memory,
+            mode=mode,
+            max_queue_size=config.get('memory_write_queue_size', 1000),
+            batch_size=config.get('memory_write_batch_size', 50),
+            flush_interval=config.get('memory_write_flush_interval', 0.05)
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose the wrapped memory's other attributes (capacity, ...)
+        if name in ('memory', '_session_memories'):
+            raise AttributeError(name)
+        value = getattr(self.memory, name)
+        if name == 'for_session':
+            # Session memories must not bypass the write queue
+            return self._for_session
+        return value
+
+    def _for_session(self, session_id: str) -> "WriteBehindMemory":
+        """Wrap the backend's memory for another session with the same settings.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            WriteBehindMemory around the backend's session memory
+        """
+        memory = WriteBehindMemory(
+            self.memory.for_session(session_id),
+            mode=self.mode,
+            max_queue_size=self.max_queue_size,
+            batch_size=self.batch_size,
+            flush_interval=self.flush_interval
+        )
+        self._session_memories.add(memory)
+        return memory
+
+    @property
+    def supports_message_ids(self) -> bool:
+        """Whether the wrapped memory's ``add_message`` takes a ``message_id``."""
+        return accepts_message_ids(self.memory)
+
+    @property
+    def pending(self) -> int:
+        """Number of writes queued but not yet applied."""
+        return self._unapplied
+
+    def _ensure_worker(self) -> asyncio.Queue:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+        return self._queue
+
+    async def _enqueue(self, method: str, *args: Any, **kwargs: Any) -> None:
+        queue = self._ensure_worker()
+        future = asyncio.get_running_loop().create_future() if self.mode == 'ack' else None
+        self._unapplied += 1
+        try:
+            await queue.put((method, args, kwargs, future))
+        except BaseException:
+            self._unapplied -= 1
+            raise
+        if future is not None:
+            await future
+
+    async def _next_batch(self) -> List[Any]:
+        """Wait for the next write and collect a batch behind it."""
+        queue = self._queue
+        batch = [await queue.get()]
+        if batch[0] is _FLUSH:
+            return batch
+
+        if self.mode == 'batched':
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    operation = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                batch.append(operation)
+                if operation is _FLUSH:
+                    break
+        else:
+            # Take whatever is already queued without waiting for more
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            operations = [operation for operation in batch if operation is not _FLUSH]
+            try:
+                await self._apply(operations)
+            finally:
+                self._unapplied -= len(operations)
+                for _ in batch:
+                    self._queue.task_done()
+
+    @staticmethod
+    def _batch_item(method: str, args: tuple, kwargs: dict) -> Optional[Any]:
+        """Argument describing a write to the backend's batch method, or None if it cannot be batched."""
+        if method == 'store' and len(args) == 2 and not kwargs:
+            return args
+        if method == 'add_message' and not args:
+            return kwargs
+        return None
+
+    async def _apply(self, batch: List[Tuple[str, tuple, dict, Optional[asyncio.Future]]]) -> None:
+        """Apply writes in order, grouping consecutive writes of one kind when supported."""
+        index = 0
+        while index < len(batch):
+            method, args, kwargs, _ = batch[index]
+            write_many = None
+            if self.mode == 'batched' and method in self.BATCH_METHODS:
+                write_many = getattr(self.memory, self.BATCH_METHODS[method], None)
+            if write_many is not None and self._batch_item(method, args, kwargs) is not None:
+                end = index
+                while (end < len(batch) and batch[end][0] == method
+                       and self._batch_item(*batch[end][:3]) is not None):
+                    end += 1
+                group = batch[index:end]
+                await self._settle(group, lambda: write_many([self._batch_item(*operation[:3]) for operation in group]))
+                index = end
+            else:
+                await self._settle([batch[index]], lambda: getattr(self.memory, method)(*args, **kwargs))
+                index += 1
+
+    async def _settle(self, operations: List[Any], write: Callable[[], Awaitable[Any]]) -> None:
+        """Run a backend write and report its outcome to every operation."""
+        try:
+            await write()
+        except Exception as e:
+            self.failed_writes += len(operations)
+            self.last_error = e
+            for *_, future in operations:
+                if future is None:
+                    logger.error(f"Background memory write failed: {e}")
+                elif not future.done():
+                    future.set_exception(e)
+            return
+        self.written += len(operations)
+        for *_, future in operations:
+            if future is not None and not future.done():
+                future.set_result(None)
+
+    async def flush(self) -> None:
+        """Wait until every queued write has been applied."""
+        if not self._unapplied:
+            return
+        self._ensure_worker()
+        await self._queue.put(_FLUSH)
+        await self._queue.join()
+
+    async def aclose(self) -> None:
+        """Flush pending writes and stop the worker, and those of session memories."""
+        for memory in list(self._session_memories):
+            await memory.aclose()
+        await self.flush()
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.aclose()
+
+    async def add(self, key: str, value: Any) -> None:
+        """Queue a value to be stored.
+
+        Args:
+            key: Storage key
+            value: Value to store
+        """
+        await self._enqueue('store', key, value)
+
+    async def store(self, key: str, value: Any, *args: Any, **kwargs: Any) -> None:
+        """Queue a value to be stored.
+
+        Args:
+            key: Storage key
+            value: Value to store
+            *args: Extra arguments for the backend's store (e.g. expiry)
+            **kwargs: Extra keyword arguments for the backend's store
+        """
+        await self._enqueue('store', key, value, *args, **kwargs)
+
+    async def add_message(self, *args: Any, **kwargs: Any) -> None:
+        """Queue a message to be added, with the backend's signature.
+
+        Args:
+            *args: Arguments for the backend's add_message
+            **kwargs: Keyword arguments for the backend's add_message
+        """
+        await self._enqueue('add_message', *args, **kwargs)
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Retrieve a value after applying pending writes.
+
+        Args:
+            key: Storage key
+
+        Returns:
+            The stored value or None if not found
+        """
+        await self.flush()
+        return await self.memory.get(key)
+
+    async def retrieve(self, key: str) -> Optional[Any]:
+        """Retrieve a value after applying pending writes.
+
+        Args:
+            key: Storage key
+
+        Returns:
+            The stored value or None if not found
+        """
+        await self.flush()
+        return await self.memory.retrieve(key)
+
+    async def remove(self, key: str) -> bool:
+        """Remove an item after applying pending writes.
+
+        Args:
+            key: Key of the item to remove
+
+        Returns:
+            True if item was removed, False if not found
+        """
+        await self.flush()
+        return await self.memory.remove(key)
+
+    async def delete(self, key: str) -> None:
+        """Delete a key after applying pending writes.
+
+        Args:
+            key: Storage key to delete
+        """
+        await self.flush()
+        await self.memory.delete(key)
+
+    async def clear(self) -> None:
+        """Clear all items after applying pending writes."""
+        await self.flush()
+        await self.memory.clear()
+
+    async def get_recent_items(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Get most recently used items after applying pending writes.
+
+        Args:
+            limit: Maximum number of items to return
+
+        Returns:
+            List of recent items with their metadata
+        """
+        await self.flush()
+        return await self.memory.get_recent_items(limit)
+
+    async def get_messages(self) -> List[Dict[str, Any]]:
+        """Get all messages after applying pending writes.
+
+        Returns:
+            List of messages with role and content
+        """
+        await self.flush()
+        return await self.memory.get_messages()
+
+    async def list_contents(self) -> Any:
+        """List all contents after applying pending writes.
+
+        Returns:
+            The backend's listing of stored items
+        """
+        await self.flush()
+        return await self.memory.list_contents()
+
+    async def list_keys(self, pattern: Optional[str] = None) -> List[str]:
+        """List all keys after applying pending writes.
+
+        Args:
+            pattern: Optional pattern to filter keys
+
+        Returns:
+            List of all keys
+        """
+        await self.flush()
+        return await self.memory.list_keys(pattern)
+
+    async def get_size(self) -> int:
+        """Get the number of stored items after applying pending writes.
+
+        Returns:
+            Number of stored items
+        """
+        await self.flush()
+        return await self.memory.get_size()
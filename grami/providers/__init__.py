@@ -1,9 +1,26 @@
 from .openai_provider import OpenAIProvider
 from .gemini_provider import GeminiProvider
 from .fallback_provider import SimpleLLMProvider
+from .wrapper import ProviderWrapper
+from .coalescing import CoalescingProvider
+from .response_cache import BaseResponseCache, MemoryResponseCache, RedisResponseCache, CachingProvider
+from .retry import RetryPolicy, HedgePolicy, hedged_call
+from .token_counter import BaseTokenCounter, HeuristicTokenCounter, CachedTokenCounter
 
 __all__ = [
     'OpenAIProvider',
     'GeminiProvider',
-    'SimpleLLMProvider'
+    'SimpleLLMProvider',
+    'ProviderWrapper',
+    'CoalescingProvider',
+    'CachingProvider',
+    'BaseResponseCache',
+    'MemoryResponseCache',
+    'RedisResponseCache',
+    'RetryPolicy',
+    'HedgePolicy',
+    'hedged_call',
+    'BaseTokenCounter',
+    'HeuristicTokenCounter',
+    'CachedTokenCounter'
 ]
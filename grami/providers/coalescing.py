@@ -0,0 +1,183 @@
+import asyncio
+import logging
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Tuple
+
+from ..core.base import BaseLLMProvider
+from .request_key import provider_state, request_key
+from .wrapper import ProviderWrapper
+
+
+class _StreamFanout:
+    """
+    One upstream token stream shared by any number of subscribers.
+
+    Chunks are buffered as they arrive; every subscriber replays the buffer
+    from the start, so callers that join mid-stream still see the whole
+    response.
+    """
+
+    def __init__(self, source: AsyncGenerator[str, None]):
+        self._chunks: List[str] = []
+        self._done = False
+        self._error: Optional[BaseException] = None
+        self._changed = asyncio.Condition()
+        self._task = asyncio.ensure_future(self._pump(source))
+
+    async def _pump(self, source: AsyncGenerator[str, None]) -> None:
+        try:
+            async for chunk in source:
+                async with self._changed:
+                    self._chunks.append(chunk)
+                    self._changed.notify_all()
+        except Exception as e:
+            self._error = e
+        finally:
+            async with self._changed:
+                self._done = True
+                self._changed.notify_all()
+
+    @property
+    def done(self) -> bool:
+        return self._done
+
+    async def subscribe(self) -> AsyncGenerator[str, None]:
+        position = 0
+        while True:
+            async with self._changed:
+                await self._changed.wait_for(lambda: position < len(self._chunks) or self._done)
+                chunks = self._chunks[position:]
+                finished = self._done
+            for chunk in chunks:
+                yield chunk
+            position += len(chunks)
+            if finished and position == len(self._chunks):
+                break
+        if self._error is not None:
+            raise self._error
+
+
+class CoalescingProvider(ProviderWrapper):
+    """
+    Single-flight layer in front of an LLM provider.
+
+    Concurrent requests with the same key (normalized prompt plus model,
+    generation config, system prompt, history and call arguments) share one
+    upstream call: ``send_message`` callers all receive the same response and
+    ``stream_message`` subscribers fan out from one token stream. Requests are
+    only merged while the first one is in flight; nothing is cached after it
+    completes.
+
+    The provider state (model, config, history) is snapshotted when a
+    session goes from idle to busy and reused for keys until its last
+    upstream call finishes, so an in-flight call updating the history does
+    not split identical requests. Coalesced requests count as a single turn
+    for providers that keep conversation history.
+    """
+
+    def __init__(
+        self,
+        provider: BaseLLMProvider,
+        key_func: Optional[Callable[..., str]] = None
+    ):
+        """
+        Initialize the coalescing wrapper.
+
+        :param provider: Provider to wrap
+        :param key_func: Optional function ``(provider, message, context, **kwargs) -> str``
+            used instead of ``request_key``; it is called with the live
+            provider, without a state snapshot
+        """
+        super().__init__(provider)
+        self.key_func = key_func
+        self.upstream_calls = 0
+        self.coalesced_calls = 0
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._streams: Dict[str, _StreamFanout] = {}
+        # Session -> [provider state snapshot, upstream calls running for it]
+        self._states: Dict[Optional[str], List[Any]] = {}
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct upstream calls currently running."""
+        return len(self._inflight) + len(self._streams)
+
+    def _key(self, message: Any, context: Optional[Dict], kwargs: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+        """Key a request, using the session's state snapshot while it has calls in flight."""
+        if self.key_func is not None:
+            return self.key_func(self.provider, message, context, **kwargs), None
+        session_id = kwargs.get("session_id")
+        snapshot = self._states.get(session_id)
+        state = snapshot[0] if snapshot else provider_state(self.provider, session_id)
+        return request_key(self.provider, message, context, state=state, **kwargs), state
+
+    def _hold_state(self, session_id: Optional[str], state: Optional[str]) -> None:
+        if state is None:
+            return
+        snapshot = self._states.setdefault(session_id, [state, 0])
+        snapshot[1] += 1
+
+    def _release_state(self, session_id: Optional[str], state: Optional[str]) -> None:
+        snapshot = self._states.get(session_id)
+        if state is None or snapshot is None:
+            return
+        snapshot[1] -= 1
+        if not snapshot[1]:
+            del self._states[session_id]
+
+    async def send_message(self, message: Dict[str, str], context: Optional[Dict] = None, **kwargs) -> str:
+        """
+        Send a message, sharing the upstream call with identical in-flight requests.
+
+        :param message: Message to send
+        :param context: Optional context dictionary
+        :return: Response from the provider
+        """
+        key, state = self._key(message, context, kwargs)
+        session_id = kwargs.get("session_id")
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self.provider.send_message(message, context, **kwargs))
+            self._inflight[key] = task
+            self._hold_state(session_id, state)
+            task.add_done_callback(lambda done: self._finish(key, done, session_id, state))
+            self.upstream_calls += 1
+        else:
+            self.coalesced_calls += 1
+        # A caller giving up must not cancel the call for everyone else
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Future, session_id: Optional[str], state: Optional[str]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        self._release_state(session_id, state)
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.debug(f"Coalesced request failed: {task.exception()}")
+
+    async def stream_message(self, message: Dict[str, str], context: Optional[Dict] = None, **kwargs):
+        """
+        Stream a message, fanning out one upstream token stream to identical requests.
+
+        :param message: Message to send
+        :param context: Optional context dictionary
+        :yield: Streamed response tokens
+        """
+        key, state = self._key(message, context, kwargs)
+        session_id = kwargs.get("session_id")
+        fanout = self._streams.get(key)
+        if fanout is None or fanout.done:
+            fanout = _StreamFanout(self.provider.stream_message(message, context, **kwargs))
+            self._streams[key] = fanout
+            self._hold_state(session_id, state)
+
+            def finish(_, fanout=fanout):
+                if self._streams.get(key) is fanout:
+                    del self._streams[key]
+                self._release_state(session_id, state)
+
+            fanout._task.add_done_callback(finish)
+            self.upstream_calls += 1
+        else:
+            self.coalesced_calls += 1
+        async for chunk in fanout.subscribe():
+            yield chunk
@@ -2,12 +2,41 @@ import google.generativeai as genai
 from google.generativeai import GenerativeModel
 from google.generativeai.types import GenerationConfig
 import asyncio
+import functools
 import re
+from collections import OrderedDict
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Union, Any, Callable
 import logging
 import uuid
+from ..memory.base import store_message
 from ..core.base import BaseLLMProvider
+from .retry import HedgePolicy, RetryPolicy, hedged_call
+from .token_counter import BaseTokenCounter, CachedTokenCounter
+
+class _ChatSession:
+    """Per-conversation state: chat session, history and its Gemini buffer."""
+
+    __slots__ = ("session_id", "chat", "history", "gemini_history", "gemini_history_synced", "memory", "in_use", "_lock")
+
+    def __init__(self, session_id: Optional[str], history: Optional[List[Dict[str, Any]]] = None):
+        self.session_id = session_id
+        self.chat = None
+        self.history = history or []
+        self.gemini_history = []
+        self.gemini_history_synced = 0
+        self.memory = None
+        # Requests holding the session; pinned sessions are never evicted
+        self.in_use = 0
+        self._lock = None
+
+    @property
+    def lock(self) -> asyncio.Lock:
+        # Created lazily so it binds to the loop that first uses it
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
 
 class GeminiProvider(BaseLLMProvider):
     """Provider for Google's Gemini API."""
@@ -26,6 +55,12 @@ class GeminiProvider(BaseLLMProvider):
         model: str = "gemini-pro",
         generation_config: Optional[Dict] = None,
         safety_settings: Optional[List[Dict[str, str]]] = None,
+        token_counter: Optional[BaseTokenCounter] = None,
+        max_function_call_rounds: int = 5,
+        max_sessions: int = 1000,
+        session_store: Optional[Any] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
     ):
         """Initialize the Gemini provider with model configuration.
         
@@ -33,6 +68,16 @@ class GeminiProvider(BaseLLMProvider):
         :param model: Model name to use (default: gemini-pro)
         :param generation_config: Optional generation configuration for controlling model behavior
         :param safety_settings: Optional custom safety settings to override defaults
+        :param token_counter: Optional local token counter used for history trimming
+        :param max_function_call_rounds: Maximum tool-call round trips per request
+        :param max_sessions: Maximum live conversations; the least recently used
+            one is evicted beyond this
+        :param session_store: Optional memory backend (anything with ``store`` and
+            ``retrieve``, optionally ``delete``) that keeps evicted session
+            histories until they are restored
+        :param retry_policy: Backoff policy for transient errors (default: RetryPolicy())
+        :param hedge_policy: Optional policy for racing rephrased prompts against
+            slow requests; without one, rephrasings run only after a RECITATION error
         """
         genai.configure(api_key=api_key)
         
@@ -45,10 +90,172 @@ class GeminiProvider(BaseLLMProvider):
             generation_config=GenerationConfig(**(generation_config or {})),
             safety_settings=model_safety_settings
         )
-        self._chat = None
-        self._history = []
+        # Conversations share the model; the default session serves calls without a session ID
+        self._default_session = _ChatSession(None)
+        self._sessions: "OrderedDict[str, _ChatSession]" = OrderedDict()
+        self._pending_evictions: Dict[str, asyncio.Future] = {}
+        self._max_sessions = max_sessions
+        self._session_store = session_store
         self._memory_provider = None
         self._tools = []
+        self._token_counter = token_counter or CachedTokenCounter()
+        self._max_function_call_rounds = max_function_call_rounds
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._hedge_policy = hedge_policy
+
+    # The default session's state, under the attribute names used before sessions existed
+    @property
+    def _chat(self) -> Any:
+        return self._default_session.chat
+
+    @_chat.setter
+    def _chat(self, chat: Any) -> None:
+        self._default_session.chat = chat
+
+    @property
+    def _history(self) -> List[Dict[str, Any]]:
+        return self._default_session.history
+
+    @_history.setter
+    def _history(self, history: List[Dict[str, Any]]) -> None:
+        # Keep the Gemini buffer and chat in step, as set_history does
+        self.set_history(history)
+
+    @property
+    def _gemini_history(self) -> List[Any]:
+        return self._default_session.gemini_history
+
+    @property
+    def _gemini_history_synced(self) -> int:
+        return self._default_session.gemini_history_synced
+
+    @property
+    def active_sessions(self) -> int:
+        """Number of live conversations besides the default one."""
+        return len(self._sessions)
+
+    @staticmethod
+    def _session_key(session_id: str) -> str:
+        return f"gemini_session:{session_id}"
+
+    def _get_session_nowait(self, session_id: Optional[str], pin: bool = False) -> _ChatSession:
+        """Get a live session, creating an empty one if needed (no restore).
+
+        :param session_id: Session identifier, or None for the default session
+        :param pin: Whether to pin the session until ``_release_session``
+        :return: The session
+        """
+        if session_id is None:
+            session = self._default_session
+        else:
+            session = self._sessions.get(session_id)
+            if session is None:
+                session = self._sessions[session_id] = _ChatSession(session_id)
+            else:
+                self._sessions.move_to_end(session_id)
+        if pin:
+            session.in_use += 1
+        self._evict_sessions()
+        return session
+
+    async def _get_session(self, session_id: Optional[str]) -> _ChatSession:
+        """Get a live session pinned for a request, restoring it from the session store if it was evicted.
+
+        Pinned sessions are not evicted; release the session with
+        ``_release_session`` once the request is done.
+
+        :param session_id: Session identifier, or None for the default session
+        :return: The session
+        """
+        if session_id is None or session_id in self._sessions:
+            return self._get_session_nowait(session_id, pin=True)
+
+        history = None
+        pending = self._pending_evictions.get(session_id)
+        if pending is not None:
+            await asyncio.shield(pending)
+        if self._session_store is not None:
+            try:
+                history = await self._session_store.retrieve(self._session_key(session_id))
+            except Exception as e:
+                logging.warning(f"Failed to restore session {session_id}: {e}")
+
+        # Another request may have created the session while we were waiting
+        if session_id in self._sessions or not history:
+            return self._get_session_nowait(session_id, pin=True)
+
+        session = self._sessions[session_id] = _ChatSession(session_id, list(history))
+        session.in_use += 1
+        self._evict_sessions()
+        if hasattr(self._session_store, "delete"):
+            # The live session is the only copy now; a stale one must never be restored later
+            try:
+                await self._session_store.delete(self._session_key(session_id))
+            except Exception as e:
+                logging.warning(f"Failed to delete restored session {session_id} from the store: {e}")
+        return session
+
+    def _release_session(self, session: _ChatSession) -> None:
+        """Unpin a session taken with ``_get_session``, evicting sessions that were kept for it."""
+        session.in_use -= 1
+        self._evict_sessions()
+
+    def _evict_sessions(self) -> None:
+        """Evict least recently used idle sessions beyond ``max_sessions``.
+
+        The most recently used session is always kept. Pinned sessions met
+        at the head are moved to the tail and evicted after their release.
+        """
+        for _ in range(len(self._sessions) - 1):
+            if len(self._sessions) <= self._max_sessions:
+                break
+            session_id, session = self._sessions.popitem(last=False)
+            if session.in_use:
+                self._sessions[session_id] = session
+                continue
+            if self._session_store is not None and session.history:
+                self._persist_evicted(session)
+
+    def _persist_evicted(self, session: _ChatSession) -> None:
+        """Save an evicted session's history in the background."""
+        session_id = session.session_id
+
+        async def persist():
+            try:
+                await self._session_store.store(self._session_key(session_id), session.history)
+            except Exception as e:
+                logging.warning(f"Failed to persist evicted session {session_id}: {e}")
+            finally:
+                if self._pending_evictions.get(session_id) is task:
+                    del self._pending_evictions[session_id]
+
+        try:
+            task = asyncio.get_running_loop().create_task(persist())
+        except RuntimeError:
+            logging.warning(f"Evicted session {session_id} outside an event loop; its history was dropped")
+            return
+        self._pending_evictions[session_id] = task
+
+    async def end_session(self, session_id: str) -> None:
+        """Drop a conversation, including any copy in the session store.
+
+        :param session_id: Session identifier
+        """
+        self._sessions.pop(session_id, None)
+        pending = self._pending_evictions.get(session_id)
+        if pending is not None:
+            await asyncio.shield(pending)
+        if self._session_store is not None and hasattr(self._session_store, "delete"):
+            await self._session_store.delete(self._session_key(session_id))
+
+    def _session_memory(self, session: _ChatSession) -> Any:
+        """Memory provider for a session, scoped to it when the memory supports sessions."""
+        if self._memory_provider is None or session.session_id is None:
+            return self._memory_provider
+        if session.memory is None:
+            for_session = getattr(self._memory_provider, "for_session", None)
+            session.memory = for_session(session.session_id) if for_session else self._memory_provider
+        return session.memory
 
     def set_tools(self, tools: List[Callable]) -> None:
         """Set the available tools for the provider.
@@ -90,249 +297,415 @@ class GeminiProvider(BaseLLMProvider):
                     return f"Tool {tool_name} failed with error: {str(e)}"
         return f"Tool {tool_name} not found"
 
+    @staticmethod
+    def _message_text(msg: Dict[str, Any]) -> str:
+        """Extract the text content of a history message."""
+        return msg["content"] if isinstance(msg["content"], str) else msg["content"].get("text", "")
+
     def _transform_history_for_gemini(self, history: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Transform history into Gemini's format."""
         transformed = []
         for msg in history:
             if msg["role"] not in ["user", "model"]:
                 continue
-            content = msg["content"] if isinstance(msg["content"], str) else msg["content"].get("text", "")
             transformed.append({
                 "role": msg["role"],
-                "parts": [{"text": content}]
+                "parts": [{"text": self._message_text(msg)}]
             })
         return transformed
 
+    def _reset_gemini_history(self, session: Optional[_ChatSession] = None) -> None:
+        """Drop the transformed history buffer so it is rebuilt from the session history."""
+        session = session or self._default_session
+        session.gemini_history = []
+        session.gemini_history_synced = 0
+
+    def _sync_gemini_history(self, session: Optional[_ChatSession] = None) -> List[Any]:
+        """Bring the transformed history buffer up to date with the session history.
+
+        The buffer is append-only: only messages added since the last sync are
+        converted, and each is converted to a ``Content`` proto exactly once.
+
+        :param session: Session to sync (default: the default session)
+        :return: The transformed history buffer
+        """
+        session = session or self._default_session
+        if session.gemini_history_synced > len(session.history):
+            # History was truncated or replaced behind our back
+            self._reset_gemini_history(session)
+
+        for msg in session.history[session.gemini_history_synced:]:
+            if msg["role"] not in ["user", "model"]:
+                continue
+            session.gemini_history.append(genai.protos.Content(
+                role=msg["role"],
+                parts=[genai.protos.Part(text=self._message_text(msg))]
+            ))
+        session.gemini_history_synced = len(session.history)
+        return session.gemini_history
+
+    def _prepare_chat(self, session: Optional[_ChatSession] = None) -> Any:
+        """Start the session's chat or point it at the synced history.
+
+        :param session: Session to prepare (default: the default session)
+        :return: The session's chat
+        """
+        session = session or self._default_session
+        history = self._sync_gemini_history(session)
+        if not session.chat:
+            session.chat = self._model.start_chat(history=history)
+        else:
+            # Content protos are passed through as-is, so this only copies references
+            session.chat.history = history
+        return session.chat
+
+    def _count_message_tokens(self, msg: Dict[str, Any]) -> int:
+        """Count the tokens a history message contributes to the prompt."""
+        if msg["role"] not in ["user", "model"]:
+            return 0
+        return self._token_counter.count(self._message_text(msg))
+
     def _prioritize_messages(self, history: List[Dict[str, Any]], max_tokens: int = 1500, base_recent: int = 30) -> List[Dict[str, Any]]:
-        """Prioritize messages based on recency and token limits."""
+        """Prioritize messages based on recency and token limits.
+
+        Token counts come from the local token counter, so trimming never
+        makes a network call.
+        """
         if not history:
             return []
 
         # Always keep most recent messages
-        prioritized = history[-base_recent:]
-        
-        # Count tokens for recent messages
-        transformed = self._transform_history_for_gemini(prioritized)
-        total_tokens = self._model.count_tokens(transformed).total_tokens
+        recent = history[-base_recent:]
+        total_tokens = sum(self._count_message_tokens(msg) for msg in recent)
         
         # Add older messages if space allows
+        older = []
         for msg in reversed(history[:-base_recent]):
-            msg_tokens = self._model.count_tokens(self._transform_history_for_gemini([msg])).total_tokens
+            msg_tokens = self._count_message_tokens(msg)
             if total_tokens + msg_tokens <= max_tokens:
-                prioritized.insert(0, msg)
+                older.append(msg)
                 total_tokens += msg_tokens
             else:
                 break
                 
-        return prioritized
+        older.reverse()
+        return older + recent
+
+    async def calibrate_token_counter(self, samples: Optional[List[str]] = None, max_samples: int = 5) -> Optional[float]:
+        """Calibrate the local token counter against the Gemini tokenizer.
+
+        This costs one ``count_tokens`` call per sample and only needs to run
+        once per model.
+
+        :param samples: Texts to calibrate with (default: the most recent history messages)
+        :param max_samples: Maximum number of history messages to sample
+        :return: The fitted scale factor, or None if the counter cannot be calibrated
+        """
+        if not hasattr(self._token_counter, "calibrate"):
+            return None
+        if samples is None:
+            samples = [
+                self._message_text(msg)
+                for msg in self._history[-max_samples:]
+                if msg["role"] in ["user", "model"]
+            ]
+
+        measured = []
+        for text in samples:
+            if not text:
+                continue
+            response = await self._model.count_tokens_async(text)
+            measured.append((text, response.total_tokens))
+
+        if not measured:
+            return None
+        return self._token_counter.calibrate(measured)
+
+    def set_history(self, history: List[Dict[str, Any]], session_id: Optional[str] = None) -> None:
+        """Set the conversation history.
 
-    def set_history(self, history: List[Dict[str, Any]]) -> None:
-        """Set the conversation history."""
-        self._history = history
-        if self._chat and history:
-            transformed = self._transform_history_for_gemini(history)
-            self._chat.history = transformed
+        :param history: List of message dictionaries
+        :param session_id: Optional session identifier (default: the default session)
+        """
+        session = self._get_session_nowait(session_id)
+        session.history = history
+        self._reset_gemini_history(session)
+        if session.chat and history:
+            session.chat.history = self._sync_gemini_history(session)
+
+    def _prompt_attempts(self, chat: Any, prompts: List[str]) -> List[Callable[[], Any]]:
+        """Build one attempt per prompt variant for ``hedged_call``.
+
+        The first prompt goes through the chat session. Alternatives may run
+        concurrently with it, so they call the model directly with a snapshot
+        of the chat history instead of sharing the chat's mutable state; the
+        chat is rebuilt from the session history before every turn anyway.
+
+        :param chat: Prepared chat session
+        :param prompts: Prompt variants in order of preference
+        :return: Attempt functions returning the response text
+        """
+        history = list(chat.history)
+
+        async def via_chat() -> str:
+            response = await chat.send_message_async(prompts[0])
+            return response.text
+
+        def via_model(prompt: str) -> Callable[[], Any]:
+            async def attempt() -> str:
+                contents = history + [genai.protos.Content(role="user", parts=[genai.protos.Part(text=prompt)])]
+                response = await self._model.generate_content_async(contents)
+                return response.text
+            return attempt
+
+        return [via_chat] + [via_model(prompt) for prompt in prompts[1:]]
 
     async def send_message(
         self,
         message: Union[str, Dict[str, str]],
-        context: Optional[Dict] = None
+        context: Optional[Dict] = None,
+        session_id: Optional[str] = None
     ) -> str:
-        """Send a message and get a response."""
+        """Send a message and get a response.
+
+        Concurrent calls for different sessions run in parallel; calls for the
+        same session are serialized.
+
+        :param message: Message to send
+        :param context: Optional context dictionary
+        :param session_id: Optional session identifier (default: the default session)
+        :return: Response text
+        """
         message_content = message if isinstance(message, str) else message.get('content', message.get('text', ''))
         
         # Add tools to the message if available
         if self._tools:
             message_content = message_content + self._format_tools_for_prompt()
             
+        session = await self._get_session(session_id)
         try:
-            # Initialize chat if needed
-            if not self._chat:
-                transformed_history = self._transform_history_for_gemini(self._history)
-                self._chat = self._model.start_chat(history=transformed_history)
-            else:
-                # Update chat history
-                transformed = self._transform_history_for_gemini(self._history)
-                self._chat.history = transformed
-
-            # Store user message
-            user_message = {"role": "user", "content": message_content}
-            self._history.append(user_message)
-            if self._memory_provider:
-                await self._memory_provider.add_message(role="user", content=message_content)
-
-            # Try different prompts if we get a RECITATION error
-            prompts = [
-                message_content,
-                f"Please provide a natural response to: {message_content}",
-                f"Respond naturally to this message: {message_content}",
-                f"As a helpful assistant, please respond to: {message_content}"
-            ]
-            
-            response_text = None
-            last_error = None
-            
-            for prompt in prompts:
-                try:
-                    response = await self._chat.send_message_async(prompt)
-                    if hasattr(response, 'text'):
-                        response_text = response.text
-                        break
-                except Exception as e:
-                    last_error = e
-                    if "RECITATION" not in str(e):
-                        raise
-                    continue
-            
-            if response_text is None:
-                if last_error:
-                    raise last_error
-                raise Exception("Failed to get a valid response after multiple attempts")
-
-            # Check for tool calls in the response
-            tool_call = self._extract_tool_call(response_text)
-            if tool_call:
-                tool_name, args = tool_call
-                tool_result = self._handle_tool_call(tool_name, args)
-                response_text = tool_result
-
-            # Store model response
-            model_message = {"role": "model", "content": response_text}
-            self._history.append(model_message)
-            if self._memory_provider:
-                await self._memory_provider.add_message(role="assistant", content=response_text)
-
-            return response_text
+            memory = self._session_memory(session)
+            async with session.lock:
+                # Initialize chat or sync it with newly added messages
+                chat = self._prepare_chat(session)
+
+                # Store user message
+                turn_id = uuid.uuid4().hex
+                user_message = {"role": "user", "content": message_content}
+                session.history.append(user_message)
+                if memory:
+                    await store_message(memory, "user", message_content, f"{turn_id}:user")
+
+                # Rephrased prompts are the fallback for RECITATION errors
+                prompts = [
+                    message_content,
+                    f"Please provide a natural response to: {message_content}",
+                    f"Respond naturally to this message: {message_content}",
+                    f"As a helpful assistant, please respond to: {message_content}"
+                ]
+                response_text = await hedged_call(
+                    self._prompt_attempts(chat, prompts),
+                    retry=self._retry_policy,
+                    hedge=self._hedge_policy,
+                    fallback_on=lambda e: "RECITATION" in str(e)
+                )
+
+                # Check for tool calls in the response
+                tool_call = self._extract_tool_call(response_text)
+                if tool_call:
+                    tool_name, args = tool_call
+                    tool_result = self._handle_tool_call(tool_name, args)
+                    response_text = tool_result
+
+                # Store model response
+                model_message = {"role": "model", "content": response_text}
+                session.history.append(model_message)
+                if memory:
+                    await store_message(memory, "assistant", response_text, f"{turn_id}:assistant")
+
+                return response_text
             
         except Exception as e:
             logging.error(f"Error in send_message: {str(e)}")
             raise
+        finally:
+            self._release_session(session)
 
     async def stream_message(
         self,
         message: Union[str, Dict[str, str]],
-        context: Optional[Dict] = None
+        context: Optional[Dict] = None,
+        session_id: Optional[str] = None
     ):
-        """Stream a message response."""
+        """Stream a message response.
+
+        :param message: Message to send
+        :param context: Optional context dictionary
+        :param session_id: Optional session identifier (default: the default session)
+        :yield: Response text chunks
+        """
         message_content = message if isinstance(message, str) else message.get('content', message.get('text', ''))
 
+        session = await self._get_session(session_id)
         try:
-            # Initialize chat if needed
-            if not self._chat:
-                transformed_history = self._transform_history_for_gemini(self._history)
-                self._chat = self._model.start_chat(history=transformed_history)
-            else:
-                # Update chat history
-                transformed = self._transform_history_for_gemini(self._history)
-                self._chat.history = transformed
-
-            # Store user message
-            user_message = {"role": "user", "content": message_content}
-            self._history.append(user_message)
-            if self._memory_provider:
-                await self._memory_provider.add_message(role="user", content=message_content)
-
-            # Send message with streaming enabled
-            response = await self._chat.send_message_async(message_content, stream=True)
-            full_response = []
-
-            # Stream chunks and collect them
-            async for chunk in response:
-                chunk_text = chunk.text
-                full_response.append(chunk_text)
-                yield chunk_text
-
-            # Store complete response after all chunks are received
-            complete_response = "".join(full_response)
-            model_message = {"role": "model", "content": complete_response}
-            self._history.append(model_message)
-            
-            # Add to memory only after all chunks are received
-            if self._memory_provider:
-                await self._memory_provider.add_message(role="assistant", content=complete_response)
+            memory = self._session_memory(session)
+            async with session.lock:
+                # Initialize chat or sync it with newly added messages
+                chat = self._prepare_chat(session)
+
+                # Store user message
+                turn_id = uuid.uuid4().hex
+                user_message = {"role": "user", "content": message_content}
+                session.history.append(user_message)
+                if memory:
+                    await store_message(memory, "user", message_content, f"{turn_id}:user")
+
+                # Send message with streaming enabled
+                response = await chat.send_message_async(message_content, stream=True)
+                full_response = []
+
+                # Stream chunks and collect them
+                async for chunk in response:
+                    chunk_text = chunk.text
+                    full_response.append(chunk_text)
+                    yield chunk_text
+
+                # Store complete response after all chunks are received
+                complete_response = "".join(full_response)
+                model_message = {"role": "model", "content": complete_response}
+                session.history.append(model_message)
+                
+                # Add to memory only after all chunks are received
+                if memory:
+                    await store_message(memory, "assistant", complete_response, f"{turn_id}:assistant")
 
         except Exception as e:
             logging.error(f"Error in stream_message: {str(e)}")
             raise
+        finally:
+            self._release_session(session)
+
+    async def initialize_conversation(self, system_instructions: str = None, session_id: Optional[str] = None) -> None:
+        """Initialize a new conversation with optional system instructions.
 
-    async def initialize_conversation(self, system_instructions: str = None) -> None:
-        """Initialize a new conversation with optional system instructions."""
-        self._chat = self._model.start_chat()
-        self._history = []
+        :param system_instructions: Optional system instructions
+        :param session_id: Optional session identifier (default: the default session)
+        """
+        session = self._get_session_nowait(session_id)
+        session.chat = self._model.start_chat()
+        session.history = []
+        self._reset_gemini_history(session)
         
         if system_instructions:
             # Add system instructions as the first message
-            self._history.append({
+            session.history.append({
                 "role": "system",
                 "content": system_instructions,
                 "timestamp": datetime.now(timezone.utc).isoformat()
             })
 
-    def get_history(self) -> List[Dict[str, Any]]:
+    def get_history(self, session_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get the current conversation history.
         
+        :param session_id: Optional session identifier (default: the default session)
         :return: List of message dictionaries
         """
-        return self._history.copy()
+        if session_id is not None and session_id not in self._sessions:
+            return []
+        return self._get_session_nowait(session_id).history.copy()
 
-    async def _process_function_calls(self, contents: List[Dict], is_streaming: bool = False) -> tuple:
+    @staticmethod
+    def _get_function_calls(response: Any) -> List[Any]:
+        """Extract the function calls requested in a model response."""
+        if not response.candidates:
+            return []
+        return [
+            part.function_call
+            for part in response.candidates[0].content.parts
+            if part.function_call
+        ]
+
+    async def _execute_function_call(self, function_call: Any) -> Any:
+        """
+        Execute a single function call and wrap its result for the model.
+
+        Sync tools run in the default executor so they do not block the event loop.
+
+        :param function_call: Function call requested by the model
+        :return: Function response part
+        """
+        function_name = function_call.name
+        function_args = dict(function_call.args)
+
+        tools = self._tools if isinstance(self._tools, dict) else {}
+        tool = tools.get(function_name)
+        if tool is None:
+            response = {"error": f"Tool {function_name} not found"}
+        else:
+            try:
+                if asyncio.iscoroutinefunction(tool):
+                    tool_result = await tool(**function_args)
+                else:
+                    loop = asyncio.get_running_loop()
+                    tool_result = await loop.run_in_executor(
+                        None, functools.partial(tool, **function_args)
+                    )
+                response = {"result": tool_result}
+            except Exception as e:
+                logging.error(f"Error executing tool {function_name}: {e}")
+                response = {"error": str(e)}
+
+        return genai.protos.Part(
+            function_response=genai.protos.FunctionResponse(
+                name=function_name,
+                response=response
+            )
+        )
+
+    async def _process_function_calls(
+        self,
+        contents: List[Dict],
+        is_streaming: bool = False,
+        max_rounds: Optional[int] = None
+    ) -> tuple:
         """
         Process function calls in the model's response.
+
+        Every round trip uses the async client. The function calls requested in
+        a single response run concurrently, and rounds repeat until the model
+        answers with text or ``max_rounds`` is reached.
         
         :param contents: Conversation contents
         :param is_streaming: Whether the response is streaming or not
+        :param max_rounds: Maximum number of tool-call rounds (default: max_function_call_rounds)
         :return: Tuple of updated contents and final response text
         """
-        # Generate content with tools
-        response = self._model.generate_content(
-            contents=contents,
-            stream=False  # Always use non-streaming for predictable function call handling
-        )
-        
-        # Check if the response contains a function call
-        function_calls = [
-            part.function_call 
-            for part in response.candidates[0].content.parts 
-            if part.function_call
-        ]
-        
-        # Process function calls manually
-        for function_call in function_calls:
-            # Execute the function call
-            function_name = function_call.name
-            function_args = dict(function_call.args)
-            
-            # Find and execute the corresponding function
-            if hasattr(self, '_tools') and function_name in self._tools:
-                tool = self._tools[function_name]
-                try:
-                    # Handle both sync and async functions
-                    if asyncio.iscoroutinefunction(tool):
-                        tool_result = await tool(**function_args)
-                    else:
-                        tool_result = tool(**function_args)
-                    
-                    # Create a function response part
-                    function_response = genai.protos.Part(
-                        function_response=genai.protos.FunctionResponse(
-                            name=function_name, 
-                            response={"result": tool_result}
-                        )
-                    )
-                    
-                    # Add function response to the conversation
-                    contents.append({'role': 'model', 'parts': [function_call]})
-                    contents.append({'role': 'user', 'parts': [function_response]})
-                except Exception as e:
-                    logging.error(f"Error executing tool {function_name}: {e}")
-        
-        # Generate final response with function call results
-        final_response = self._model.generate_content(
-            contents=contents,
-            stream=False
-        )
-        
-        return contents, final_response.text
+        max_rounds = self._max_function_call_rounds if max_rounds is None else max_rounds
+
+        # Always use non-streaming for predictable function call handling
+        response = await self._model.generate_content_async(contents=contents, stream=False)
+
+        for _ in range(max_rounds):
+            function_calls = self._get_function_calls(response)
+            if not function_calls:
+                break
+
+            function_responses = await asyncio.gather(
+                *(self._execute_function_call(call) for call in function_calls)
+            )
+
+            # Add the model's calls and all their results to the conversation
+            contents.append(response.candidates[0].content)
+            contents.append({'role': 'user', 'parts': list(function_responses)})
+
+            response = await self._model.generate_content_async(contents=contents, stream=False)
+        else:
+            if self._get_function_calls(response):
+                raise RuntimeError(
+                    f"Function calling did not finish within {max_rounds} rounds"
+                )
+
+        return contents, response.text
 
     def validate_configuration(self, **kwargs) -> None:
         """Validate the configuration parameters."""
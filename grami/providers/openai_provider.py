@@ -1,79 +1,200 @@
-from typing import Any, Dict, List
+import asyncio
+import inspect
+import json
+import weakref
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple, Union
 import openai
 from ..core.base import BaseLLMProvider, BaseTool
 
+try:
+    import httpx
+except ImportError:  # newer openai releases ship on httpx2
+    import httpx2 as httpx
+
+# One pool per event loop: pooled connections cannot be shared across loops
+_shared_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple, openai.AsyncOpenAI]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
 class OpenAIProvider(BaseLLMProvider):
     """
-    OpenAI LLM Provider with native function calling support.
-    
-    Demonstrates how to implement tool execution using OpenAI's function calling API.
+    Async OpenAI LLM Provider with native function calling support.
+
+    All provider instances with the same credentials and pool settings share a
+    single ``AsyncOpenAI`` client, so concurrent agents reuse one pool of
+    keep-alive connections instead of serializing on blocking calls.
     """
-    
-    def __init__(self, api_key: str, model: str = "gpt-3.5-turbo"):
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-3.5-turbo",
+        base_url: Optional[str] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        timeout: float = 60.0,
+        client: Optional[openai.AsyncOpenAI] = None
+    ):
         """
         Initialize OpenAI provider.
-        
+
         :param api_key: OpenAI API key
         :param model: OpenAI model to use
+        :param base_url: Optional API base URL (e.g. a proxy or local mock server)
+        :param max_connections: Maximum concurrent connections in the shared pool
+        :param max_keepalive_connections: Maximum idle connections kept alive
+        :param keepalive_expiry: Seconds an idle connection is kept alive
+        :param timeout: Request timeout in seconds
+        :param client: Optional pre-configured client to use instead of the shared one
         """
         super().__init__()
-        openai.api_key = api_key
         self.model = model
+        self._api_key = api_key
+        self._base_url = base_url
+        self._pool_config = (max_connections, max_keepalive_connections, keepalive_expiry, timeout)
+        self._client = client
         self._conversation_history = []
-    
+
+    @classmethod
+    def get_shared_client(
+        cls,
+        api_key: str,
+        base_url: Optional[str] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        timeout: float = 60.0
+    ) -> openai.AsyncOpenAI:
+        """
+        Get the shared client for the running event loop, creating it if needed.
+
+        :param api_key: OpenAI API key
+        :param base_url: Optional API base URL
+        :param max_connections: Maximum concurrent connections in the pool
+        :param max_keepalive_connections: Maximum idle connections kept alive
+        :param keepalive_expiry: Seconds an idle connection is kept alive
+        :param timeout: Request timeout in seconds
+        :return: Shared async client
+        """
+        clients = _shared_clients.setdefault(asyncio.get_running_loop(), {})
+        key = (api_key, base_url, max_connections, max_keepalive_connections, keepalive_expiry, timeout)
+        client = clients.get(key)
+        if client is None or client.is_closed():
+            http_client = openai.DefaultAsyncHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                    keepalive_expiry=keepalive_expiry
+                ),
+                timeout=timeout
+            )
+            client = openai.AsyncOpenAI(api_key=api_key, base_url=base_url, http_client=http_client)
+            clients[key] = client
+        return client
+
+    @classmethod
+    async def close_shared_clients(cls) -> None:
+        """Close the shared clients of the running event loop."""
+        clients = _shared_clients.pop(asyncio.get_running_loop(), {})
+        for client in clients.values():
+            await client.close()
+
+    @property
+    def client(self) -> openai.AsyncOpenAI:
+        """Get the client used by this provider."""
+        if self._client is not None:
+            return self._client
+        return self.get_shared_client(self._api_key, self._base_url, *self._pool_config)
+
     def initialize_chat(self, system_instructions: str, context: Dict = None):
         """
         Initialize chat with system instructions.
-        
+
         :param system_instructions: Initial system prompt
         :param context: Optional additional context
         """
         self._conversation_history = [
             {"role": "system", "content": system_instructions}
         ]
-    
-    def send_message(self, message: str, context: Dict = None) -> str:
+
+    async def initialize_conversation(self, context: Optional[List[Dict[str, str]]] = None):
+        """
+        Initialize a new conversation with context.
+
+        :param context: Optional list of context messages with role and content
+        """
+        self._conversation_history = list(context or [])
+
+    @staticmethod
+    def _message_content(message: Union[str, Dict[str, str]]) -> str:
+        """Extract the text content of a message."""
+        if isinstance(message, str):
+            return message
+        return message.get("content", message.get("text", ""))
+
+    async def send_message(self, message: Union[str, Dict[str, str]], context: Dict = None) -> str:
         """
         Send a message and get a response.
-        
+
         :param message: User message
         :param context: Optional context
         :return: LLM response
         """
-        self._conversation_history.append({"role": "user", "content": message})
-        
-        response = openai.ChatCompletion.create(
+        self._conversation_history.append({"role": "user", "content": self._message_content(message)})
+
+        response = await self.client.chat.completions.create(
             model=self.model,
             messages=self._conversation_history
         )
-        
+
         assistant_response = response.choices[0].message.content
         self._conversation_history.append({"role": "assistant", "content": assistant_response})
-        
+
         return assistant_response
-    
-    def stream_message(self, message: str, context: Dict = None):
+
+    async def stream_message(
+        self,
+        message: Union[str, Dict[str, str]],
+        context: Dict = None
+    ) -> AsyncGenerator[str, None]:
         """
         Stream message response.
-        
+
         :param message: User message
         :param context: Optional context
         :yield: Streamed response tokens
         """
-        self._conversation_history.append({"role": "user", "content": message})
-        
-        for chunk in openai.ChatCompletion.create(
+        self._conversation_history.append({"role": "user", "content": self._message_content(message)})
+
+        stream = await self.client.chat.completions.create(
             model=self.model,
             messages=self._conversation_history,
             stream=True
-        ):
-            if chunk.choices[0].delta.get("content"):
+        )
+
+        full_response = []
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                full_response.append(chunk.choices[0].delta.content)
                 yield chunk.choices[0].delta.content
-    
-    def execute_tool(self, tool: BaseTool, *args, **kwargs) -> Any:
+
+        self._conversation_history.append({"role": "assistant", "content": "".join(full_response)})
+
+    async def validate_configuration(self, config: Dict[str, Any]) -> bool:
+        """
+        Validate the configuration for the provider.
+
+        :param config: Configuration dictionary
+        :return: Boolean indicating if configuration is valid
+        """
+        return bool(config.get("api_key")) and isinstance(config.get("model", self.model), str)
+
+    async def execute_tool(self, tool: BaseTool, *args, **kwargs) -> Any:
         """
         Execute a tool using OpenAI's function calling mechanism.
-        
+
         :param tool: Tool to execute
         :param args: Positional arguments
         :param kwargs: Keyword arguments
@@ -89,9 +210,8 @@ class OpenAIProvider(BaseLLMProvider):
                 "required": []
             }
         }
-        
+
         # Dynamically generate function parameters based on tool's signature
-        import inspect
         signature = inspect.signature(tool.execute)
         for param_name, param in signature.parameters.items():
             if param_name not in ['self', 'args', 'kwargs']:
@@ -102,33 +222,32 @@ class OpenAIProvider(BaseLLMProvider):
                 }
                 if param.default == inspect.Parameter.empty:
                     function_def["parameters"]["required"].append(param_name)
-        
+
         # Call OpenAI with function definition
-        response = openai.ChatCompletion.create(
+        response = await self.client.chat.completions.create(
             model=self.model,
             messages=self._conversation_history + [
                 {
-                    "role": "user", 
+                    "role": "user",
                     "content": "Please help me execute this tool with the given parameters."
                 }
             ],
-            functions=[function_def],
-            function_call={"name": tool.__class__.__name__}
+            tools=[{"type": "function", "function": function_def}],
+            tool_choice={"type": "function", "function": {"name": tool.__class__.__name__}}
         )
-        
+
         # Extract function arguments from the response
-        function_call = response.choices[0].message.get("function_call")
-        if function_call:
-            import json
+        tool_calls = response.choices[0].message.tool_calls
+        if tool_calls:
             try:
                 # Parse function arguments
-                func_args = json.loads(function_call.arguments)
-                
+                func_args = json.loads(tool_calls[0].function.arguments)
+
                 # Execute the tool with parsed arguments
-                return tool.execute(**func_args)
+                return await tool.execute(**func_args)
             except Exception as e:
                 # Fallback to direct execution if function call parsing fails
-                return tool.execute(*args, **kwargs)
-        
+                return await tool.execute(*args, **kwargs)
+
         # Fallback to direct tool execution
-        return tool.execute(*args, **kwargs)
+        return await tool.execute(*args, **kwargs)
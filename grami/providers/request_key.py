@@ -0,0 +1,121 @@
+import hashlib
+import json
+import unicodedata
+from typing import Any, Dict, Optional, Union
+
+
+def normalize_message(message: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Normalize a message to a role/content dictionary with canonical text.
+
+    Content is NFC-normalized and stripped of surrounding whitespace, so
+    prompts that differ only in those respects share a key.
+
+    :param message: Message string or dictionary
+    :return: Normalized message dictionary
+    """
+    if isinstance(message, str):
+        message = {"role": "user", "content": message}
+    normalized = dict(message)
+    content = normalized.get("content", normalized.get("text"))
+    if isinstance(content, str):
+        normalized["content"] = unicodedata.normalize("NFC", content).strip()
+        normalized.pop("text", None)
+    return normalized
+
+
+def provider_fingerprint(provider: Any, session_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Describe everything about a provider that shapes its next response.
+
+    Covers the provider class, model name, generation config, system prompt
+    and the conversation history the next message would be sent with.
+
+    :param provider: LLM provider
+    :param session_id: Optional session whose history applies
+    :return: Fingerprint dictionary
+    """
+    model = getattr(provider, "_model", None)
+    model_name = getattr(provider, "model", None)
+    if not isinstance(model_name, str):
+        model_name = getattr(model, "model_name", None) or getattr(provider, "model_name", None)
+
+    generation_config = getattr(provider, "generation_config", None)
+    if generation_config is None:
+        generation_config = getattr(model, "_generation_config", None)
+
+    system_prompt = getattr(provider, "_system_prompt", None)
+    if system_prompt is None:
+        system_prompt = getattr(model, "_system_instruction", None)
+
+    history = None
+    get_history = getattr(provider, "get_history", None)
+    if callable(get_history):
+        history = get_history(session_id) if session_id is not None else get_history()
+    elif hasattr(provider, "_conversation_history"):
+        history = provider._conversation_history
+
+    return {
+        "provider": type(provider).__name__,
+        "model": model_name,
+        "generation_config": generation_config,
+        "system_prompt": system_prompt,
+        "history": history,
+    }
+
+
+def canonical_json(value: Any) -> str:
+    """
+    Serialize a value deterministically.
+
+    :param value: Value to serialize
+    :return: JSON with sorted keys and no insignificant whitespace
+    """
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=repr)
+
+
+def _digest(value: Any) -> str:
+    return hashlib.blake2b(canonical_json(value).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def provider_state(provider: Any, session_id: Optional[str] = None) -> str:
+    """
+    Digest of a provider's fingerprint, for use as ``request_key``'s ``state``.
+
+    :param provider: LLM provider
+    :param session_id: Optional session whose history applies
+    :return: Hex digest of the provider fingerprint
+    """
+    return _digest(provider_fingerprint(provider, session_id))
+
+
+def request_key(
+    provider: Any,
+    message: Union[str, Dict[str, Any]],
+    context: Optional[Dict[str, Any]] = None,
+    *,
+    state: Optional[str] = None,
+    **kwargs: Any
+) -> str:
+    """
+    Build a stable key for a request to a provider.
+
+    Requests with equal keys are expected to produce equivalent responses:
+    same provider, model, generation config, system prompt, history,
+    normalized message and call arguments.
+
+    :param provider: LLM provider the request is sent to
+    :param message: Message to send
+    :param context: Optional context dictionary
+    :param state: Optional ``provider_state`` snapshot used instead of the
+        provider's current fingerprint
+    :param kwargs: Additional call arguments (e.g. session_id)
+    :return: Hex digest of the canonical request
+    """
+    payload = {
+        "provider": state if state is not None else provider_fingerprint(provider, kwargs.get("session_id")),
+        "message": normalize_message(message),
+        "context": context,
+        "kwargs": kwargs,
+    }
+    return _digest(payload)
@@ -0,0 +1,235 @@
+import logging
+import re
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional
+
+from ..core.base import BaseLLMProvider
+from ..memory.codecs import PayloadSerializer
+from ..memory.lru import LRUMemory
+from ..memory.redis_pool import RedisPoolRegistry, default_pool_registry
+from .request_key import request_key
+from .wrapper import ProviderWrapper
+
+_REPLAY_CHUNK = re.compile(r"\s*\S+|\s+")
+
+
+class BaseResponseCache(ABC):
+    """Storage for cached LLM responses."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response.
+
+        :param key: Request key
+        :return: Cached entry, or None on a miss
+        """
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, entry: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        """
+        Cache a response.
+
+        :param key: Request key
+        :param entry: Entry to cache
+        :param ttl: Optional time to live in seconds
+        """
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """
+        Remove every cached response.
+        """
+        pass
+
+
+class MemoryResponseCache(BaseResponseCache):
+    """
+    In-process response cache with LRU eviction and optional TTL.
+    """
+
+    def __init__(self, capacity: int = 1000, max_bytes: Optional[int] = None):
+        """
+        Initialize the cache.
+
+        :param capacity: Maximum number of cached responses (default: 1000)
+        :param max_bytes: Optional approximate memory budget in bytes
+        """
+        self._memory = LRUMemory(capacity=capacity, max_bytes=max_bytes)
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return await self._memory.retrieve(key)
+
+    async def set(self, key: str, entry: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        await self._memory.store(key, entry, expiry=ttl)
+
+    async def clear(self) -> None:
+        await self._memory.clear()
+
+
+class RedisResponseCache(BaseResponseCache):
+    """
+    Response cache shared between processes through Redis.
+
+    Entries are plain string keys with a Redis expiry, so TTL and memory
+    limits are enforced by the server (e.g. with an ``allkeys-lru`` policy).
+    """
+
+    def __init__(
+        self,
+        host: str = 'localhost',
+        port: int = 6379,
+        db: int = 0,
+        prefix: str = 'grami_llm_cache:',
+        pool_registry: Optional[RedisPoolRegistry] = None,
+        serializer: Optional[PayloadSerializer] = None
+    ):
+        """
+        Initialize the cache.
+
+        :param host: Redis host (default: localhost)
+        :param port: Redis port (default: 6379)
+        :param db: Redis database number (default: 0)
+        :param prefix: Prefix for cache keys
+        :param pool_registry: Registry providing shared connection pools
+        :param serializer: Serializer for cached entries (default: JSON with zlib)
+        """
+        self._host = host
+        self._port = port
+        self._db = db
+        self.prefix = prefix
+        self._pool_registry = pool_registry or default_pool_registry
+        self._serializer = serializer or PayloadSerializer()
+        self._redis_client = None
+
+    def _get_redis_client(self):
+        if self._redis_client is None:
+            self._redis_client = self._pool_registry.get_client(self._host, self._port, self._db)
+        return self._redis_client
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        data = await self._get_redis_client().get(self.prefix + key)
+        if data is None:
+            return None
+        return self._serializer.loads(data)
+
+    async def set(self, key: str, entry: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        px = int(ttl * 1000) if ttl is not None else None
+        await self._get_redis_client().set(self.prefix + key, self._serializer.dumps(entry), px=px)
+
+    async def clear(self) -> None:
+        redis = self._get_redis_client()
+        async for key in redis.scan_iter(match=f"{self.prefix}*"):
+            await redis.delete(key)
+
+
+class CachingProvider(ProviderWrapper):
+    """
+    Exact-match response cache in front of an LLM provider.
+
+    Responses are keyed on a canonical hash of the provider's model,
+    generation config, system prompt and history together with the message
+    and call arguments. Cached streams are replayed chunk by chunk, so
+    ``stream_message`` callers see the same interface on a hit.
+
+    Hits never reach the wrapped provider and therefore are not added to its
+    conversation history or memory; use it for stateless requests.
+    """
+
+    def __init__(
+        self,
+        provider: BaseLLMProvider,
+        cache: Optional[BaseResponseCache] = None,
+        ttl: Optional[float] = 3600,
+        key_func: Optional[Callable[..., str]] = None
+    ):
+        """
+        Initialize the caching wrapper.
+
+        :param provider: Provider to wrap
+        :param cache: Response cache backend (default: MemoryResponseCache)
+        :param ttl: Seconds a response stays cached (default: 3600, None keeps it until evicted)
+        :param key_func: Optional function ``(provider, message, context, **kwargs) -> str``
+            used instead of ``request_key``
+        """
+        super().__init__(provider)
+        self.cache = cache or MemoryResponseCache()
+        self.ttl = ttl
+        self.key_func = key_func or request_key
+        self.hits = 0
+        self.misses = 0
+        self.logger = logging.getLogger(__name__)
+
+    def _key(self, message: Any, context: Optional[Dict], kwargs: Dict[str, Any]) -> str:
+        return self.key_func(self.provider, message, context, **kwargs)
+
+    async def _lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            entry = await self.cache.get(key)
+        except Exception as e:
+            # An unavailable cache must not take the provider down with it
+            self.logger.warning(f"Response cache lookup failed: {e}")
+            entry = None
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    async def _save(self, key: str, chunks: List[str]) -> None:
+        try:
+            await self.cache.set(key, {"chunks": chunks}, ttl=self.ttl)
+        except Exception as e:
+            self.logger.warning(f"Response cache write failed: {e}")
+
+    async def send_message(self, message: Dict[str, str], context: Optional[Dict] = None, **kwargs) -> str:
+        """
+        Send a message, answering from the cache when possible.
+
+        :param message: Message to send
+        :param context: Optional context dictionary
+        :return: Response from the cache or the provider
+        """
+        key = self._key(message, context, kwargs)
+        entry = await self._lookup(key)
+        if entry is not None:
+            return "".join(entry["chunks"])
+
+        response = await self.provider.send_message(message, context, **kwargs)
+        await self._save(key, [response])
+        return response
+
+    async def stream_message(self, message: Dict[str, str], context: Optional[Dict] = None, **kwargs):
+        """
+        Stream a message, replaying a cached response when possible.
+
+        Streams are cached only when they complete.
+
+        :param message: Message to send
+        :param context: Optional context dictionary
+        :yield: Streamed response tokens
+        """
+        key = self._key(message, context, kwargs)
+        entry = await self._lookup(key)
+        if entry is not None:
+            chunks = entry["chunks"]
+            # Responses cached from send_message are replayed word by word
+            if len(chunks) == 1:
+                chunks = _REPLAY_CHUNK.findall(chunks[0])
+            for chunk in chunks:
+                yield chunk
+            return
+
+        chunks = []
+        async for chunk in self.provider.stream_message(message, context, **kwargs):
+            chunks.append(chunk)
+            yield chunk
+        await self._save(key, chunks)
+
+    async def clear_cache(self) -> None:
+        """
+        Remove every cached response.
+        """
+        await self.cache.clear()
@@ -0,0 +1,222 @@
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Awaitable, Callable, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with jitter for transient provider errors.
+
+    Attempt ``n`` (counting from 0) waits up to
+    ``min(max_delay, initial_delay * multiplier ** n)`` seconds before the
+    next one; with jitter the wait is drawn uniformly below that cap, which
+    keeps many clients from retrying in lockstep.
+    """
+
+    TRANSIENT_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        initial_delay: float = 0.5,
+        max_delay: float = 8.0,
+        multiplier: float = 2.0,
+        jitter: bool = True,
+        retry_on: Optional[Callable[[BaseException], bool]] = None
+    ):
+        """
+        Initialize the retry policy.
+
+        :param max_attempts: Total attempts including the first one (default: 3)
+        :param initial_delay: Backoff cap in seconds after the first failure (default: 0.5)
+        :param max_delay: Upper bound for any backoff in seconds (default: 8)
+        :param multiplier: Growth factor of the backoff cap (default: 2)
+        :param jitter: Whether to randomize waits below the cap (default: True)
+        :param retry_on: Optional predicate deciding which errors are transient
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.retry_on = retry_on
+
+    def is_transient(self, error: BaseException) -> bool:
+        """
+        Decide whether an error is worth retrying.
+
+        :param error: Error raised by an attempt
+        :return: True for timeouts, connection errors and retryable HTTP statuses
+        """
+        if self.retry_on is not None:
+            return self.retry_on(error)
+        if isinstance(error, (ConnectionError, TimeoutError, asyncio.TimeoutError)):
+            return True
+        code = getattr(error, "code", None)
+        return isinstance(code, int) and code in self.TRANSIENT_STATUS_CODES
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Seconds to wait after a failed attempt.
+
+        :param attempt: Index of the failed attempt, starting at 0
+        :return: Delay in seconds
+        """
+        cap = min(self.max_delay, self.initial_delay * self.multiplier ** attempt)
+        return random.uniform(0, cap) if self.jitter else cap
+
+    async def run(self, operation: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run an operation, retrying transient failures.
+
+        :param operation: Function returning a fresh awaitable for each attempt
+        :return: Result of the first successful attempt
+        """
+        for attempt in range(self.max_attempts):
+            try:
+                return await operation()
+            except Exception as e:
+                if attempt + 1 >= self.max_attempts or not self.is_transient(e):
+                    raise
+            await asyncio.sleep(self.backoff(attempt))
+
+
+class HedgePolicy:
+    """
+    Decides when to launch a backup request for a slow one.
+
+    The hedge delay follows a percentile of recently observed latencies, so
+    only the slowest requests (about ``100 - percentile`` percent of them)
+    are duplicated. Attempts that lose a race are recorded as censored
+    samples at the time they had run when cancelled, a lower bound of their
+    latency; recording only winners would let the percentile drift down.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        initial_delay: float = 2.0,
+        min_delay: float = 0.05,
+        window: int = 100,
+        min_samples: int = 10
+    ):
+        """
+        Initialize the hedge policy.
+
+        :param percentile: Latency percentile after which a hedge is launched (default: 95)
+        :param initial_delay: Hedge delay in seconds until enough samples exist (default: 2)
+        :param min_delay: Lower bound for the hedge delay in seconds (default: 0.05)
+        :param window: Number of recent latencies kept (default: 100)
+        :param min_samples: Samples needed before the percentile is used (default: 10)
+        """
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self._latencies = deque(maxlen=window)
+        self.hedges = 0
+        self.censored = 0
+
+    def record(self, latency: float, censored: bool = False) -> None:
+        """
+        Record the latency of a request.
+
+        :param latency: Latency in seconds
+        :param censored: Whether the request was cancelled before finishing,
+            so its real latency is at least ``latency`` (default: False)
+        """
+        self._latencies.append(latency)
+        if censored:
+            self.censored += 1
+
+    def delay(self) -> float:
+        """
+        Seconds to wait for a request before hedging it.
+
+        :return: Hedge delay in seconds
+        """
+        if len(self._latencies) < self.min_samples:
+            return self.initial_delay
+        ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))
+        return max(self.min_delay, ordered[index])
+
+
+async def hedged_call(
+    attempts: Sequence[Callable[[], Awaitable[T]]],
+    retry: Optional[RetryPolicy] = None,
+    hedge: Optional[HedgePolicy] = None,
+    fallback_on: Optional[Callable[[BaseException], bool]] = None
+) -> T:
+    """
+    Run alternative attempts until one succeeds, racing them when hedging.
+
+    Attempts start in order. The next one starts as soon as a running one
+    fails with an error accepted by ``fallback_on``, or, with a hedge policy,
+    once the hedge delay passes without a result. The first successful result
+    wins and every other attempt is cancelled. Any other error is raised
+    immediately.
+
+    :param attempts: Functions returning a fresh awaitable, in order of preference
+    :param retry: Optional retry policy applied to each attempt
+    :param hedge: Optional hedge policy; without one, attempts never overlap
+    :param fallback_on: Predicate for errors that move on to the next attempt
+    :return: Result of the winning attempt
+    """
+    if not attempts:
+        raise ValueError("at least one attempt is required")
+
+    async def timed(operation: Callable[[], Awaitable[T]]) -> T:
+        started = time.monotonic()
+        try:
+            result = await (retry.run(operation) if retry else operation())
+        except asyncio.CancelledError:
+            if hedge is not None:
+                # Lost the race: it would have taken at least this long
+                hedge.record(time.monotonic() - started, censored=True)
+            raise
+        if hedge is not None:
+            hedge.record(time.monotonic() - started)
+        return result
+
+    remaining = list(attempts)
+    running = set()
+    last_error: Optional[BaseException] = None
+
+    def launch() -> None:
+        running.add(asyncio.ensure_future(timed(remaining.pop(0))))
+
+    try:
+        launch()
+        while running:
+            timeout = hedge.delay() if hedge is not None and remaining else None
+            done, _ = await asyncio.wait(running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                # The running attempts are slower than usual: hedge
+                hedge.hedges += 1
+                launch()
+                continue
+
+            for task in done:
+                running.discard(task)
+                error = task.exception()
+                if error is None:
+                    return task.result()
+                if fallback_on is None or not fallback_on(error):
+                    raise error
+                last_error = error
+                # A failed attempt is replaced right away
+                if remaining:
+                    launch()
+        raise last_error
+    finally:
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
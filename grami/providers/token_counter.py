@@ -0,0 +1,155 @@
+import hashlib
+import math
+import re
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+
+class BaseTokenCounter(ABC):
+    """Abstract base class for local token counters."""
+
+    @abstractmethod
+    def count(self, text: str) -> int:
+        """
+        Count the tokens in a piece of text.
+
+        :param text: Text to count
+        :return: Number of tokens
+        """
+        pass
+
+    def count_message(self, message: Dict[str, Any]) -> int:
+        """
+        Count the tokens in a role/content message.
+
+        :param message: Message dictionary with a ``content`` entry
+        :return: Number of tokens
+        """
+        content = message.get("content", "")
+        if not isinstance(content, str):
+            content = content.get("text", "")
+        return self.count(content)
+
+
+class HeuristicTokenCounter(BaseTokenCounter):
+    """
+    Fast, dependency-free token estimator.
+
+    Text is split into word and punctuation pieces the same way BPE
+    pre-tokenizers do, and long words are charged one token per
+    ``chars_per_token`` characters. The result is multiplied by ``scale``,
+    which :meth:`calibrate` fits against counts reported by a provider.
+    """
+
+    _PIECE_PATTERN = re.compile(r"\w+|[^\w\s]", re.UNICODE)
+
+    def __init__(self, chars_per_token: float = 4.0, scale: float = 1.0):
+        """
+        Initialize the estimator.
+
+        :param chars_per_token: Average characters per token inside a word
+        :param scale: Calibration factor applied to the raw estimate
+        """
+        if chars_per_token <= 0:
+            raise ValueError("chars_per_token must be positive")
+        self.chars_per_token = chars_per_token
+        self.scale = scale
+
+    def _raw_count(self, text: str) -> int:
+        """Estimate tokens before calibration is applied."""
+        total = 0
+        for piece in self._PIECE_PATTERN.findall(text):
+            total += max(1, math.ceil(len(piece) / self.chars_per_token))
+        return total
+
+    def count(self, text: str) -> int:
+        """
+        Estimate the tokens in a piece of text.
+
+        :param text: Text to count
+        :return: Estimated number of tokens
+        """
+        if not text:
+            return 0
+        return max(1, round(self._raw_count(text) * self.scale))
+
+    def calibrate(self, samples: Iterable[Tuple[str, int]]) -> float:
+        """
+        Fit ``scale`` so estimates match provider-reported counts.
+
+        :param samples: Pairs of ``(text, actual_token_count)``
+        :return: The new scale factor
+        """
+        estimated = 0
+        actual = 0
+        for text, tokens in samples:
+            estimated += self._raw_count(text)
+            actual += tokens
+        if estimated and actual:
+            self.scale = actual / estimated
+        return self.scale
+
+
+class CachedTokenCounter(BaseTokenCounter):
+    """
+    Token counter that memoizes counts by content hash.
+
+    Messages already seen are never re-tokenized, so trimming a history on
+    every turn only pays for the messages added since the last turn.
+    """
+
+    def __init__(self, counter: Optional[BaseTokenCounter] = None, max_entries: int = 10000):
+        """
+        Initialize the cache.
+
+        :param counter: Counter to delegate cache misses to (default: HeuristicTokenCounter)
+        :param max_entries: Maximum number of cached counts
+        """
+        self.counter = counter or HeuristicTokenCounter()
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[str, int]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(text: str) -> str:
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    def count(self, text: str) -> int:
+        """
+        Count tokens, serving repeated content from the cache.
+
+        :param text: Text to count
+        :return: Number of tokens
+        """
+        key = self._key(text)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        tokens = self.counter.count(text)
+        self._cache[key] = tokens
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return tokens
+
+    def calibrate(self, samples: Iterable[Tuple[str, int]]) -> Optional[float]:
+        """
+        Calibrate the wrapped counter and drop counts made with the old scale.
+
+        :param samples: Pairs of ``(text, actual_token_count)``
+        :return: The new scale factor, if the wrapped counter supports calibration
+        """
+        if not hasattr(self.counter, "calibrate"):
+            return None
+        scale = self.counter.calibrate(samples)
+        self.clear()
+        return scale
+
+    def clear(self) -> None:
+        """Clear all cached counts."""
+        self._cache.clear()
@@ -0,0 +1,91 @@
+from typing import Any, Dict, Optional
+
+from ..core.base import BaseLLMProvider
+
+
+class _WrapperMeta(type(BaseLLMProvider)):
+    """Marks wrappers as constructed once the outermost ``__init__`` returns."""
+
+    def __call__(cls, *args, **kwargs):
+        wrapper = super().__call__(*args, **kwargs)
+        object.__setattr__(wrapper, "_constructed", True)
+        return wrapper
+
+
+class ProviderWrapper(BaseLLMProvider, metaclass=_WrapperMeta):
+    """
+    Base class for layers that sit in front of another LLM provider.
+
+    Attributes the wrapper does not define itself are read from and written
+    to the wrapped provider, so a wrapper can be handed to an agent in place
+    of the provider (system prompts, tools and memory still reach it).
+    Attributes assigned while the wrapper is being constructed always stay
+    on the wrapper, so stacked wrappers never overwrite each other's state.
+    """
+
+    def __init__(self, provider: BaseLLMProvider):
+        """
+        Initialize the wrapper.
+
+        :param provider: Provider to wrap
+        """
+        object.__setattr__(self, "provider", provider)
+        object.__setattr__(self, "id", getattr(provider, "id", None))
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes missing on the wrapper itself
+        if name in ("provider", "_constructed"):
+            raise AttributeError(name)
+        return getattr(self.provider, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # After construction, settings the wrapped provider owns (e.g. _system_prompt, tools) go to it
+        forward = (
+            self.__dict__.get("_constructed", False)
+            and name not in self.__dict__
+            and not hasattr(type(self), name)
+            and hasattr(self.provider, name)
+        )
+        if forward:
+            setattr(self.provider, name, value)
+        else:
+            object.__setattr__(self, name, value)
+
+    async def initialize_conversation(self, *args, **kwargs):
+        """
+        Initialize a conversation on the wrapped provider.
+        """
+        return await self.provider.initialize_conversation(*args, **kwargs)
+
+    async def validate_configuration(self, config: Dict[str, Any]) -> bool:
+        """
+        Validate the configuration with the wrapped provider.
+
+        :param config: Configuration dictionary
+        :return: Boolean indicating if configuration is valid
+        """
+        validate = getattr(self.provider, "validate_configuration", None)
+        if validate is None:
+            return True
+        return await validate(config)
+
+    async def send_message(self, message: Dict[str, str], context: Optional[Dict] = None, **kwargs) -> str:
+        """
+        Send a message through the wrapped provider.
+
+        :param message: Message to send
+        :param context: Optional context dictionary
+        :return: Response from the provider
+        """
+        return await self.provider.send_message(message, context, **kwargs)
+
+    async def stream_message(self, message: Dict[str, str], context: Optional[Dict] = None, **kwargs):
+        """
+        Stream a message through the wrapped provider.
+
+        :param message: Message to send
+        :param context: Optional context dictionary
+        :yield: Streamed response tokens
+        """
+        async for chunk in self.provider.stream_message(message, context, **kwargs):
+            yield chunk
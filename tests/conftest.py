@@ -0,0 +1,63 @@
+import asyncio
+import pytest
+from grami.providers.gemini_provider import GeminiProvider
+
+
+class FakeResponse:
+    """Gemini response stand-in carrying only text."""
+
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeChat:
+    """Gemini chat session stand-in that echoes messages and records its history.
+
+    With a delay it yields to the loop while 'generating'; ``active`` and
+    ``peak`` count concurrent calls across all chats.
+    """
+
+    active = 0
+    peak = 0
+
+    def __init__(self, history=None, delay=0.0):
+        self.history = list(history or [])
+        self.delay = delay
+
+    async def send_message_async(self, content, stream=False):
+        FakeChat.active += 1
+        FakeChat.peak = max(FakeChat.peak, FakeChat.active)
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+        finally:
+            FakeChat.active -= 1
+        return FakeResponse(f"echo: {content}")
+
+
+@pytest.fixture
+def fake_response():
+    """The FakeResponse class, for tests that fake model calls directly."""
+    return FakeResponse
+
+
+@pytest.fixture
+def fake_chat():
+    """The FakeChat class, with its concurrency counters reset."""
+    FakeChat.active = FakeChat.peak = 0
+    return FakeChat
+
+
+@pytest.fixture
+def make_gemini_provider(fake_chat):
+    """Factory for GeminiProviders whose chats are FakeChats.
+
+    Takes the chat ``delay`` plus any GeminiProvider keyword arguments.
+    """
+
+    def make(delay=0.0, **kwargs):
+        provider = GeminiProvider(api_key="test-key", **kwargs)
+        provider._model.start_chat = lambda history=None: fake_chat(history, delay)
+        return provider
+
+    return make
@@ -0,0 +1,23 @@
+import fakeredis
+import pytest
+
+
+@pytest.fixture
+def redis_client():
+    """In-process Redis stand-in."""
+    return fakeredis.FakeAsyncRedis()
+
+
+@pytest.fixture
+def round_trips(redis_client, monkeypatch):
+    """Count requests sent to the Redis stand-in; pipelines count once."""
+    sent = []
+    connection_class = redis_client.connection_pool.connection_class
+    original = connection_class.send_packed_command
+
+    async def send_packed_command(self, *args, **kwargs):
+        sent.append(args)
+        return await original(self, *args, **kwargs)
+
+    monkeypatch.setattr(connection_class, "send_packed_command", send_packed_command)
+    return sent
@@ -0,0 +1,69 @@
+import json
+import pytest
+from grami.memory import RedisMemory
+from grami.memory.codecs import JSONCodec, MsgpackCodec, PayloadSerializer
+
+
+@pytest.mark.parametrize("codec", [JSONCodec(), MsgpackCodec()])
+def test_payloads_round_trip_and_compress(codec):
+    """Large payloads are compressed, small ones are stored as encoded."""
+    serializer = PayloadSerializer(codec=codec, compress_threshold=256)
+    small = {"role": "user", "content": "hi"}
+    large = {"role": "assistant", "content": "the quick brown fox " * 200}
+
+    small_payload = serializer.dumps(small)
+    large_payload = serializer.dumps(large)
+
+    assert small_payload[5] == 0
+    assert large_payload[5] == 1
+    assert len(large_payload) < len(codec.encode(large))
+    assert serializer.loads(small_payload) == small
+    assert serializer.loads(large_payload) == large
+    # Payloads written with another codec are still readable
+    assert PayloadSerializer(codec=JSONCodec()).loads(large_payload) == large
+
+
+def test_default_codec_does_not_depend_on_installed_packages():
+    """Payloads are JSON unless msgpack is chosen explicitly, so every reader can decode them."""
+    assert isinstance(PayloadSerializer().codec, JSONCodec)
+    assert PayloadSerializer().dumps("value")[4] == JSONCodec.codec_id
+
+
+def test_unknown_format_version_is_rejected():
+    serializer = PayloadSerializer()
+    payload = bytearray(serializer.dumps("value"))
+    payload[3] = 99
+    with pytest.raises(ValueError):
+        serializer.loads(bytes(payload))
+
+
+@pytest.mark.asyncio
+async def test_legacy_json_entries_still_read(redis_client):
+    """Entries written in the old JSON format are read alongside new ones."""
+    memory = RedisMemory(provider_id="legacy")
+    memory._redis_client = redis_client
+    message = {"role": "user", "content": "from an older release"}
+    legacy = json.dumps({"value": message, "timestamp": "2024-01-01T00:00:00+00:00"})
+    await redis_client.hset("grami_memory:legacy:memory", "message_old", legacy)
+    await redis_client.zadd("grami_memory:legacy:memory_index", {"message_old": 1704067200.0})
+
+    await memory.store("message_new", {"role": "assistant", "content": "binary"})
+
+    assert await memory.retrieve("message_old") == message
+    assert [m["content"] for m in await memory.get_messages()] == ["from an older release", "binary"]
+    contents = {item["key"]: item for item in await memory.list_contents()}
+    assert contents["message_old"]["timestamp"] == "2024-01-01T00:00:00+00:00"
+    assert contents["message_new"]["timestamp"] > "2024"
+
+
+@pytest.mark.asyncio
+async def test_stored_payload_is_smaller_than_legacy_json(redis_client):
+    """No per-entry timestamp and a binary encoding shrink what Redis holds."""
+    memory = RedisMemory(provider_id="compact")
+    memory._redis_client = redis_client
+    message = {"role": "user", "content": "What is the weather in Paris today?"}
+    await memory.store("message_1", message)
+
+    stored = await redis_client.hstrlen("grami_memory:compact:memory", "message_1")
+    legacy = len(json.dumps({"value": message, "timestamp": "2024-01-01T00:00:00.000000+00:00"}))
+    assert stored < legacy * 0.7
@@ -0,0 +1,84 @@
+import pytest
+from grami.memory import LRUMemory
+
+
+@pytest.mark.asyncio
+async def test_lru_memory_message_capacity():
+    """Messages and their cache entries stay bounded by capacity."""
+    memory = LRUMemory(capacity=3)
+
+    for i in range(1000):
+        await memory.add_message(role="user", content=f"message {i}")
+
+    messages = await memory.get_messages()
+    assert [m["content"] for m in messages] == ["message 997", "message 998", "message 999"]
+    assert await memory.list_keys() == ["message_997", "message_998", "message_999"]
+    assert await memory.get_size() == 3
+
+
+@pytest.mark.asyncio
+async def test_lru_memory_message_consistency():
+    """Deleting or clearing messages keeps cache and history in sync."""
+    memory = LRUMemory(capacity=5)
+    for i in range(4):
+        await memory.add_message(role="user", content=f"message {i}")
+
+    await memory.delete("message_1")
+    assert [m["content"] for m in memory.messages] == ["message 0", "message 2", "message 3"]
+
+    await memory.clear_messages()
+    assert memory.messages == []
+    assert await memory.list_keys() == []
+
+    await memory.add_message(role="assistant", content="after clear")
+    assert await memory.list_keys() == ["message_4"]
+
+
+@pytest.mark.asyncio
+async def test_lru_memory_store_evicts_least_recently_used():
+    """store enforces capacity, evicting the least recently used key."""
+    memory = LRUMemory(capacity=2)
+    await memory.store("a", 1)
+    await memory.store("b", 2)
+    await memory.retrieve("a")
+    await memory.store("c", 3)
+
+    assert await memory.list_keys() == ["a", "c"]
+
+
+@pytest.mark.asyncio
+async def test_lru_memory_store_expiry(monkeypatch):
+    """Items expire after their TTL without scanning the cache."""
+    now = [1000.0]
+    monkeypatch.setattr("grami.memory.lru.time.monotonic", lambda: now[0])
+    memory = LRUMemory(capacity=10, default_ttl=60)
+
+    await memory.store("short", "value", expiry=5)
+    await memory.store("default", "value")
+    await memory.store("short", "refreshed", expiry=30)
+
+    now[0] += 10
+    assert await memory.retrieve("short") == "refreshed"
+
+    now[0] += 25
+    assert await memory.retrieve("short") is None
+    assert await memory.list_keys() == ["default"]
+
+    now[0] += 30
+    assert await memory.get_size() == 0
+
+
+@pytest.mark.asyncio
+async def test_lru_memory_byte_budget():
+    """max_bytes bounds the estimated size of stored values."""
+    memory = LRUMemory(capacity=100, max_bytes=30)
+    await memory.store("a", "x" * 10)
+    await memory.store("b", "y" * 10)
+    await memory.store("c", "z" * 10)
+
+    assert await memory.list_keys() == ["b", "c"]
+    assert memory._bytes <= 30
+
+    with pytest.raises(ValueError):
+        await memory.add_message(role="user", content="w" * 100)
+    assert memory.messages == []
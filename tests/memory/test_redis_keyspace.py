@@ -0,0 +1,89 @@
+import fakeredis
+import pytest
+from redis.asyncio.cluster import RedisCluster
+from redis.exceptions import RedisClusterException
+from redis.crc import key_slot
+from grami.memory import RedisMemory, RedisPoolRegistry
+from grami.memory.redis_memory import memory_key_prefix
+
+
+def test_session_keys_share_a_cluster_slot():
+    """A session's hash, index and version key hash to one slot."""
+    memory = RedisMemory(provider_id="support", session_id="user-42")
+
+    assert memory.memory_key_prefix == "grami_memory:{support:user-42}:"
+    slots = {key_slot(key.encode()) for key in memory._script_keys()}
+    assert len(slots) == 1
+
+    # Sessions of one provider spread across slots
+    session_slots = {
+        key_slot(RedisMemory(provider_id="support", session_id=f"s{i}").hash_key.encode())
+        for i in range(50)
+    }
+    assert len(session_slots) > 40
+
+
+def test_provider_namespace_is_unchanged_without_sessions():
+    assert memory_key_prefix("support") == "grami_memory:support:"
+    assert memory_key_prefix("support", hash_tag=True) == "grami_memory:{support}:"
+    assert RedisMemory(provider_id="support", cluster=True).hash_key == "grami_memory:{support}:memory"
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_isolated(redis_client):
+    """Sessions of one provider never see each other's history."""
+    alice = RedisMemory(provider_id="support", session_id="alice", capacity=2)
+    alice._redis_client = redis_client
+    bob = alice.for_session("bob")
+
+    await alice.store("message_1", {"role": "user", "content": "hi from alice"})
+    await bob.store("message_1", {"role": "user", "content": "hi from bob"})
+    await bob.store("message_2", {"role": "user", "content": "bob again"})
+    await bob.store("message_3", {"role": "user", "content": "bob once more"})
+
+    assert [m["content"] for m in await alice.get_messages()] == ["hi from alice"]
+    assert [m["content"] for m in await bob.get_messages()] == ["bob again", "bob once more"]
+
+    await bob.clear()
+    assert await alice.get_size() == 1
+
+
+@pytest.mark.asyncio
+async def test_cluster_clients_are_shared():
+    registry = RedisPoolRegistry()
+    memory = RedisMemory(cluster=True, session_id="a", pool_registry=registry)
+    other = memory.for_session("b")
+    other._redis_client = None
+
+    client = await memory._get_redis_client()
+    assert isinstance(client, RedisCluster)
+    assert await other._get_redis_client() is client
+    await registry.close()
+
+
+class ClusterLikeRedis(fakeredis.FakeAsyncRedis):
+    """Redis stand-in that rejects MULTI/EXEC pipelines like redis-py 5.x cluster clients."""
+
+    def pipeline(self, transaction=True, shard_hint=None):
+        if transaction:
+            raise RedisClusterException("transaction is deprecated in cluster mode")
+        return super().pipeline(transaction=False, shard_hint=shard_hint)
+
+
+@pytest.mark.asyncio
+async def test_cluster_mode_avoids_transactions():
+    memory = RedisMemory(provider_id="support", session_id="alice", cluster=True, near_cache=True)
+    memory._redis_client = ClusterLikeRedis()
+
+    await memory.store("message_1", {"role": "user", "content": "hi"})
+    await memory.store_many([("message_2", {"role": "assistant", "content": "hello"})])
+    assert [m["content"] for m in await memory.get_messages()] == ["hi", "hello"]
+    assert [entry["key"] for entry in await memory.list_contents()] == ["message_1", "message_2"]
+
+    assert await memory.remove("message_1") is True
+    assert await memory.remove("message_1") is False
+    assert [m["content"] for m in await memory.get_messages()] == ["hello"]
+
+    await memory.clear()
+    assert await memory.get_messages() == []
+    assert await memory.get_size() == 0
@@ -0,0 +1,72 @@
+import asyncio
+import pytest
+from grami.memory import RedisMemory
+
+
+def make_memory(redis_client, **kwargs):
+    """Build a RedisMemory that talks to the in-process Redis stand-in."""
+    memory = RedisMemory(**kwargs)
+    memory._redis_client = redis_client
+    return memory
+
+
+@pytest.mark.asyncio
+async def test_store_is_a_single_round_trip(redis_client):
+    """store writes and trims with one EVALSHA call."""
+    memory = make_memory(redis_client, capacity=3)
+    # Warm the server script cache so only steady-state calls are counted
+    await memory.store("warmup", "value")
+
+    commands = []
+    original = redis_client.execute_command
+
+    async def record(*args, **kwargs):
+        commands.append(args[0])
+        return await original(*args, **kwargs)
+
+    redis_client.execute_command = record
+    for i in range(5):
+        await memory.store(f"key{i}", f"value{i}")
+
+    assert commands == ["EVALSHA"] * 5
+    assert sorted(await memory.list_keys()) == ["key2", "key3", "key4"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_writers_never_exceed_capacity(redis_client):
+    """Concurrent stores leave exactly capacity entries in hash and index."""
+    writers = [make_memory(redis_client, capacity=10, provider_id="shared") for _ in range(4)]
+
+    await asyncio.gather(*(
+        writer.store(f"w{n}_{i}", i)
+        for n, writer in enumerate(writers)
+        for i in range(25)
+    ))
+
+    assert await writers[0].get_size() == 10
+    assert await redis_client.zcard("grami_memory:shared:memory_index") == 10
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("history_length", [10, 250])
+async def test_batched_reads_do_not_scale_with_history(redis_client, round_trips, history_length):
+    """Reads cost a fixed number of round trips regardless of history size."""
+    memory = make_memory(redis_client, capacity=1000, read_batch_size=100)
+    for i in range(history_length):
+        await memory.store(f"message_{i:04d}", {"role": "user", "content": f"m{i}"})
+
+    round_trips.clear()
+    messages = await memory.get_messages()
+    assert len(round_trips) == 2
+    assert [m["content"] for m in messages] == [f"m{i}" for i in range(history_length)]
+
+    round_trips.clear()
+    recent = await memory.get_recent_items(limit=history_length)
+    assert len(round_trips) == 2
+    assert recent[0]["key"] == f"message_{history_length - 1:04d}"
+    assert "timestamp" in recent[0]
+
+    round_trips.clear()
+    contents = await memory.list_contents()
+    assert len(round_trips) == 1
+    assert len(contents) == history_length
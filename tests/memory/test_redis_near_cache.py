@@ -0,0 +1,65 @@
+import pytest
+from grami.memory import RedisMemory
+
+
+def make_memory(redis_client, **kwargs):
+    memory = RedisMemory(provider_id="session", **kwargs)
+    memory._redis_client = redis_client
+    return memory
+
+
+async def add_message(memory, i):
+    await memory.store(f"message_{i}", {"role": "user", "content": f"m{i}"})
+
+
+@pytest.mark.asyncio
+async def test_near_cache_serves_unchanged_history(redis_client, round_trips):
+    """Unchanged history is revalidated with a single small read."""
+    memory = make_memory(redis_client, near_cache=True)
+    for i in range(50):
+        await add_message(memory, i)
+
+    first = await memory.get_messages()
+    round_trips.clear()
+    second = await memory.get_messages()
+
+    assert first == second
+    assert len(round_trips) == 1
+    assert memory.near_cache_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_near_cache_ttl_and_write_through(redis_client, round_trips):
+    """Sticky sessions read their own writes without network I/O."""
+    memory = make_memory(redis_client, near_cache=True, near_cache_ttl=60, capacity=3)
+    await add_message(memory, 0)
+    await memory.get_messages()
+
+    for i in range(1, 5):
+        await add_message(memory, i)
+
+    round_trips.clear()
+    messages = await memory.get_messages()
+
+    assert round_trips == []
+    assert [m["content"] for m in messages] == ["m2", "m3", "m4"]
+
+
+@pytest.mark.asyncio
+async def test_near_cache_invalidated_by_other_writers(redis_client):
+    """Writes from another instance force a refresh."""
+    reader = make_memory(redis_client, near_cache=True)
+    writer = make_memory(redis_client)
+    await add_message(writer, 0)
+    assert len(await reader.get_messages()) == 1
+
+    await add_message(writer, 1)
+    assert [m["content"] for m in await reader.get_messages()] == ["m0", "m1"]
+
+    await add_message(reader, 2)
+    await writer.remove("message_0")
+    assert [m["content"] for m in await reader.get_messages()] == ["m1", "m2"]
+
+    await writer.clear()
+    assert await reader.get_messages() == []
+    assert reader.near_cache_misses == 4
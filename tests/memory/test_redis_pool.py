@@ -0,0 +1,51 @@
+import asyncio
+import fakeredis
+import pytest
+from fakeredis.aioredis import FakeAsyncRedisConnection
+from grami.memory import RedisMemory, RedisPoolRegistry
+
+
+@pytest.fixture
+async def registry():
+    # The stand-in does not answer redis-py's interval health pings
+    registry = RedisPoolRegistry(
+        max_connections=2,
+        health_check_interval=0,
+        connection_class=FakeAsyncRedisConnection,
+        server=fakeredis.FakeServer()
+    )
+    yield registry
+    await registry.close()
+
+
+@pytest.mark.asyncio
+async def test_memories_share_one_pool(registry):
+    """Memory instances for the same server borrow from one pool."""
+    memories = [
+        RedisMemory(provider_id=f"session_{i}", pool_registry=registry)
+        for i in range(20)
+    ]
+
+    await asyncio.gather(*(memory.store("greeting", i) for i, memory in enumerate(memories)))
+
+    assert len(registry.stats()) == 1
+    stats = registry.stats()["localhost:6379/0"]
+    assert stats["peak_in_use"] <= 2
+    assert stats["in_use"] == 0
+    assert stats["acquisitions"] >= 20
+    assert await memories[7].retrieve("greeting") == 7
+
+    other = RedisMemory(db=3, pool_registry=registry)
+    await other.store("key", "value")
+    assert set(registry.stats()) == {"localhost:6379/0", "localhost:6379/3"}
+
+
+@pytest.mark.asyncio
+async def test_closing_memory_keeps_pool_open(registry):
+    """Leaving a memory context does not disconnect other sessions."""
+    async with RedisMemory(provider_id="a", pool_registry=registry) as memory:
+        await memory.store("key", "value")
+
+    survivor = RedisMemory(provider_id="a", pool_registry=registry)
+    assert await survivor.retrieve("key") == "value"
+    assert await registry.health_check() == {"localhost:6379/0": True}
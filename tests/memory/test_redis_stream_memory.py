@@ -0,0 +1,59 @@
+import asyncio
+import pytest
+from grami.memory import RedisStreamMemory
+
+
+def make_memory(redis_client, **kwargs):
+    """Build a RedisStreamMemory that talks to the in-process Redis stand-in."""
+    memory = RedisStreamMemory(**kwargs)
+    memory._redis_client = redis_client
+    return memory
+
+
+@pytest.mark.asyncio
+async def test_appends_are_capped_and_never_collide(redis_client):
+    """Concurrent appends all get distinct IDs; reads honour capacity."""
+    memory = make_memory(redis_client, capacity=5, session_id="chat")
+
+    ids = await asyncio.gather(*(
+        memory.add_message({"role": "user", "content": f"m{i}"}) for i in range(20)
+    ))
+
+    assert len(set(ids)) == 20
+    assert [m["content"] for m in await memory.get_messages()] == [f"m{i}" for i in range(15, 20)]
+    assert await memory.get_size() == 5
+
+    recent = await memory.get_recent_items(limit=2)
+    assert [item["value"]["content"] for item in recent] == ["m19", "m18"]
+    assert recent[0]["id"] == ids[-1]
+    assert "timestamp" in recent[0]
+
+
+@pytest.mark.asyncio
+async def test_key_value_access(redis_client):
+    memory = make_memory(redis_client)
+    await memory.add("profile", {"name": "Ada"})
+    await memory.add("profile", {"name": "Grace"})
+
+    assert await memory.get("profile") == {"name": "Grace"}
+    assert await memory.list_keys() == ["profile"]
+    assert await memory.remove("profile") is True
+    assert await memory.get("profile") is None
+
+
+@pytest.mark.asyncio
+async def test_consumer_group_tails_the_conversation(redis_client):
+    """Workers in a group split new entries and acknowledge them."""
+    memory = make_memory(redis_client, session_id="tail")
+    assert await memory.create_consumer_group("summarizers") is True
+    assert await memory.create_consumer_group("summarizers") is False
+
+    for i in range(3):
+        await memory.add_message({"role": "user", "content": f"m{i}"})
+
+    first = await memory.read_group("summarizers", "worker-1", count=2)
+    second = await memory.read_group("summarizers", "worker-2", count=2)
+
+    assert [item["value"]["content"] for item in first + second] == ["m0", "m1", "m2"]
+    assert await memory.read_group("summarizers", "worker-1") == []
+    assert await memory.ack("summarizers", *(item["id"] for item in first + second)) == 3
@@ -0,0 +1,130 @@
+import asyncio
+import pytest
+from grami.agents import AsyncAgent
+from grami.memory import LRUMemory, RedisMemory, WriteBehindMemory
+
+
+class SlowMemory(LRUMemory):
+    """LRU memory whose writes take a while, like a remote backend."""
+
+    def __init__(self, delay=0.05, fail=False, **kwargs):
+        super().__init__(**kwargs)
+        self.delay = delay
+        self.fail = fail
+
+    async def add_message(self, role, content):
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("backend unavailable")
+        await super().add_message(role, content)
+
+
+class EchoLLM:
+    async def send_message(self, message, **kwargs):
+        return f"echo: {message['content']}"
+
+
+@pytest.mark.asyncio
+async def test_batched_stores_share_round_trips(redis_client, round_trips):
+    """Queued stores are applied together with store_many."""
+    backend = RedisMemory(capacity=100)
+    backend._redis_client = redis_client
+    await backend.store("warmup", "value")
+    memory = WriteBehindMemory(backend, mode="batched", flush_interval=0.01)
+
+    round_trips.clear()
+    for i in range(20):
+        await memory.store(f"message_{i:02d}", {"role": "user", "content": f"m{i}"})
+    assert memory.pending == 20
+    assert round_trips == []
+
+    # Reads see every queued write
+    messages = await memory.get_messages()
+    assert [m["content"] for m in messages] == [f"m{i}" for i in range(20)]
+    assert memory.written == 20
+    # SCRIPT EXISTS and one pipeline for the whole batch, then the two reads
+    assert len(round_trips) == 4
+    await memory.aclose()
+
+
+@pytest.mark.asyncio
+async def test_batched_messages_share_round_trips(redis_client, round_trips):
+    """Queued add_message calls are applied together with add_messages."""
+    backend = RedisMemory(capacity=100)
+    backend._redis_client = redis_client
+    await backend.store("warmup", "value")
+    memory = WriteBehindMemory(backend, mode="batched", flush_interval=0.01)
+
+    round_trips.clear()
+    for i in range(10):
+        await memory.add_message(role="user", content=f"m{i}", message_id=f"turn{i}")
+    # A repeated ID is still stored once
+    await memory.add_message(role="user", content="m0", message_id="turn0")
+    await memory.flush()
+
+    # SCRIPT EXISTS and one pipeline for the whole batch
+    assert len(round_trips) == 2
+    messages = await memory.get_messages()
+    assert [m["content"] for m in messages] == [f"m{i}" for i in range(10)]
+    await memory.aclose()
+
+
+@pytest.mark.asyncio
+async def test_session_memories_keep_the_write_mode(redis_client):
+    backend = RedisMemory(capacity=100)
+    backend._redis_client = redis_client
+    memory = WriteBehindMemory(backend, mode="fire_and_forget")
+
+    session = memory.for_session("alice")
+    assert isinstance(session, WriteBehindMemory)
+    assert session.mode == "fire_and_forget"
+    assert session.session_id == "alice"
+
+    await session.add_message(role="user", content="hi")
+    assert session.pending == 1
+    await memory.aclose()
+    assert session.pending == 0
+    assert [m["content"] for m in await backend.for_session("alice").get_messages()] == ["hi"]
+
+
+@pytest.mark.asyncio
+async def test_ack_mode_reports_failures_to_the_caller():
+    memory = WriteBehindMemory(SlowMemory(delay=0, fail=True), mode="ack")
+    with pytest.raises(ConnectionError):
+        await memory.add_message(role="user", content="hello")
+    assert memory.failed_writes == 1
+    await memory.aclose()
+
+
+@pytest.mark.asyncio
+async def test_fire_and_forget_failures_are_counted():
+    memory = WriteBehindMemory(SlowMemory(delay=0, fail=True), mode="fire_and_forget")
+    await memory.add_message(role="user", content="hello")
+    await memory.flush()
+    assert memory.failed_writes == 1
+    assert isinstance(memory.last_error, ConnectionError)
+    await memory.aclose()
+
+
+@pytest.mark.asyncio
+async def test_agent_responds_without_waiting_for_memory():
+    """With a write mode configured, memory latency is off the response path."""
+    backend = SlowMemory(delay=0.2)
+    agent = AsyncAgent(
+        name="writer",
+        llm=EchoLLM(),
+        memory=backend,
+        config={"memory_write_mode": "fire_and_forget"}
+    )
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    response = await agent.send_message("hi")
+    assert response == "echo: hi"
+    assert loop.time() - started < 0.1
+
+    await agent.close()
+    assert backend.messages == [
+        {"role": "user", "content": "hi"},
+        {"role": "assistant", "content": "echo: hi"}
+    ]
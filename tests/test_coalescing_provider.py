@@ -0,0 +1,169 @@
+import asyncio
+import pytest
+from grami.core.base import BaseLLMProvider
+from grami.providers import CachingProvider, CoalescingProvider
+from grami.providers.request_key import request_key
+
+
+class SlowLLM(BaseLLMProvider):
+    """Provider that counts upstream calls and takes a while to answer."""
+
+    def __init__(self, fail=False):
+        super().__init__()
+        self.model = "test-model"
+        self._system_prompt = None
+        self.calls = 0
+        self.fail = fail
+
+    async def initialize_conversation(self, context=None):
+        pass
+
+    async def validate_configuration(self, config):
+        return True
+
+    async def send_message(self, message, context=None, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(0.02)
+        if self.fail:
+            raise ConnectionError("upstream unavailable")
+        return f"echo: {message['content']}"
+
+    async def stream_message(self, message, context=None, **kwargs):
+        self.calls += 1
+        for token in ["a", "b", "c"]:
+            await asyncio.sleep(0.01)
+            yield token
+        if self.fail:
+            raise ConnectionError("stream broke")
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_requests_share_one_call():
+    llm = SlowLLM()
+    provider = CoalescingProvider(llm)
+
+    responses = await asyncio.gather(
+        *(provider.send_message({"role": "user", "content": text}) for text in ["hi", " hi ", "hi", "bye"])
+    )
+
+    assert responses == ["echo: hi", "echo: hi", "echo: hi", "echo: bye"]
+    assert llm.calls == 2
+    assert provider.coalesced_calls == 2
+    assert provider.in_flight == 0
+
+    # Completed requests are not cached
+    await provider.send_message({"role": "user", "content": "hi"})
+    assert llm.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_model_config_is_part_of_the_key():
+    llm = SlowLLM()
+    key = request_key(llm, "hello")
+    llm._system_prompt = "Be terse"
+    assert request_key(llm, "hello") != key
+    assert request_key(llm, "hello", session_id="a") != request_key(llm, "hello", session_id="b")
+
+
+@pytest.mark.asyncio
+async def test_stream_subscribers_fan_out_from_one_stream():
+    llm = SlowLLM()
+    provider = CoalescingProvider(llm)
+
+    async def collect(delay):
+        await asyncio.sleep(delay)
+        return [chunk async for chunk in provider.stream_message({"role": "user", "content": "hi"})]
+
+    # The late subscriber joins mid-stream and still sees every chunk
+    results = await asyncio.gather(collect(0), collect(0), collect(0.015))
+
+    assert results == [["a", "b", "c"]] * 3
+    assert llm.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_caller():
+    llm = SlowLLM(fail=True)
+    provider = CoalescingProvider(llm)
+
+    results = await asyncio.gather(
+        *(provider.send_message({"role": "user", "content": "hi"}) for _ in range(3)),
+        return_exceptions=True
+    )
+    assert all(isinstance(r, ConnectionError) for r in results)
+    assert llm.calls == 1
+
+    async def collect():
+        chunks = []
+        with pytest.raises(ConnectionError):
+            async for chunk in provider.stream_message({"role": "user", "content": "hi"}):
+                chunks.append(chunk)
+        return chunks
+
+    assert await asyncio.gather(collect(), collect()) == [["a", "b", "c"]] * 2
+    assert llm.calls == 2
+
+
+def test_settings_reach_the_wrapped_provider():
+    llm = SlowLLM()
+    provider = CoalescingProvider(llm)
+    provider._system_prompt = "Be terse"
+    assert llm._system_prompt == "Be terse"
+    assert provider.model == "test-model"
+
+
+class HistoryLLM(SlowLLM):
+    """Provider that records the turn in its history as soon as a call starts."""
+
+    def __init__(self):
+        super().__init__()
+        self._conversation_history = []
+
+    async def send_message(self, message, context=None, **kwargs):
+        self._conversation_history.append(message)
+        return await super().send_message(message, context, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_history_changing_mid_flight_does_not_split_requests():
+    llm = HistoryLLM()
+    provider = CoalescingProvider(llm)
+
+    async def late():
+        # Joins after the first call has already updated the history
+        await asyncio.sleep(0.01)
+        assert len(llm._conversation_history) == 1
+        return await provider.send_message({"role": "user", "content": "hi"})
+
+    responses = await asyncio.gather(provider.send_message({"role": "user", "content": "hi"}), late())
+
+    assert responses == ["echo: hi", "echo: hi"]
+    assert llm.calls == 1
+    assert provider._states == {}
+
+    # Once idle, the next request sees the updated history
+    await provider.send_message({"role": "user", "content": "hi"})
+    assert llm.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_stacked_wrappers_keep_their_own_state():
+    llm = SlowLLM()
+    cached = CachingProvider(llm)
+    provider = CoalescingProvider(cached)
+
+    # The outer wrapper's attributes never overwrite the inner one's
+    assert cached.key_func is request_key
+    assert provider.key_func is None
+    assert (cached.hits, cached.misses) == (0, 0)
+
+    responses = await asyncio.gather(*(provider.send_message({"role": "user", "content": "hi"}) for _ in range(3)))
+    assert responses == ["echo: hi"] * 3
+    assert await provider.send_message({"role": "user", "content": "hi"}) == "echo: hi"
+    assert llm.calls == 1
+    assert cached.hits == 1
+    assert provider.coalesced_calls == 2
+
+    # Settings still reach the innermost provider
+    provider._system_prompt = "Be terse"
+    assert llm._system_prompt == "Be terse"
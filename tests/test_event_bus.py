@@ -0,0 +1,163 @@
+import asyncio
+import pytest
+from grami.communication.event_bus import EventBus, EventQueueFull
+
+
+class EchoAgent:
+    async def send_message(self, message):
+        await asyncio.sleep(0.01)
+        return f"echo: {message}"
+
+
+@pytest.mark.asyncio
+async def test_handlers_run_concurrently():
+    bus = EventBus()
+    received = []
+
+    def make_handler(name):
+        async def handler(data):
+            await asyncio.sleep(0.1)
+            received.append((name, data))
+        return handler
+
+    for name in range(5):
+        bus.subscribe('event', make_handler(name))
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    await bus.publish('event', 'payload')
+
+    # Latency is the slowest handler, not the sum
+    assert loop.time() - started < 0.3
+    assert sorted(received) == [(name, 'payload') for name in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_failing_and_slow_handlers_are_isolated():
+    bus = EventBus(handler_timeout=0.05)
+    received = []
+
+    async def failing(data):
+        raise RuntimeError("boom")
+
+    async def hanging(data):
+        await asyncio.sleep(10)
+
+    async def healthy(data):
+        received.append(data)
+
+    bus.subscribe('event', failing)
+    bus.subscribe('event', hanging)
+    bus.subscribe('event', healthy)
+    await bus.publish('event', 'payload')
+
+    assert received == ['payload']
+    assert bus.handler_errors == 1
+    assert bus.handler_timeouts == 1
+
+
+@pytest.mark.asyncio
+async def test_per_handler_concurrency_limit():
+    bus = EventBus()
+    active = peak = 0
+
+    async def handler(data):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+
+    bus.subscribe('event', handler, max_concurrency=2)
+    await asyncio.gather(*(bus.publish('event', i) for i in range(6)))
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_fire_and_forget_publish_and_agent_responses():
+    bus = EventBus(agent=EchoAgent())
+    responses = []
+
+    async def on_response(response):
+        responses.append(response)
+
+    bus.subscribe('agent_response', on_response)
+    await bus.publish('user_message', 'hi', wait=False)
+    assert responses == []
+
+    await bus.drain()
+    assert responses == ['echo: hi']
+
+
+@pytest.mark.asyncio
+async def test_queue_mode_bounds_pending_events():
+    bus = EventBus(queue_size=2, workers=1, overflow='drop_oldest')
+    release = asyncio.Event()
+    received = []
+
+    async def handler(data):
+        await release.wait()
+        received.append(data)
+
+    bus.subscribe('event', handler)
+    await bus.publish('event', 0, wait=False)
+    await asyncio.sleep(0)
+    for i in range(1, 6):
+        await bus.publish('event', i, wait=False)
+
+    stats = bus.queue_stats()['event']
+    assert stats['depth'] <= 2
+    assert stats['dropped'] == 3
+
+    release.set()
+    await bus.drain()
+    # The first event was already being handled; the newest two were kept
+    assert received == [0, 4, 5]
+    assert bus.queue_stats()['event']['processed'] == 3
+    await bus.stop()
+
+
+@pytest.mark.asyncio
+async def test_reject_policy_raises_when_full():
+    bus = EventBus(queue_size=1, overflow='reject')
+    release = asyncio.Event()
+
+    async def handler(data):
+        await release.wait()
+
+    bus.subscribe('event', handler)
+    await bus.publish('event', 1, wait=False)
+    await asyncio.sleep(0)
+    await bus.publish('event', 2, wait=False)
+
+    with pytest.raises(EventQueueFull):
+        await bus.publish('event', 3, wait=False)
+    assert bus.queue_stats()['event']['rejected'] == 1
+
+    release.set()
+    await bus.stop()
+
+
+@pytest.mark.asyncio
+async def test_block_policy_applies_backpressure_and_workers_share_load():
+    bus = EventBus()
+    bus.configure_queue('event', maxsize=1, workers=3, overflow='block')
+    active = peak = 0
+
+    async def handler(data):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.02)
+        active -= 1
+
+    bus.subscribe('event', handler)
+    await asyncio.gather(*(bus.publish('event', i) for i in range(9)))
+
+    stats = bus.queue_stats()['event']
+    assert peak == 3
+    assert stats['processed'] == 9
+    assert stats['dropped'] == stats['rejected'] == 0
+    assert stats['max_lag'] > 0
+    await bus.stop()
@@ -0,0 +1,77 @@
+import asyncio
+import time
+import pytest
+from types import SimpleNamespace
+from grami.providers.gemini_provider import GeminiProvider
+
+
+def make_response(text=None, calls=()):
+    parts = [
+        SimpleNamespace(function_call=SimpleNamespace(name=name, args=args))
+        for name, args in calls
+    ]
+    if text is not None:
+        parts.append(SimpleNamespace(function_call=None))
+    content = SimpleNamespace(role="model", parts=parts)
+    return SimpleNamespace(candidates=[SimpleNamespace(content=content)], text=text)
+
+
+class FakeModel:
+    """Async-only model stand-in that replays scripted responses."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    async def generate_content_async(self, contents, stream=False):
+        self.requests.append(list(contents))
+        return self.responses.pop(0)
+
+    def generate_content(self, *args, **kwargs):
+        raise AssertionError("blocking generate_content must not be called")
+
+
+async def slow_lookup(city: str):
+    await asyncio.sleep(0.2)
+    return f"sunny in {city}"
+
+
+def add(a: int, b: int):
+    return a + b
+
+
+@pytest.fixture
+def provider():
+    provider = GeminiProvider(api_key="test-key")
+    provider._tools = {"slow_lookup": slow_lookup, "add": add}
+    return provider
+
+
+@pytest.mark.asyncio
+async def test_function_calls_run_concurrently_over_multiple_rounds(provider):
+    """Calls from one response run together and rounds continue until text."""
+    provider._model = FakeModel([
+        make_response(calls=[("slow_lookup", {"city": "Paris"}), ("slow_lookup", {"city": "Rome"})]),
+        make_response(calls=[("add", {"a": 1, "b": 2})]),
+        make_response(text="done"),
+    ])
+
+    start = time.perf_counter()
+    contents, text = await provider._process_function_calls([{"role": "user", "parts": ["hi"]}])
+    elapsed = time.perf_counter() - start
+
+    assert text == "done"
+    assert elapsed < 0.35
+    assert len(provider._model.requests) == 3
+    first_results = contents[2]["parts"]
+    assert [part.function_response.name for part in first_results] == ["slow_lookup", "slow_lookup"]
+    assert contents[4]["parts"][0].function_response.response["result"] == 3
+
+
+@pytest.mark.asyncio
+async def test_function_calling_stops_after_max_rounds(provider):
+    """A model that never stops calling tools is cut off."""
+    provider._model = FakeModel([make_response(calls=[("add", {"a": 1, "b": 1})])] * 3)
+
+    with pytest.raises(RuntimeError, match="2 rounds"):
+        await provider._process_function_calls([], max_rounds=2)
@@ -0,0 +1,49 @@
+import pytest
+
+
+@pytest.fixture
+def provider(make_gemini_provider):
+    return make_gemini_provider()
+
+
+@pytest.mark.asyncio
+async def test_history_buffer_only_converts_new_messages(provider):
+    """Earlier turns keep their converted Content objects across turns."""
+    await provider.send_message("first")
+    await provider.send_message("second")
+    converted = list(provider._gemini_history)
+
+    await provider.send_message("third")
+
+    assert len(provider._gemini_history) == 4
+    assert all(a is b for a, b in zip(provider._gemini_history, converted))
+    assert [c.parts[0].text for c in provider._chat.history] == [
+        "first", "echo: first", "second", "echo: second"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_set_history_invalidates_buffer(provider):
+    """Replacing the history rebuilds the transformed buffer."""
+    await provider.send_message("first")
+
+    provider.set_history([
+        {"role": "system", "content": "be brief"},
+        {"role": "user", "content": "restored"},
+    ])
+
+    assert [c.parts[0].text for c in provider._gemini_history] == ["restored"]
+    assert provider._gemini_history_synced == 2
+    assert provider._chat.history[0].role == "user"
+
+
+@pytest.mark.asyncio
+async def test_history_attribute_resets_buffer(provider):
+    """Assigning the legacy _history attribute behaves like set_history."""
+    await provider.send_message("first")
+
+    provider._history = [{"role": "user", "content": "replaced"}]
+
+    assert provider.get_history() == [{"role": "user", "content": "replaced"}]
+    assert [c.parts[0].text for c in provider._gemini_history] == ["replaced"]
+    assert [c.parts[0].text for c in provider._chat.history] == ["replaced"]
@@ -0,0 +1,98 @@
+import asyncio
+import pytest
+from grami.memory import LRUMemory
+
+
+@pytest.fixture
+def make_provider(make_gemini_provider):
+    """Providers whose chats yield to the loop while 'generating'."""
+    return lambda **kwargs: make_gemini_provider(delay=0.01, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_sessions_keep_separate_histories(make_provider, fake_chat):
+    """One provider serves many users without mixing their conversations."""
+    provider = make_provider()
+
+    async def converse(user):
+        for turn in range(3):
+            await provider.send_message(f"{user} {turn}", session_id=user)
+
+    await asyncio.gather(*(converse(f"user{i}") for i in range(5)))
+
+    assert fake_chat.peak == 5
+    for i in range(5):
+        assert [m["content"] for m in provider.get_history(f"user{i}")] == [
+            f"user{i} 0", f"echo: user{i} 0",
+            f"user{i} 1", f"echo: user{i} 1",
+            f"user{i} 2", f"echo: user{i} 2"
+        ]
+    assert provider.get_history() == []
+
+
+@pytest.mark.asyncio
+async def test_calls_for_one_session_are_serialized(make_provider, fake_chat):
+    provider = make_provider()
+
+    await asyncio.gather(*(provider.send_message(f"m{i}", session_id="same") for i in range(4)))
+
+    assert fake_chat.peak == 1
+    history = provider.get_history("same")
+    assert [m["role"] for m in history] == ["user", "model"] * 4
+
+
+@pytest.mark.asyncio
+async def test_evicted_sessions_are_restored_from_the_store(make_provider):
+    """Idle sessions beyond max_sessions move to the store and come back on use."""
+    store = LRUMemory()
+    provider = make_provider(max_sessions=2, session_store=store)
+
+    for user in ["a", "b", "c"]:
+        await provider.send_message(f"hello from {user}", session_id=user)
+
+    assert provider.active_sessions == 2
+    assert provider.get_history("a") == []
+
+    await provider.send_message("back again", session_id="a")
+
+    chat = provider._sessions["a"].chat
+    assert [c.parts[0].text for c in chat.history] == ["hello from a", "echo: hello from a"]
+    assert [m["content"] for m in provider.get_history("a")][-2:] == ["back again", "echo: back again"]
+    assert provider.active_sessions == 2
+
+
+@pytest.mark.asyncio
+async def test_sessions_in_use_are_not_evicted(make_provider):
+    """Sessions waiting for or running a request stay live until released."""
+    store = LRUMemory()
+    provider = make_provider(max_sessions=1, session_store=store)
+
+    # Both requests for "a" hold the session while "b" arrives
+    await asyncio.gather(
+        provider.send_message("first", session_id="a"),
+        provider.send_message("second", session_id="a"),
+        provider.send_message("hello", session_id="b"),
+    )
+    await asyncio.sleep(0)
+
+    # "a" was kept, with both turns, until its last request; "b" went to the store
+    assert [m["content"] for m in provider.get_history("a")] == [
+        "first", "echo: first", "second", "echo: second"
+    ]
+    assert [m["content"] for m in await store.retrieve("gemini_session:b")] == ["hello", "echo: hello"]
+    assert provider.active_sessions == 1
+    assert all(session.in_use == 0 for session in provider._sessions.values())
+
+
+@pytest.mark.asyncio
+async def test_restored_sessions_are_removed_from_the_store(make_provider):
+    store = LRUMemory()
+    provider = make_provider(max_sessions=1, session_store=store)
+
+    await provider.send_message("hello from a", session_id="a")
+    await provider.send_message("hello from b", session_id="b")
+    await asyncio.sleep(0)
+    assert await store.retrieve("gemini_session:a") is not None
+
+    await provider.send_message("back again", session_id="a")
+    assert await store.retrieve("gemini_session:a") is None
@@ -0,0 +1,78 @@
+import fakeredis
+import pytest
+from grami.agents import AsyncAgent
+from grami.memory import LRUMemory, RedisMemory, RedisStreamMemory, WriteBehindMemory
+
+
+class CountingMemory(LRUMemory):
+    """LRU memory that counts add_message calls."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.writes = 0
+
+    async def add_message(self, role, content, message_id=None):
+        self.writes += 1
+        await super().add_message(role, content, message_id=message_id)
+
+
+class EchoLLM:
+    async def send_message(self, message, **kwargs):
+        return f"echo: {message['content']}"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("memory_owner", ["llm", "agent"])
+async def test_each_turn_is_persisted_once(memory_owner, make_gemini_provider):
+    """Only one of agent and provider writes a turn to memory."""
+    memory = CountingMemory()
+    agent = AsyncAgent(
+        name="owner",
+        llm=make_gemini_provider(),
+        memory=memory,
+        config={"memory_owner": memory_owner}
+    )
+
+    await agent.send_message("hello")
+    await agent.send_message("again")
+
+    assert memory.writes == 4
+    assert [m["content"] for m in await memory.get_messages()] == [
+        "hello", "echo: hello", "again", "echo: again"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_agent_persists_when_provider_takes_no_memory():
+    memory = CountingMemory()
+    agent = AsyncAgent(name="owner", llm=EchoLLM(), memory=memory)
+
+    await agent.send_message("hello")
+
+    assert memory.writes == 2
+
+
+@pytest.mark.asyncio
+async def test_message_ids_are_idempotent():
+    """Replaying a message ID does not duplicate history in any backend."""
+    redis_client = fakeredis.FakeAsyncRedis()
+    redis_memory = RedisMemory(provider_id="ids")
+    redis_memory._redis_client = redis_client
+    stream_memory = RedisStreamMemory(provider_id="ids")
+    stream_memory._redis_client = redis_client
+    memories = [
+        LRUMemory(),
+        redis_memory,
+        stream_memory,
+        WriteBehindMemory(LRUMemory(), mode="fire_and_forget")
+    ]
+
+    for memory in memories:
+        await memory.add_message(role="user", content="hi", message_id="turn-1:user")
+        await memory.add_message(role="user", content="hi", message_id="turn-1:user")
+        await memory.add_message(role="assistant", content="hello", message_id="turn-1:assistant")
+        # Messages without an ID are never merged, even when identical
+        await memory.add_message(role="user", content="hi")
+        await memory.add_message(role="user", content="hi")
+
+        assert [m["content"] for m in await memory.get_messages()] == ["hi", "hello", "hi", "hi"]
@@ -0,0 +1,92 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from grami.providers.openai_provider import OpenAIProvider
+
+
+class MockOpenAIHandler(BaseHTTPRequestHandler):
+    """Minimal chat completions endpoint with keep-alive and SSE streaming."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        self.server.connections.add(self.client_address)
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        prompt = body["messages"][-1]["content"]
+        base = {"id": "chatcmpl-1", "created": 0, "model": body["model"]}
+
+        if body.get("stream"):
+            events = []
+            for token in ["echo", ": ", prompt]:
+                chunk = {**base, "object": "chat.completion.chunk", "choices": [
+                    {"index": 0, "delta": {"content": token}, "finish_reason": None}
+                ]}
+                events.append(f"data: {json.dumps(chunk)}\n\n")
+            events.append("data: [DONE]\n\n")
+            payload = "".join(events).encode()
+            content_type = "text/event-stream"
+        else:
+            payload = json.dumps({**base, "object": "chat.completion", "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": f"echo: {prompt}"},
+                "finish_reason": "stop"
+            }]}).encode()
+            content_type = "application/json"
+
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+@pytest.fixture
+def mock_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockOpenAIHandler)
+    server.connections = set()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.asyncio
+async def test_providers_share_one_pooled_client(mock_server):
+    """Providers reuse one client and keep-alive connections."""
+    base_url = f"http://127.0.0.1:{mock_server.server_port}/v1"
+    first = OpenAIProvider(api_key="test-key", base_url=base_url, max_connections=2)
+    second = OpenAIProvider(api_key="test-key", base_url=base_url, max_connections=2)
+
+    try:
+        assert first.client is second.client
+        for _ in range(3):
+            assert await first.send_message("hello") == "echo: hello"
+            assert await second.send_message({"role": "user", "content": "hi"}) == "echo: hi"
+        assert len(mock_server.connections) == 1
+    finally:
+        await OpenAIProvider.close_shared_clients()
+
+
+@pytest.mark.asyncio
+async def test_stream_message_is_async_generator(mock_server):
+    """Streaming yields tokens asynchronously and records the full reply."""
+    provider = OpenAIProvider(
+        api_key="test-key",
+        base_url=f"http://127.0.0.1:{mock_server.server_port}/v1"
+    )
+
+    try:
+        chunks = [chunk async for chunk in provider.stream_message("stream me")]
+        results = await asyncio.gather(*(provider.send_message(f"q{i}") for i in range(5)))
+    finally:
+        await OpenAIProvider.close_shared_clients()
+
+    assert chunks == ["echo", ": ", "stream me"]
+    assert provider._conversation_history[1] == {"role": "assistant", "content": "echo: stream me"}
+    assert results == [f"echo: q{i}" for i in range(5)]
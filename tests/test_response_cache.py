@@ -0,0 +1,101 @@
+import asyncio
+import fakeredis
+import pytest
+from grami.core.base import BaseLLMProvider
+from grami.providers import CachingProvider, MemoryResponseCache, RedisResponseCache
+
+
+class CountingLLM(BaseLLMProvider):
+    """Provider that counts upstream calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.model = "test-model"
+        self._system_prompt = None
+        self.calls = 0
+
+    async def initialize_conversation(self, context=None):
+        pass
+
+    async def validate_configuration(self, config):
+        return True
+
+    async def send_message(self, message, context=None, **kwargs):
+        self.calls += 1
+        return f"answer to {message['content']}"
+
+    async def stream_message(self, message, context=None, **kwargs):
+        self.calls += 1
+        for token in ["answer ", "to ", message["content"]]:
+            yield token
+
+
+def redis_cache():
+    cache = RedisResponseCache(prefix="test_cache:")
+    cache._redis_client = fakeredis.FakeAsyncRedis()
+    return cache
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("make_cache", [MemoryResponseCache, redis_cache])
+async def test_repeated_prompts_are_served_from_the_cache(make_cache):
+    llm = CountingLLM()
+    provider = CachingProvider(llm, cache=make_cache())
+
+    first = await provider.send_message({"role": "user", "content": "2 + 2"})
+    second = await provider.send_message({"role": "user", "content": "2 + 2 "})
+
+    assert first == second == "answer to 2 + 2"
+    assert llm.calls == 1
+    assert (provider.hits, provider.misses) == (1, 1)
+
+    # A different system prompt is a different request
+    provider._system_prompt = "Answer in French"
+    await provider.send_message({"role": "user", "content": "2 + 2"})
+    assert llm.calls == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("make_cache", [MemoryResponseCache, redis_cache])
+async def test_cached_streams_replay_as_chunks(make_cache):
+    llm = CountingLLM()
+    provider = CachingProvider(llm, cache=make_cache())
+    message = {"role": "user", "content": "hi"}
+
+    streamed = [chunk async for chunk in provider.stream_message(message)]
+    replayed = [chunk async for chunk in provider.stream_message(message)]
+
+    assert streamed == replayed == ["answer ", "to ", "hi"]
+    assert llm.calls == 1
+
+    # Responses cached from send_message are split back into chunks
+    other = {"role": "user", "content": "hello there"}
+    await provider.send_message(other)
+    assert [chunk async for chunk in provider.stream_message(other)] == ["answer", " to", " hello", " there"]
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_after_ttl():
+    llm = CountingLLM()
+    provider = CachingProvider(llm, ttl=0.05)
+
+    await provider.send_message({"role": "user", "content": "hi"})
+    await provider.send_message({"role": "user", "content": "hi"})
+    assert llm.calls == 1
+
+    await asyncio.sleep(0.1)
+    await provider.send_message({"role": "user", "content": "hi"})
+    assert llm.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_unavailable_cache_falls_back_to_the_provider():
+    class BrokenCache(MemoryResponseCache):
+        async def get(self, key):
+            raise ConnectionError("cache down")
+
+    llm = CountingLLM()
+    provider = CachingProvider(llm, cache=BrokenCache())
+
+    assert await provider.send_message({"role": "user", "content": "hi"}) == "answer to hi"
+    assert llm.calls == 1
@@ -0,0 +1,96 @@
+import asyncio
+import pytest
+from grami.providers.gemini_provider import GeminiProvider
+from grami.providers.retry import HedgePolicy, RetryPolicy, hedged_call
+
+
+class TransientError(Exception):
+    code = 503
+
+
+@pytest.mark.asyncio
+async def test_transient_errors_are_retried_with_backoff():
+    calls = []
+
+    async def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise TransientError("service unavailable")
+        return "ok"
+
+    policy = RetryPolicy(max_attempts=3, initial_delay=0.001)
+    assert await policy.run(flaky) == "ok"
+    assert len(calls) == 3
+
+    async def broken():
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        await policy.run(broken)
+
+
+def test_backoff_is_capped_and_jittered():
+    policy = RetryPolicy(initial_delay=1, max_delay=5, multiplier=2, jitter=False)
+    assert [policy.backoff(n) for n in range(5)] == [1, 2, 4, 5, 5]
+    jittered = RetryPolicy(initial_delay=1, max_delay=5)
+    assert all(0 <= jittered.backoff(3) <= 5 for _ in range(20))
+
+
+def test_hedge_delay_follows_the_latency_percentile():
+    hedge = HedgePolicy(percentile=90, initial_delay=1.0, min_samples=10)
+    assert hedge.delay() == 1.0
+    for latency in range(1, 11):
+        hedge.record(latency / 100)
+    assert hedge.delay() == pytest.approx(0.10)
+
+
+@pytest.mark.asyncio
+async def test_hedged_attempt_wins_and_the_slow_one_is_cancelled():
+    cancelled = []
+
+    async def slow():
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+        return "slow"
+
+    async def fast():
+        await asyncio.sleep(0.01)
+        return "fast"
+
+    hedge = HedgePolicy(initial_delay=0.02)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    assert await hedged_call([slow, fast], hedge=hedge) == "fast"
+    assert loop.time() - started < 0.5
+    assert cancelled == [True]
+    assert hedge.hedges == 1
+    # The loser's elapsed time is kept as a censored sample next to the winner's latency
+    assert hedge.censored == 1
+    assert len(hedge._latencies) == 2
+    assert max(hedge._latencies) >= 0.02
+
+
+@pytest.mark.asyncio
+async def test_gemini_falls_back_on_recitation_errors(fake_response):
+    class RecitingChat:
+        history = []
+
+        async def send_message_async(self, content, stream=False):
+            raise Exception("finish_reason: RECITATION")
+
+    provider = GeminiProvider(api_key="test-key")
+    provider._model.start_chat = lambda history=None: RecitingChat()
+    prompts = []
+
+    async def generate_content_async(contents, stream=False):
+        prompts.append(contents[-1].parts[0].text)
+        return fake_response("a natural response")
+
+    provider._model.generate_content_async = generate_content_async
+
+    assert await provider.send_message("quote the poem") == "a natural response"
+    assert prompts == ["Please provide a natural response to: quote the poem"]
+    assert [m["role"] for m in provider.get_history()] == ["user", "model"]
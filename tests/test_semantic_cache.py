@@ -0,0 +1,143 @@
+import time
+import pytest
+from grami.agents import AsyncAgent, HashingEmbedder, SemanticCache
+from grami.memory import LRUMemory
+
+
+class CountingLLM:
+    def __init__(self):
+        self.calls = 0
+
+    async def send_message(self, message, **kwargs):
+        self.calls += 1
+        return f"answer {self.calls}"
+
+
+def test_similar_prompts_hit_and_different_prompts_miss():
+    cache = SemanticCache(threshold=0.8)
+    cache.store("What is the capital of France?", "Paris")
+
+    assert cache.lookup("what is the capital of france") == "Paris"
+    assert cache.lookup("What is the capital of Germany?") is None
+    assert cache.lookup("What is the capital of France?", namespace="other") is None
+
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses']) == (1, 2)
+    assert stats['entries'] == {'default': 1}
+    assert stats['avg_lookup_time'] > 0
+
+
+@pytest.mark.parametrize("cached, asked", [
+    ("Is it safe to take ibuprofen with alcohol?", "Is it safe to take ibuprofen without alcohol?"),
+    ("Convert 100 USD to EUR", "Convert 100 EUR to USD"),
+    ("delete user 42", "delete user 43"),
+])
+def test_near_duplicates_with_different_meanings_miss_by_default(cached, asked):
+    cache = SemanticCache()
+    cache.store(cached, "answer")
+    assert cache.lookup(asked) is None
+    # Trivial variations still hit
+    assert cache.lookup(cached.upper() + "  ") == "answer"
+
+
+def test_embeddings_are_unit_length_and_stable():
+    embedder = HashingEmbedder(dimensions=256)
+    vector = embedder("Hello, world")
+    assert vector.shape == (256,)
+    assert abs(float(vector @ vector) - 1.0) < 1e-5
+    assert (embedder("hello world") == vector).all()
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = SemanticCache(threshold=0.95, capacity=2)
+    cache.store("first prompt about cats", "cats")
+    cache.store("second prompt about dogs", "dogs")
+    assert cache.lookup("first prompt about cats") == "cats"
+
+    cache.store("third prompt about birds", "birds")
+
+    assert cache.lookup("second prompt about dogs") is None
+    assert cache.lookup("first prompt about cats") == "cats"
+    assert cache.lookup("third prompt about birds") == "birds"
+
+
+def test_entries_expire_after_ttl():
+    cache = SemanticCache(ttl=0.05)
+    cache.store("hello", "hi")
+    assert cache.lookup("hello") == "hi"
+    time.sleep(0.1)
+    assert cache.lookup("hello") is None
+    assert cache.stats()['entries'] == {'default': 0}
+
+
+@pytest.mark.asyncio
+async def test_agent_answers_similar_prompts_from_the_cache():
+    llm = CountingLLM()
+    memory = LRUMemory()
+    cache = SemanticCache(threshold=0.8)
+    agent = AsyncAgent(name="math", llm=llm, memory=memory, config={"semantic_cache": cache})
+    other = AsyncAgent(name="poet", llm=llm, config={"semantic_cache": cache})
+
+    assert await agent.send_message("What is 2 + 2?") == "answer 1"
+    assert await agent.send_message("what is 2+2") == "answer 1"
+    # Namespaces keep agents apart
+    assert await other.send_message("What is 2 + 2?") == "answer 2"
+
+    assert llm.calls == 2
+    # Cached turns are still recorded in memory
+    assert [m["content"] for m in await memory.get_messages()] == [
+        "What is 2 + 2?", "answer 1", "what is 2+2", "answer 1"
+    ]
+
+
+def test_namespaces_grow_lazily_and_are_capped():
+    cache = SemanticCache(threshold=0.95, capacity=1000, max_namespaces=2)
+    cache.store("hello", "hi", namespace="a")
+    assert cache._namespaces["a"].vectors.shape[0] < 1000
+
+    for i in range(40):
+        cache.store(f"prompt number {i} about topic {i * 7}", str(i), namespace="a")
+    assert len(cache._namespaces["a"]) == 41
+
+    cache.store("hello", "hi", namespace="b")
+    cache.lookup("hello", namespace="a")
+    cache.store("hello", "hi", namespace="c")
+    # The least recently used namespace is dropped
+    assert list(cache.stats()['entries']) == ["a", "c"]
+
+
+class StatefulLLM(CountingLLM):
+    def __init__(self):
+        super().__init__()
+        self._conversation_history = []
+
+    async def send_message(self, message, **kwargs):
+        self._conversation_history.append(message)
+        return await super().send_message(message, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_stateful_llms_bypass_the_cache():
+    """A cached turn would never reach the LLM's history, so stateful LLMs always get the call."""
+    llm = StatefulLLM()
+    cache = SemanticCache(threshold=0.8)
+    agent = AsyncAgent(name="chat", llm=llm, config={"semantic_cache": cache})
+
+    assert await agent.send_message("What next?") == "answer 1"
+    llm._conversation_history = []
+    assert await agent.send_message("What next?") == "answer 2"
+
+    assert llm._conversation_history == [{"role": "user", "content": "What next?"}]
+    assert cache.stats()['entries'] == {}
+    assert cache.hits + cache.misses == 0
+
+
+@pytest.mark.asyncio
+async def test_contexts_do_not_share_answers():
+    llm = CountingLLM()
+    cache = SemanticCache()
+    agent = AsyncAgent(name="math", llm=llm, config={"semantic_cache": cache})
+
+    assert await agent.send_message("Hi", context={"user": "a"}) == "answer 1"
+    assert await agent.send_message("Hi", context={"user": "b"}) == "answer 2"
+    assert await agent.send_message("Hi", context={"user": "a"}) == "answer 1"
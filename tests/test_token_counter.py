@@ -0,0 +1,52 @@
+import pytest
+from grami.providers.gemini_provider import GeminiProvider
+from grami.providers.token_counter import CachedTokenCounter, HeuristicTokenCounter
+
+
+def test_heuristic_counter_calibration():
+    """Calibration scales estimates to match provider counts."""
+    counter = HeuristicTokenCounter()
+    text = "Hello, world! How are you today?"
+    raw = counter.count(text)
+
+    scale = counter.calibrate([(text, raw * 2)])
+
+    assert scale == pytest.approx(2.0)
+    assert counter.count(text) == raw * 2
+    assert counter.count("") == 0
+
+
+def test_cached_counter_reuses_counts():
+    """Repeated content is served from the cache."""
+    counter = CachedTokenCounter(max_entries=2)
+
+    first = counter.count("same message")
+    second = counter.count("same message")
+    counter.count("another")
+    counter.count("third")
+
+    assert first == second
+    assert counter.hits == 1
+    assert counter.misses == 3
+    assert len(counter._cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_prioritize_messages_makes_no_network_calls():
+    """History trimming uses the local counter instead of count_tokens."""
+    provider = GeminiProvider(api_key="test-key")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("count_tokens must not be called")
+
+    provider._model.count_tokens = fail
+    history = [
+        {"role": "user" if i % 2 == 0 else "model", "content": f"message number {i}"}
+        for i in range(100)
+    ]
+
+    prioritized = provider._prioritize_messages(history, max_tokens=200, base_recent=10)
+
+    assert prioritized[-10:] == history[-10:]
+    assert prioritized == history[-len(prioritized):]
+    assert 10 < len(prioritized) < 100
@@ -0,0 +1,63 @@
+import pytest
+from grami.communication.event_bus import EventBus
+from grami.communication.topics import TopicTrie
+
+
+def test_wildcards_match_one_or_many_segments():
+    trie = TopicTrie()
+    trie.add('agent.*.response', 'any-agent')
+    trie.add('agent.#', 'everything')
+    trie.add('agent.planner.response', 'planner')
+    trie.add('#.error', 'errors')
+
+    assert trie.match('agent.planner.response') == ['planner', 'any-agent', 'everything']
+    assert trie.match('agent.coder.response') == ['any-agent', 'everything']
+    assert trie.match('agent') == ['everything']
+    assert trie.match('agent.coder.session.error') == ['everything', 'errors']
+    assert trie.match('error') == ['errors']
+    assert trie.match('user.message') == []
+
+
+def test_remove_prunes_branches_and_invalidates_cache():
+    trie = TopicTrie()
+    trie.add('agent.*.response', 'handler')
+    assert trie.match('agent.a.response') == ['handler']
+
+    assert trie.remove('agent.*.response', 'handler')
+    assert not trie.remove('agent.*.response', 'handler')
+    assert trie.match('agent.a.response') == []
+    assert len(trie) == 0
+    assert trie._root.children == {}
+
+
+def test_values_are_returned_once():
+    trie = TopicTrie()
+    trie.add('a.#', 'handler')
+    trie.add('a.*', 'handler')
+    assert trie.match('a.b') == ['handler']
+
+
+@pytest.mark.asyncio
+async def test_event_bus_routes_hierarchical_topics():
+    bus = EventBus()
+    received = []
+
+    async def on_any_response(data):
+        received.append(('any', data))
+
+    async def on_session(data):
+        received.append(('session', data))
+
+    bus.subscribe('agent.*.response', on_any_response)
+    bus.subscribe('session.42.#', on_session)
+
+    await bus.publish('agent.planner.response', 'plan')
+    await bus.publish('session.42.agent.coder.response', 'code')
+    await bus.publish('session.7.agent', 'ignored')
+
+    assert received == [('any', 'plan'), ('session', 'code')]
+    assert list(bus.subscribers) == ['agent.*.response', 'session.42.#']
+
+    bus.unsubscribe('agent.*.response', on_any_response)
+    await bus.publish('agent.planner.response', 'again')
+    assert len(received) == 2
@@ -0,0 +1,156 @@
+import asyncio
+import fakeredis
+import pytest
+from grami.communication.event_bus import EventBus
+from grami.communication.transports import LocalTransport, RedisPubSubTransport, RedisStreamsTransport
+
+
+class EchoAgent:
+    def __init__(self):
+        self.calls = 0
+
+    async def send_message(self, message):
+        self.calls += 1
+        return f"echo: {message}"
+
+
+def make_transport(kind, server):
+    options = {'block': 50} if kind is RedisStreamsTransport else {'poll_interval': 0.05}
+    transport = kind(close_timeout=1.0, **options)
+    transport._redis_client = fakeredis.FakeAsyncRedis(server=server)
+    return transport
+
+
+@pytest.fixture
+async def buses():
+    """Create event buses that are stopped, with their transports, after the test."""
+    created = []
+
+    def make(**kwargs):
+        bus = EventBus(**kwargs)
+        created.append(bus)
+        return bus
+
+    yield make
+    for bus in created:
+        await bus.stop()
+
+
+async def wait_for(condition, timeout=2.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition() and loop.time() < deadline:
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("kind", [RedisPubSubTransport, RedisStreamsTransport])
+async def test_events_reach_other_processes_once(kind, buses):
+    server = fakeredis.FakeServer()
+    agent = EchoAgent()
+    first = buses(agent=agent, transport=make_transport(kind, server))
+    second = buses(agent=EchoAgent(), transport=make_transport(kind, server))
+    received = {"first": [], "second": []}
+
+    for name, bus in [("first", first), ("second", second)]:
+        async def handler(data, name=name):
+            received[name].append(data)
+        bus.subscribe('agent_response', handler)
+        await bus.connect()
+
+    await first.publish('user_message', 'hi')
+    await wait_for(lambda: received["second"])
+    await asyncio.sleep(0.05)
+
+    # The local agent answered; the response reached both processes exactly once
+    assert agent.calls == 1
+    assert second.agent.calls == 0
+    assert received == {"first": ['echo: hi'], "second": ['echo: hi']}
+    assert first.transport.skipped >= 1
+
+
+@pytest.mark.asyncio
+async def test_publishes_are_batched(buses):
+    server = fakeredis.FakeServer()
+    transport = make_transport(RedisPubSubTransport, server)
+    bus = buses(transport=transport)
+    remote = buses(transport=make_transport(RedisPubSubTransport, server))
+    received = []
+
+    async def handler(data):
+        received.append(data)
+
+    remote.subscribe('metrics.#', handler)
+    await remote.connect()
+
+    for i in range(20):
+        await bus.publish(f'metrics.node{i % 3}', i, wait=False)
+    await wait_for(lambda: len(received) == 20)
+
+    assert sorted(received) == list(range(20))
+    assert transport.sent == 20
+    assert transport.batches == 1
+
+
+@pytest.mark.asyncio
+async def test_local_transport_keeps_events_in_process(buses):
+    bus = buses(transport=LocalTransport())
+    received = []
+
+    async def handler(data):
+        received.append(data)
+
+    bus.subscribe('event', handler)
+    await bus.publish('event', 'local')
+    assert received == ['local']
+
+
+@pytest.mark.asyncio
+async def test_unencodable_event_is_still_delivered_locally(buses):
+    transport = make_transport(RedisPubSubTransport, fakeredis.FakeServer())
+    bus = buses(transport=transport)
+    payload = object()
+    received = []
+
+    async def handler(data):
+        received.append(data)
+
+    bus.subscribe('event', handler)
+    await bus.publish('event', payload)
+
+    assert received == [payload]
+    assert transport.sent == 0
+
+
+class SlowAgent(EchoAgent):
+    async def send_message(self, message):
+        await asyncio.sleep(0.02)
+        return await super().send_message(message)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("kind", [RedisPubSubTransport, RedisStreamsTransport])
+async def test_stop_leaves_no_listener_running(kind, buses):
+    server = fakeredis.FakeServer()
+    bus = buses(agent=SlowAgent(), transport=make_transport(kind, server))
+    remote = buses(transport=make_transport(kind, server))
+    received = []
+
+    async def handler(data):
+        received.append(data)
+
+    remote.subscribe('agent_response', handler)
+    await remote.connect()
+    await bus.connect()
+    listener = bus.transport._listener
+
+    # The agent answers while the bus is stopping
+    await bus.publish('user_message', 'hi', wait=False)
+    await bus.stop()
+
+    assert listener.done()
+    assert bus.transport._listener is None
+    assert not bus.transport.started
+    # The drained response still reached the other process
+    await wait_for(lambda: received)
+    assert received == ['echo: hi']
@@ -0,0 +1,90 @@
+import asyncio
+import json
+import pytest
+from fastapi import WebSocketDisconnect
+from starlette.websockets import WebSocketState
+from grami.communication.websocket import WebSocketAgentCommunication
+
+
+class EchoAgent:
+    async def send_message(self, message):
+        await asyncio.sleep(0.01)
+        if message == "fail":
+            raise RuntimeError("agent failed")
+        return f"echo: {message}"
+
+
+class FakeWebSocket:
+    """In-memory stand-in for a FastAPI WebSocket."""
+
+    def __init__(self):
+        self.client_state = WebSocketState.CONNECTED
+        self.incoming = asyncio.Queue()
+        self.sent = []
+
+    async def accept(self):
+        pass
+
+    async def receive_text(self):
+        message = await self.incoming.get()
+        if message is None:
+            raise WebSocketDisconnect()
+        return message
+
+    async def send_text(self, message):
+        self.sent.append(json.loads(message))
+
+    def send(self, **message):
+        self.incoming.put_nowait(json.dumps(message))
+
+
+async def connect(server, count):
+    sockets = [FakeWebSocket() for _ in range(count)]
+    tasks = [asyncio.ensure_future(server.handle_client(ws)) for ws in sockets]
+    await asyncio.sleep(0)
+    return sockets, tasks
+
+
+async def disconnect(sockets, tasks):
+    for ws in sockets:
+        ws.incoming.put_nowait(None)
+    await asyncio.gather(*tasks)
+
+
+@pytest.mark.asyncio
+async def test_responses_go_only_to_the_requesting_connection():
+    server = WebSocketAgentCommunication(agent=EchoAgent())
+    sockets, tasks = await connect(server, 5)
+
+    sockets[0].send(content="hello", id="req-1")
+    sockets[1].send(content="other")
+    sockets[0].send(content="fail", id="req-2")
+    await asyncio.sleep(0.05)
+    await server.event_bus.drain()
+
+    assert sockets[0].sent == [
+        {"type": "agent_response", "id": "req-1", "status": "success", "content": "echo: hello"},
+        {"type": "agent_response", "id": "req-2", "status": "error", "content": None, "message": "agent failed"}
+    ]
+    assert [m["content"] for m in sockets[1].sent] == ["echo: other"]
+    assert sockets[1].sent[0]["id"]
+    assert all(ws.sent == [] for ws in sockets[2:])
+
+    await disconnect(sockets, tasks)
+    assert server.connections == {}
+
+
+@pytest.mark.asyncio
+async def test_broadcast_is_opt_in():
+    server = WebSocketAgentCommunication(agent=EchoAgent())
+    sockets, tasks = await connect(server, 3)
+
+    sockets[0].send(content="announcement", id="b-1", broadcast=True)
+    await asyncio.sleep(0.05)
+    await server.event_bus.drain()
+
+    # The requester gets one reply; every other client gets the broadcast
+    for ws in sockets:
+        assert [m["content"] for m in ws.sent] == ["echo: announcement"]
+
+    await disconnect(sockets, tasks)